@@ -0,0 +1,105 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the compression codecs on representative SQL Lab and chart data payloads.
+
+    python scripts/benchmark_compression.py --rows 100000 --columns 10
+
+For each codec reports the compression ratio and the encode and decode times of an
+Arrow IPC stream (SQL Lab results backend) and of a pickled DataFrame (chart data
+cache).
+"""
+
+import pickle
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from superset.utils.compression import CODECS, compress, decompress
+
+
+def make_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    data: dict[str, Any] = {}
+    for i in range(columns):
+        kind = i % 4
+        if kind == 0:
+            values = rng.random(rows).round(2)
+            values[rng.random(rows) < 0.1] = np.nan
+            data[f"float_{i}"] = values
+        elif kind == 1:
+            data[f"int_{i}"] = rng.integers(0, 1_000, rows)
+        elif kind == 2:
+            data[f"str_{i}"] = rng.choice(["north", "south", "east", "west"], rows)
+        else:
+            data[f"ts_{i}"] = pd.date_range("2020-01-01", periods=rows, freq="min")
+    return pd.DataFrame(data)
+
+
+def to_ipc_stream(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows of the result set.")
+@click.option("--columns", default=10, help="Number of columns of the result set.")
+@click.option("--repeat", default=3, help="Number of runs; the best is reported.")
+def main(rows: int, columns: int, repeat: int) -> None:
+    df = make_dataframe(rows, columns)
+    payloads = {
+        "arrow": to_ipc_stream(df),
+        "pickle": pickle.dumps(df),
+    }
+
+    for label, payload in payloads.items():
+        print(f"{label} payload ({rows} rows x {columns} columns): {len(payload)} B")
+        for name, codec in CODECS.items():
+            if not codec.is_available():
+                print(f"  {name:>5}: not installed")
+                continue
+
+            blob = compress(payload, name)
+            assert decompress(blob) == payload
+
+            encode = measure(lambda: compress(payload, name), repeat)  # noqa: B023
+            decode = measure(lambda: decompress(blob), repeat)  # noqa: B023
+            print(
+                f"  {name:>5}: ratio {len(payload) / len(blob):5.2f}, "
+                f"encode {encode * 1000:8.1f} ms, decode {decode * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark ``df_to_records`` against the previous row-wise implementation.
+
+    python scripts/benchmark_df_to_records.py --rows 100000 --columns 10
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.dataframe import _convert_big_integers, df_to_records
+
+
+def df_to_records_rowwise(dframe: pd.DataFrame) -> list[dict[str, Any]]:
+    records = dframe.to_dict(orient="records")
+    for record in records:
+        for key in record:
+            record[key] = (
+                None if pd.isna(record[key]) else _convert_big_integers(record[key])
+            )
+    return records
+
+
+def make_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    data: dict[str, Any] = {}
+    for i in range(columns):
+        kind = i % 4
+        if kind == 0:
+            values = rng.random(rows)
+            values[rng.random(rows) < 0.1] = np.nan
+            data[f"float_{i}"] = values
+        elif kind == 1:
+            data[f"int_{i}"] = rng.integers(0, 1_000_000, rows)
+        elif kind == 2:
+            data[f"str_{i}"] = rng.choice(["a", "b", "c", None], rows)
+        else:
+            data[f"ts_{i}"] = pd.date_range("2020-01-01", periods=rows, freq="min")
+    return pd.DataFrame(data)
+
+
+def measure(
+    func: Callable[[pd.DataFrame], Any], df: pd.DataFrame, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows of the tall frame.")
+@click.option("--columns", default=10, help="Number of columns of the tall frame.")
+@click.option("--repeat", default=3, help="Number of runs; the best is reported.")
+def main(rows: int, columns: int, repeat: int) -> None:
+    shapes = {
+        "tall": (rows, columns),
+        "wide": (max(rows // 20, 1), columns * 20),
+    }
+    for label, (num_rows, num_columns) in shapes.items():
+        df = make_dataframe(num_rows, num_columns)
+        assert df_to_records(df) == df_to_records_rowwise(df)
+
+        rowwise = measure(df_to_records_rowwise, df, repeat)
+        columnar = measure(df_to_records, df, repeat)
+        print(
+            f"{label} ({num_rows} rows x {num_columns} columns): "
+            f"row-wise {rowwise:.3f} s, column-wise {columnar:.3f} s, "
+            f"speedup {rowwise / columnar:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
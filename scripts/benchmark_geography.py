@@ -0,0 +1,155 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the geohash and geodetic post-processing operators on large point sets.
+
+    python scripts/benchmark_geography.py --points 500000
+
+Reports the time taken by ``geohash_encode``, ``geohash_decode`` and
+``geodetic_parse``, and by the per-row implementations they replaced, checking
+that both give the same results.
+"""
+
+import time
+import warnings
+from typing import Any, Callable
+
+import click
+import geohash
+import numpy as np
+import pandas as pd
+from geopy.point import Point
+
+
+def make_data(points: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "latitude": rng.uniform(-90, 90, points),
+            "longitude": rng.uniform(-180, 180, points),
+        }
+    )
+    df["geohash"] = [
+        geohash.encode(latitude, longitude)
+        for latitude, longitude in zip(df["latitude"], df["longitude"], strict=True)
+    ]
+    df["geodetic"] = (
+        df["latitude"].round(6).astype(str)
+        + ", "
+        + df["longitude"].round(6).astype(str)
+        + ", 12m"
+    )
+    return df
+
+
+def per_row_geohash_encode(df: pd.DataFrame) -> pd.Series:
+    return df[["latitude", "longitude"]].apply(
+        lambda row: geohash.encode(row["latitude"], row["longitude"]),
+        axis=1,
+    )
+
+
+def per_row_geohash_decode(df: pd.DataFrame) -> pd.DataFrame:
+    lonlat_df = pd.DataFrame()
+    lonlat_df["latitude"], lonlat_df["longitude"] = zip(
+        *df["geohash"].apply(geohash.decode), strict=False
+    )
+    return lonlat_df
+
+
+def per_row_geodetic_parse(df: pd.DataFrame) -> pd.DataFrame:
+    geodetic_df = pd.DataFrame()
+    (
+        geodetic_df["latitude"],
+        geodetic_df["longitude"],
+        geodetic_df["altitude"],
+    ) = zip(*df["geodetic"].apply(lambda point: tuple(Point(point))), strict=False)
+    return geodetic_df
+
+
+def measure(func: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+@click.command()
+@click.option("--points", default=500_000, help="Number of points.")
+@click.option("--repeat", default=3, help="Number of runs; the best is reported.")
+def main(points: int, repeat: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.pandas_postprocessing import (
+        geodetic_parse,
+        geohash_decode,
+        geohash_encode,
+    )
+
+    df = make_data(points)
+    lonlat = ["latitude", "longitude"]
+    scenarios = {
+        "geohash_encode": (
+            lambda: geohash_encode(
+                df[lonlat],
+                geohash="geohash",
+                latitude="latitude",
+                longitude="longitude",
+            )["geohash"],
+            lambda: per_row_geohash_encode(df),
+        ),
+        "geohash_decode": (
+            lambda: geohash_decode(
+                df[["geohash"]],
+                geohash="geohash",
+                latitude="latitude",
+                longitude="longitude",
+            )[lonlat],
+            lambda: per_row_geohash_decode(df),
+        ),
+        "geodetic_parse": (
+            lambda: geodetic_parse(
+                df[["geodetic"]],
+                geodetic="geodetic",
+                latitude="latitude",
+                longitude="longitude",
+                altitude="altitude",
+            )[[*lonlat, "altitude"]],
+            lambda: per_row_geodetic_parse(df),
+        ),
+    }
+    for name, (vectorized, per_row) in scenarios.items():
+        vectorized_time, result = measure(vectorized, repeat)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            per_row_time, expected = measure(per_row, 1)
+        same = np.array_equal(result.to_numpy(), expected.to_numpy())
+        print(
+            f"{name:>14}: {points} points, vectorized "
+            f"{vectorized_time * 1000:8.1f} ms, per row {per_row_time * 1000:8.1f} ms, "
+            f"{'same results' if same else 'DIFFERENT RESULTS'}"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
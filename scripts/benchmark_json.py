@@ -0,0 +1,154 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the JSON engines on representative chart data and dashboard payloads.
+
+    python scripts/benchmark_json.py --rows 50000 --charts 100
+
+For each engine reports the encode and decode times of a chart data response
+(records with timestamps, NumPy values and nulls) and of a dashboard payload (nested
+metadata and layout).
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils import json
+
+
+def make_chart_data(rows: int) -> dict[str, Any]:
+    rng = np.random.default_rng(42)
+    values = rng.random(rows).round(4)
+    values[rng.random(rows) < 0.05] = np.nan
+    df = pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "country": rng.choice(["FR", "US", "BR", "IN", "JP"], rows),
+            "count": rng.integers(0, 1_000_000, rows),
+            "ratio": values,
+        }
+    )
+    return {
+        "result": [
+            {
+                "cache_key": uuid.uuid4().hex,
+                "cached_dttm": datetime(2020, 1, 1).isoformat(),
+                "is_cached": False,
+                "query": "SELECT country, COUNT(*) FROM logs GROUP BY country",
+                "status": "success",
+                "rowcount": rows,
+                "colnames": list(df.columns),
+                "data": df.to_dict(orient="records"),
+            }
+        ]
+    }
+
+
+def make_dashboard(charts: int) -> dict[str, Any]:
+    position = {
+        f"CHART-{i}": {
+            "type": "CHART",
+            "id": f"CHART-{i}",
+            "children": [],
+            "parents": ["ROOT_ID", "GRID_ID", f"ROW-{i // 3}"],
+            "meta": {"chartId": i, "width": 4, "height": 50, "uuid": uuid.uuid4()},
+        }
+        for i in range(charts)
+    }
+    return {
+        "id": 1,
+        "dashboard_title": "Benchmark",
+        "changed_on": datetime(2020, 1, 1) + timedelta(days=1),
+        "position_json": position,
+        "metadata": {
+            "native_filter_configuration": [
+                {
+                    "id": f"NATIVE_FILTER-{i}",
+                    "filterType": "filter_select",
+                    "targets": [{"datasetId": i, "column": {"name": "country"}}],
+                    "defaultDataMask": {"filterState": {"value": None}},
+                }
+                for i in range(charts // 10)
+            ],
+            "color_scheme": "supersetColors",
+        },
+        "slices": [
+            {
+                "slice_id": i,
+                "slice_name": f"Chart {i}",
+                "form_data": {
+                    "viz_type": "echarts_timeseries",
+                    "metrics": ["count"],
+                    "groupby": ["country"],
+                    "row_limit": Decimal(10000),
+                },
+                "modified": datetime(2020, 1, 1),
+            }
+            for i in range(charts)
+        ],
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=50_000, help="Number of rows of the chart data.")
+@click.option("--charts", default=100, help="Number of charts in the dashboard.")
+@click.option("--repeat", default=3, help="Number of runs; the best is reported.")
+def main(rows: int, charts: int, repeat: int) -> None:
+    payloads = {
+        f"chart data ({rows} rows)": make_chart_data(rows),
+        f"dashboard ({charts} charts)": make_dashboard(charts),
+    }
+
+    for label, payload in payloads.items():
+        print(f"{label}:")
+        for engine in (json.SIMPLEJSON_ENGINE, json.ORJSON_ENGINE):
+            try:
+                json.set_engine(engine)
+            except ValueError:
+                print(f"  {engine:>10}: not installed")
+                continue
+
+            serialized = json.dumps(payload)
+            encode = measure(lambda: json.dumps(payload), repeat)  # noqa: B023
+            decode = measure(lambda: json.loads(serialized), repeat)  # noqa: B023
+            print(
+                f"  {engine:>10}: {len(serialized):>10} B, "
+                f"encode {encode * 1000:8.1f} ms, decode {decode * 1000:8.1f} ms"
+            )
+
+    json.set_engine(json.SIMPLEJSON_ENGINE)
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
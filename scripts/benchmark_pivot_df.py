@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the client processing of pivot tables with totals and subtotals.
+
+    python scripts/benchmark_pivot_df.py --cardinality 8 --aggfunc Average
+
+Reports the time taken by ``pivot_df`` on a deep pivot (many levels of rows) and on
+a wide pivot (many levels of columns), without totals and with row and column
+totals, so that the cost of the subtotals can be compared to the pivot itself.
+"""
+
+import time
+from functools import partial
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+SCENARIOS = {
+    # name: (levels of rows, levels of columns)
+    "deep": (4, 1),
+    "wide": (1, 3),
+}
+
+
+def make_data(rows: int, columns: int, cardinality: int, size: int) -> pd.DataFrame:
+    """
+    Build the aggregated result of a query grouped by all the rows and columns.
+    """
+    rng = np.random.default_rng(42)
+    groupby = [f"row_{i}" for i in range(rows)] + [f"col_{i}" for i in range(columns)]
+    df = pd.DataFrame(
+        {
+            name: rng.choice([f"{name}_{j}" for j in range(cardinality)], size)
+            for name in groupby
+        }
+    )
+    df["count"] = rng.integers(0, 1000, size)
+    df["revenue"] = rng.random(size) * 1000
+    return df.groupby(groupby).sum().reset_index()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--size", default=50_000, help="Number of rows before aggregating.")
+@click.option("--cardinality", default=6, help="Number of values per dimension.")
+@click.option("--aggfunc", default="Sum", help="Aggregation of the pivot table.")
+@click.option("--repeat", default=3, help="Number of runs; the best is reported.")
+def main(size: int, cardinality: int, aggfunc: str, repeat: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.charts.client_processing import pivot_df
+
+    for label, (rows, columns) in SCENARIOS.items():
+        df = make_data(rows, columns, cardinality, size)
+        kwargs = {
+            "rows": [f"row_{i}" for i in range(rows)],
+            "columns": [f"col_{i}" for i in range(columns)],
+            "metrics": ["count", "revenue"],
+            "aggfunc": aggfunc,
+        }
+        plain = partial(pivot_df, df, **kwargs)
+        totals = partial(
+            pivot_df, df, show_rows_total=True, show_columns_total=True, **kwargs
+        )
+        pivoted = totals()
+        print(
+            f"{label:>5}: {len(df):>6} rows -> {pivoted.shape[0]:>5} x "
+            f"{pivoted.shape[1]:>5}, pivot {measure(plain, repeat) * 1000:8.1f} ms, "
+            f"with totals {measure(totals, repeat) * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -15,19 +15,32 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import threading
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.security.decorators import permission_name, protect
 
+from superset import db
 from superset.async_events.async_query_manager import AsyncQueryTokenException
 from superset.extensions import async_query_manager, event_logger
+from superset.utils.concurrency import get_semaphore
 from superset.views.base_api import BaseSupersetApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
 
 
+def get_connections_semaphore() -> threading.BoundedSemaphore:
+    """
+    Return the semaphore limiting the connections waiting for events in a process.
+    """
+    return get_semaphore(
+        "async_events_connections",
+        current_app.config["GLOBAL_ASYNC_QUERIES_STREAM_MAX_CONNECTIONS"],
+    )
+
+
 class AsyncEventsRestApi(BaseSupersetApi):
     resource_name = "async_event"
     allow_browser_login = True
@@ -54,6 +67,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Seconds to wait for new events when there are none, capped by
+              GLOBAL_ASYNC_QUERIES_STREAM_HEARTBEAT
+            schema:
+                type: number
           responses:
             200:
               description: Async event results
@@ -93,9 +113,104 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = min(
+                request.args.get("timeout", 0, type=float),
+                current_app.config["GLOBAL_ASYNC_QUERIES_STREAM_HEARTBEAT"],
+            )
+
+            # without a free connection slot, fall back to a regular poll
+            semaphore = get_connections_semaphore()
+            if timeout > 0 and semaphore.acquire(blocking=False):
+                try:
+                    # don't hold a metadata database connection while waiting
+                    db.session.close()
+                    events = async_query_manager.read_events(
+                        async_channel_id,
+                        last_event_id,
+                        timeout,
+                    )
+                finally:
+                    semaphore.release()
+            else:
+                events = async_query_manager.read_events(
+                    async_channel_id,
+                    last_event_id,
+                )
 
         except AsyncQueryTokenException:
             return self.response_401()
 
         return self.response(200, result=events)
+
+    @expose("/stream", methods=("GET",))
+    @event_logger.log_this
+    @protect()
+    @safe
+    @statsd_metrics
+    @permission_name("list")
+    def stream(self) -> Response:
+        """
+        Stream the Redis async events as Server-Sent Events, using the user's JWT
+        token and the last event received.
+        ---
+        get:
+          summary: Stream the Redis events as Server-Sent Events
+          description: >-
+            Holds the connection open and sends the events of the user's channel as
+            they arrive, as Server-Sent Events whose data is an async event. The
+            stream ends after GLOBAL_ASYNC_QUERIES_STREAM_DURATION seconds and
+            clients reconnect with the Last-Event-ID header.
+          parameters:
+          - in: header
+            name: Last-Event-ID
+            description: Last ID received by the client
+            schema:
+                type: string
+          - in: query
+            name: last_id
+            description: Last ID received by the client, if the header is not set
+            schema:
+                type: string
+          responses:
+            200:
+              description: Stream of async events
+              content:
+                text/event-stream:
+                  schema:
+                    type: string
+            401:
+              $ref: '#/components/responses/401'
+            429:
+              description: Too many open connections
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            async_channel_id = async_query_manager.parse_channel_id_from_request(
+                request
+            )
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        semaphore = get_connections_semaphore()
+        if not semaphore.acquire(blocking=False):
+            return self.response(429, message="Too many open connections")
+
+        config = current_app.config
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+            "last_id"
+        )
+        events = async_query_manager.stream_events(
+            async_channel_id,
+            last_event_id,
+            heartbeat=config["GLOBAL_ASYNC_QUERIES_STREAM_HEARTBEAT"],
+            duration=config["GLOBAL_ASYNC_QUERIES_STREAM_DURATION"],
+        )
+        response = Response(
+            events,
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        # released when the stream ends or the client disconnects
+        response.call_on_close(semaphore.release)
+        return response
@@ -17,7 +17,10 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
 import uuid
+from collections.abc import Iterator
 from typing import Any, Literal, Optional
 
 import jwt
@@ -115,6 +118,7 @@ class AsyncQueryManager:
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
+        self._upload_file_job: Any = None
 
     def init_app(self, app: Flask) -> None:
         cache_type = app.config.get("CACHE_CONFIG", {}).get("CACHE_TYPE")
@@ -156,9 +160,11 @@ class AsyncQueryManager:
             load_chart_data_into_cache,
             load_explore_json_into_cache,
         )
+        from superset.tasks.upload import upload_file
 
         self._load_chart_data_into_cache_job = load_chart_data_into_cache
         self._load_explore_json_into_cache_job = load_explore_json_into_cache
+        self._upload_file_job = upload_file
 
     def register_request_handlers(self, app: Flask) -> None:
         @app.after_request
@@ -257,15 +263,59 @@ class AsyncQueryManager:
         )
         return job_metadata
 
+    # pylint: disable=too-many-arguments
+    def submit_upload_job(
+        self,
+        channel_id: str,
+        database_id: int,
+        file_path: str,
+        filename: str,
+        options: dict[str, Any],
+        user_id: Optional[int] = None,
+    ) -> dict[str, Any]:
+        job_metadata = self.init_job(channel_id, user_id)
+        self._upload_file_job.delay(
+            job_metadata,
+            database_id,
+            file_path,
+            filename,
+            options,
+        )
+        return job_metadata
+
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self,
+        channel: str,
+        last_id: Optional[str],
+        timeout: float = 0,
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel following a given event.
+
+        :param channel: The channel ID
+        :param last_id: The ID of the last event received, if any
+        :param timeout: Seconds to wait for new events if there are none; by default
+            return immediately
+        :returns: The events
+        """
         if not self._cache:
             raise CacheBackendNotInitialized("Cache backend not initialized")
 
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        if timeout > 0:
+            # XREAD returns the entries following `last_id`, blocking until there's
+            # at least one; BLOCK 0 blocks forever, so round up to a millisecond
+            streams = self._cache.xread(
+                {stream_name: last_id or "0-0"},
+                self.MAX_EVENT_COUNT,
+                max(1, math.ceil(timeout * 1000)),
+            )
+            results = streams[0][1] if streams else []
+        else:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._cache.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
@@ -283,6 +333,38 @@ class AsyncQueryManager:
             )
         return [] if not results else list(map(parse_event, results))
 
+    def stream_events(
+        self,
+        channel: str,
+        last_id: Optional[str],
+        heartbeat: float,
+        duration: float,
+    ) -> Iterator[str]:
+        """
+        Stream the events of a channel as Server-Sent Events.
+
+        The stream waits for new events on the channel, sending a comment every
+        ``heartbeat`` seconds without events so that proxies keep the connection
+        open, and ends after ``duration`` seconds; clients then reconnect with the
+        ``Last-Event-ID`` header set to the last event they received.
+
+        :param channel: The channel ID
+        :param last_id: The ID of the last event received, if any
+        :param heartbeat: Maximum number of seconds without sending anything
+        :param duration: Maximum duration of the stream in seconds
+        :returns: The Server-Sent Events messages
+        """
+        deadline = time.monotonic() + duration
+        while (remaining := deadline - time.monotonic()) > 0:
+            events = self.read_events(channel, last_id, min(heartbeat, remaining))
+            if not events:
+                yield ": heartbeat\n\n"
+                continue
+
+            for event in events:
+                last_id = event["id"]  # type: ignore
+                yield f"id: {last_id}\ndata: {json.dumps(event)}\n\n"
+
     def update_job(
         self, job_metadata: dict[str, Any], status: str, **kwargs: Any
     ) -> None:
@@ -26,7 +26,7 @@ In order to do that, we reproduce the post-processing in Python for these chart
 
 import logging
 from io import StringIO
-from typing import Any, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
@@ -62,6 +62,97 @@ def get_column_key(label: tuple[str, ...], metrics: list[str]) -> tuple[Any, ...
     return tuple(parts)
 
 
+def get_subgroups(
+    index: pd.MultiIndex,
+    level: int,
+) -> list[tuple[tuple[Any, ...], int, int]]:
+    """
+    Return the groups of labels sharing their first `level` values.
+
+    Pivoted labels are sorted, so each group is a contiguous range of positions;
+    the groups are returned in order, with their prefix and their start and stop
+    positions. The ranges are computed from the codes of the index, instead of
+    looking up each prefix.
+    """
+    if level == 0:
+        return [((), 0, len(index))]
+    if len(index) == 0:
+        return []
+
+    codes = np.column_stack(index.codes[:level])
+    changes = np.flatnonzero((codes[1:] != codes[:-1]).any(axis=1)) + 1
+    starts = [0, *changes.tolist()]
+    stops = [*starts[1:], len(index)]
+    return [
+        (index[start][:level], start, stop)
+        for start, stop in zip(starts, stops, strict=True)
+    ]
+
+
+def add_subtotals(
+    df: pd.DataFrame,
+    aggregate: Callable[[pd.DataFrame], pd.Series],
+    metric_name: str,
+    axis: int,
+) -> pd.DataFrame:
+    """
+    Add the subtotals of each group of columns (axis=1) or rows (axis=0).
+
+    Every subtotal aggregates the original labels of its group, and is placed after
+    them and after the subtotals of its subgroups; the overall total comes last.
+    All the subtotals are computed from the original dataframe, and then added to
+    it at once, instead of inserting them one by one, which copies the dataframe
+    for every subtotal.
+    """
+    labels = df.columns if axis == 1 else df.index
+    positions: list[tuple[int, int, int]] = [(i, 0, 0) for i in range(len(labels))]
+    subtotals: list[pd.Series] = []
+    for level in range(labels.nlevels):
+        for subgroup, start, stop in get_subgroups(labels, level):
+            group = df.iloc[:, start:stop] if axis == 1 else df.iloc[start:stop]
+            subtotal = aggregate(group)
+            depth = labels.nlevels - len(subgroup) - 1
+            total = metric_name if level == 0 else __("Subtotal")
+            subtotal.name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
+            # subtotals go before the label following their group, deepest first
+            positions.append((stop, -1, -level))
+            subtotals.append(subtotal)
+
+    order = sorted(range(len(positions)), key=positions.__getitem__)
+    names = [*labels, *(subtotal.name for subtotal in subtotals)]
+    if axis == 1:
+        df = pd.concat(
+            [
+                df.set_axis(range(len(labels)), axis=1),
+                pd.DataFrame(dict(enumerate(subtotals, start=len(labels)))),
+            ],
+            axis=1,
+        ).iloc[:, order]
+        df.columns = pd.MultiIndex.from_tuples(
+            [names[i] for i in order], names=labels.names
+        )
+        return df
+
+    # concatenate consecutive rows as slices, and subtotals as single rows
+    pieces: list[pd.DataFrame] = []
+    run_start: Optional[int] = None
+    for i in order:
+        if i < len(labels):
+            run_start = i if run_start is None else run_start
+            continue
+        if run_start is not None:
+            pieces.append(df.iloc[run_start : positions[i][0]])
+            run_start = None
+        pieces.append(
+            subtotals[i - len(labels)]
+            .to_frame(0)
+            .T.set_axis(pd.Index([names[i]], tupleize_cols=False))
+        )
+    if run_start is not None:
+        pieces.append(df.iloc[run_start:])
+    return pd.concat(pieces)
+
+
 def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches  # noqa: C901
     df: pd.DataFrame,
     rows: list[str],
@@ -154,59 +245,34 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
         df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
 
     if show_rows_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.columns
         if not apply_metrics_on_rows:
-            for col in df.columns:
-                # we need to replace the temporary placeholder with either a string
-                # or np.nan, depending on the column type so that they can sum correctly
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    df[col].replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-                else:
-                    df[col].replace("SUPERSET_PANDAS_NAN", "nan", inplace=True)
+            # we need to replace the temporary placeholder with a string, so that
+            # it's ignored in the totals; numeric columns can't contain it
+            for i, dtype in enumerate(df.dtypes):
+                if not pd.api.types.is_numeric_dtype(dtype):
+                    df.isetitem(i, df.iloc[:, i].replace("SUPERSET_PANDAS_NAN", "nan"))
         else:
             # when we applied metrics on rows, we switched the columns and rows
             # so checking column type doesn't apply. Replace everything with np.nan
             df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-        for level in range(df.columns.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.columns.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
-                depth = df.columns.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal_name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert column after subgroup
-                df.insert(int(slice_.stop), subtotal_name, subtotal)
+        df = add_subtotals(
+            df,
+            lambda group: pivot_v2_aggfunc_map[aggfunc](group, axis=1),
+            metric_name,
+            axis=1,
+        )
 
     if rows and show_columns_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.index
-        for level in range(df.index.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                try:
-                    slice_ = df.index.get_loc(subgroup)
-                except Exception:  # pylint: disable=broad-except
-                    logger.exception(
-                        "Error getting location for subgroup %s from %s",
-                        subgroup,
-                        groups,
-                    )
-                    raise
-
-                subtotal = pivot_v2_aggfunc_map[aggfunc](
-                    df.iloc[slice_, :].apply(pd.to_numeric, errors="coerce"), axis=0
-                )
-                depth = groups.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal.name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert row after subgroup
-                df = pd.concat(
-                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
-                )
+        # strings are ignored in the totals; the conversion is skipped when all
+        # the columns are already numeric, since it doesn't change them
+        numeric = all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+
+        def aggregate(group: pd.DataFrame) -> pd.Series:
+            if not numeric:
+                group = group.apply(pd.to_numeric, errors="coerce")
+            return pivot_v2_aggfunc_map[aggfunc](group, axis=0)
+
+        df = add_subtotals(df, aggregate, metric_name, axis=0)
 
     # if we want to apply the metrics on the rows we need to pivot the
     # dataframe back
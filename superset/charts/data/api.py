@@ -44,6 +44,11 @@ from superset.commands.chart.exceptions import (
     ChartDataCacheLoadError,
     ChartDataQueryFailedError,
 )
+from superset.commands.streaming_export.writers import (
+    ParquetStreamingWriter,
+    StreamingExportFormat,
+    WRITERS,
+)
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
@@ -401,8 +406,8 @@ class ChartDataRestApi(ChartRestApi):
             is_csv_format = result_format == ChartDataResultFormat.CSV
 
             # Check if we should use streaming for large datasets
-            if is_csv_format and self._should_use_streaming(result, form_data):
-                return self._create_streaming_csv_response(
+            if self._should_use_streaming(result, form_data):
+                return self._create_streaming_response(
                     result, form_data, filename=filename, expected_rows=expected_rows
                 )
 
@@ -411,6 +416,12 @@ class ChartDataRestApi(ChartRestApi):
                 data = result["queries"][0]["data"]
                 if is_csv_format:
                     return CsvResponse(data, headers=generate_download_headers("csv"))
+                if result_format == ChartDataResultFormat.PARQUET:
+                    return Response(
+                        data,
+                        headers=generate_download_headers("parquet"),
+                        mimetype=ParquetStreamingWriter.mimetype,
+                    )
 
                 return XlsxResponse(data, headers=generate_download_headers("xlsx"))
 
@@ -554,8 +565,7 @@ class ChartDataRestApi(ChartRestApi):
         query_context = result["query_context"]
         result_format = query_context.result_format
 
-        # Only support CSV streaming currently
-        if result_format.lower() != "csv":
+        if result_format not in ChartDataResultFormat.table_like():
             return False
 
         # Get streaming threshold from config
@@ -587,15 +597,16 @@ class ChartDataRestApi(ChartRestApi):
         # Use streaming if row count meets or exceeds threshold
         return actual_row_count is not None and actual_row_count >= threshold
 
-    def _create_streaming_csv_response(
+    def _create_streaming_response(
         self,
         result: dict[Any, Any],
         form_data: dict[str, Any] | None = None,
         filename: str | None = None,
         expected_rows: int | None = None,
     ) -> Response:
-        """Create a streaming CSV response for large datasets."""
+        """Create a streaming CSV, XLSX or Parquet response for large datasets."""
         query_context = result["query_context"]
+        export_format = StreamingExportFormat(query_context.result_format)
 
         # Use filename from frontend if provided, otherwise generate one
         if not filename:
@@ -608,28 +619,41 @@ class ChartDataRestApi(ChartRestApi):
                 chart_name = form_data["viz_type"]
 
             # Sanitize chart name for filename
-            filename = secure_filename(f"superset_{chart_name}_{timestamp}.csv")
+            filename = secure_filename(
+                f"superset_{chart_name}_{timestamp}.{export_format}"
+            )
 
-        logger.info("Creating streaming CSV response: %s", filename)
+        logger.info("Creating streaming %s response: %s", export_format, filename)
         if expected_rows:
             logger.info("Using expected_rows from frontend: %d", expected_rows)
 
         # Execute streaming command
         # TODO: Make chunk size configurable via SUPERSET_CONFIG
         chunk_size = 1024
-        command = StreamingCSVExportCommand(query_context, chunk_size)
+        # Get encoding and delimiter from config
+        csv_export = app.config.get("CSV_EXPORT", {})
+        encoding = csv_export.get("encoding", "utf-8")
+        command = StreamingCSVExportCommand(
+            query_context,
+            chunk_size,
+            export_format,
+            encoding=encoding,
+            delimiter=csv_export.get("sep", ","),
+        )
         command.validate()
 
         # Get the callable that returns the generator
         csv_generator_callable = command.run()
 
-        # Get encoding from config
-        encoding = app.config.get("CSV_EXPORT", {}).get("encoding", "utf-8")
+        if export_format == StreamingExportFormat.CSV:
+            mimetype = f"text/csv; charset={encoding}"
+        else:
+            mimetype = WRITERS[export_format].mimetype
 
         # Create response with streaming headers
         response = Response(
             csv_generator_callable(),  # Call the callable to get generator
-            mimetype=f"text/csv; charset={encoding}",
+            mimetype=mimetype,
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
                 "Cache-Control": "no-cache",
@@ -14,13 +14,14 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-"""Command for streaming CSV exports of chart data."""
+"""Command for streaming exports of chart data."""
 
 from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 
 from superset.commands.streaming_export.base import BaseStreamingCSVExportCommand
+from superset.commands.streaming_export.writers import StreamingExportFormat
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
@@ -28,7 +29,7 @@ if TYPE_CHECKING:
 
 class StreamingCSVExportCommand(BaseStreamingCSVExportCommand):
     """
-    Command to execute a streaming CSV export for chart data.
+    Command to execute a streaming export for chart data.
 
     This command handles chart-specific logic:
     - QueryContext validation
@@ -40,6 +41,9 @@ class StreamingCSVExportCommand(BaseStreamingCSVExportCommand):
         self,
         query_context: QueryContext,
         chunk_size: int = 1000,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
+        encoding: str | None = None,
+        delimiter: str = ",",
     ):
         """
         Initialize the chart streaming export command.
@@ -47,8 +51,11 @@ class StreamingCSVExportCommand(BaseStreamingCSVExportCommand):
         Args:
             query_context: The query context containing datasource and query details
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            export_format: Format of the export (default: CSV)
+            encoding: Encoding of CSV chunks, yielded as strings if None
+            delimiter: Delimiter of CSV fields (default: ",")
         """
-        super().__init__(chunk_size)
+        super().__init__(chunk_size, export_format, encoding, delimiter)
         self._query_context = query_context
 
     def validate(self) -> None:
@@ -16,10 +16,14 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterator
 from functools import partial
-from typing import Any, Optional, TypedDict
+from itertools import chain
+from typing import Any, Callable, Optional, TypedDict
+from uuid import uuid4
 
 import pandas as pd
+import sqlalchemy as sa
 from flask_babel import lazy_gettext as _
 from werkzeug.datastructures import FileStorage
 
@@ -83,16 +87,160 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into DataFrames of at most ``UPLOAD_ROWS_PER_CHUNK`` rows
+
+        Readers able to read a file incrementally override this, so that uploading a
+        file doesn't need memory proportional to its size. By default the whole file
+        is read into a single DataFrame.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+        """
+        Read a file and upload it to a database, chunk by chunk
+
+        Files of a single chunk are uploaded at once. Otherwise, when creating a new
+        table the chunks are appended to it, and the table is dropped if the upload
+        fails midway. When appending to or replacing an existing table, the chunks
+        are first uploaded to a staging table, which is copied to the table once the
+        whole file has been uploaded, so that a failing upload doesn't leave partial
+        data behind; this needs room for a second copy of the data while uploading.
+        Engines that can't append to a table get the whole file at once.
+
+        :param on_progress: called with the number of rows uploaded so far, after
+            each chunk
+        :throws DatabaseUploadFailed: if there is an error reading or uploading
+        """
+        if database.db_engine_spec.supports_file_upload_append:
+            chunks = self.file_to_dataframes(file)
+        else:
+            chunks = iter([self.file_to_dataframe(file)])
+
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            raise DatabaseUploadFailed(message=_("No data to upload"))
+
+        data_table = Table(table=table_name, schema=schema_name)
+        if (second_chunk := next(chunks, None)) is None:
+            self._dataframe_to_database(first_chunk, database, table_name, schema_name)
+            if on_progress:
+                on_progress(len(first_chunk))
+            return
+
+        chunks = chain([first_chunk, second_chunk], chunks)
+        if self._options.get("already_exists", "fail") == "fail":
+            self._chunks_to_database(chunks, database, data_table, on_progress)
+            return
+
+        staging_table = Table(
+            table=f"_superset_upload_{uuid4().hex[:12]}",
+            schema=schema_name,
         )
+        self._chunks_to_database(chunks, database, staging_table, on_progress)
+        try:
+            # create or replace the table according to the `already_exists` option
+            self._dataframe_to_database(
+                first_chunk.head(0),
+                database,
+                table_name,
+                schema_name,
+            )
+            self._copy_table(database, staging_table, data_table)
+        finally:
+            self._drop_table(database, staging_table)
+
+    def _chunks_to_database(
+        self,
+        chunks: Iterator[pd.DataFrame],
+        database: Database,
+        table: Table,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """
+        Upload DataFrames to a new table, dropping it if an upload fails midway
+
+        :throws DatabaseUploadFailed: if there is an error reading or uploading
+        """
+        rows: Optional[int] = None
+        try:
+            for df in chunks:
+                self._dataframe_to_database(
+                    df,
+                    database,
+                    table.table,
+                    table.schema,
+                    if_exists="fail" if rows is None else "append",
+                )
+                rows = (rows or 0) + len(df)
+                logger.debug("Uploaded %d rows to %s", rows, table)
+                if on_progress:
+                    on_progress(rows)
+        except Exception:
+            if rows is not None:
+                self._drop_table(database, table)
+            raise
+
+    @staticmethod
+    def _copy_table(database: Database, source: Table, target: Table) -> None:
+        """
+        Copy the rows of a staging table to a table, in a single statement
+
+        :throws DatabaseUploadFailed: if there is an error copying the rows
+        """
+        try:
+            with database.get_sqla_engine(
+                catalog=target.catalog,
+                schema=target.schema,
+            ) as engine:
+                source_table = sa.Table(
+                    source.table,
+                    sa.MetaData(),
+                    schema=source.schema,
+                    autoload_with=engine,
+                )
+                target_table = sa.table(
+                    target.table,
+                    *[sa.column(column.name) for column in source_table.columns],
+                    schema=target.schema,
+                )
+                with engine.begin() as connection:
+                    connection.execute(
+                        sa.insert(target_table).from_select(
+                            [column.name for column in source_table.columns],
+                            sa.select(*source_table.columns),
+                        )
+                    )
+        except Exception as ex:
+            raise DatabaseUploadFailed(message=str(ex), exception=ex) from ex
+
+    @staticmethod
+    def _drop_table(database: Database, table: Table) -> None:
+        """
+        Drop a staging table, or a table created by an upload that failed midway
+        """
+        try:
+            with database.get_sqla_engine(
+                catalog=table.catalog,
+                schema=table.schema,
+            ) as engine:
+                sa.Table(table.table, sa.MetaData(), schema=table.schema).drop(
+                    engine,
+                    checkfirst=True,
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to drop the table %s", table, exc_info=True)
 
     def _dataframe_to_database(
         self,
@@ -100,18 +248,21 @@ class BaseDataReader:
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        if_exists: Optional[str] = None,
     ) -> None:
         """
         Upload DataFrame to database
 
         :param df:
+        :param if_exists: what to do if the table exists, defaults to the
+            ``already_exists`` option
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
                 "chunksize": READ_CHUNK_SIZE,
-                "if_exists": self._options.get("already_exists", "fail"),
+                "if_exists": if_exists or self._options.get("already_exists", "fail"),
                 "index": self._options.get("dataframe_index", False),
             }
             if self._options.get("index_label") and self._options.get(
@@ -145,6 +296,7 @@ class UploadCommand(BaseCommand):
         file: Any,
         schema: Optional[str],
         reader: BaseDataReader,
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> None:
         self._model_id = model_id
         self._model: Optional[Database] = None
@@ -152,6 +304,7 @@ class UploadCommand(BaseCommand):
         self._schema = schema
         self._file = file
         self._reader = reader
+        self._on_progress = on_progress
 
     @transaction(on_error=partial(on_error, reraise=DatabaseUploadSaveMetadataFailed))
     def run(self) -> None:
@@ -159,7 +312,13 @@ class UploadCommand(BaseCommand):
         if not self._model:
             return
 
-        self._reader.read(self._file, self._model, self._table_name, self._schema)
+        self._reader.read(
+            self._file,
+            self._model,
+            self._table_name,
+            self._schema,
+            on_progress=self._on_progress,
+        )
 
         sqla_table = (
             db.session.query(SqlaTable)
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from io import BytesIO
 from pathlib import Path
 from typing import Any, IO, Optional
@@ -23,6 +23,7 @@ from zipfile import BadZipfile, is_zipfile, ZipFile
 
 import pandas as pd
 import pyarrow.parquet as pq
+from flask import current_app
 from flask_babel import lazy_gettext as _
 from pyarrow.lib import ArrowException
 from werkzeug.datastructures import FileStorage
@@ -114,6 +115,42 @@ class ColumnarReader(BaseDataReader):
             self._read_buffer_to_dataframe(buffer) for buffer in self._yield_files(file)
         )
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read Columnar file into DataFrames of at most ``UPLOAD_ROWS_PER_CHUNK`` rows
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        batch_size = current_app.config["UPLOAD_ROWS_PER_CHUNK"]
+        columns = self._options.get("columns_read") or None
+        for buffer in self._yield_files(file):
+            try:
+                parquet_file = pq.ParquetFile(buffer)
+                if columns and (
+                    missing := set(columns) - set(parquet_file.schema_arrow.names)
+                ):
+                    raise ValueError(
+                        f"Columns expected but not found: {sorted(missing)}"
+                    )
+
+                offset = 0
+                for batch in parquet_file.iter_batches(
+                    batch_size=batch_size,
+                    columns=columns,
+                    use_pandas_metadata=True,
+                ):
+                    df = batch.to_pandas()
+                    if isinstance(df.index, pd.RangeIndex):
+                        # range indexes are restored per batch
+                        df.index += offset
+                    offset += len(df)
+                    yield df
+            except (ArrowException, ValueError) as ex:
+                raise DatabaseUploadFailed(
+                    message=_("Parsing error: %(error)s", error=str(ex))
+                ) from ex
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         column_names = set()
         try:
@@ -15,12 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from importlib import util
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 from flask import current_app
 from flask_babel import lazy_gettext as _
+from pandas.core.dtypes.cast import find_common_type
 from werkzeug.datastructures import FileStorage
 
 from superset import is_feature_enabled
@@ -347,12 +350,13 @@ class CSVReader(BaseDataReader):
         return custom_types, pandas_types
 
     @staticmethod
-    def _read_csv(  # noqa: C901
-        file: FileStorage,
-        kwargs: dict[str, Any],
-    ) -> pd.DataFrame:
-        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+    def _prepare_read_csv(kwargs: dict[str, Any]) -> Optional[dict[str, str]]:
+        """
+        Select the parsing engine and split the column types of a CSV read.
 
+        :param kwargs: The read_csv kwargs, modified in place
+        :return: The column types to cast after reading, if any
+        """
         # PyArrow engine doesn't support iterator/chunksize/nrows
         # It also has known issues with date parsing and missing values
         # Default to "c" engine for stability
@@ -376,68 +380,122 @@ class CSVReader(BaseDataReader):
 
         kwargs["low_memory"] = False
 
+        types = None
+        if "dtype" in kwargs and kwargs["dtype"]:
+            custom_types, pandas_types = CSVReader._split_types(kwargs["dtype"])
+            if pandas_types:
+                kwargs["dtype"] = pandas_types
+            else:
+                kwargs.pop("dtype", None)
+
+            # Custom types for our manual casting
+            types = custom_types if custom_types else None
+
+        return types
+
+    @staticmethod
+    def _read_csv_chunks(  # noqa: C901
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks of ``chunksize`` rows, up to ``nrows`` rows.
+
+        Columns are cast chunk by chunk, so that a chunk is ready to be uploaded as
+        soon as it's read. If decoding fails before any chunk was returned, the file
+        is read again with the detected encoding.
+
+        :param file: The CSV file
+        :param kwargs: The read_csv kwargs, including ``chunksize``
+        :return: Iterator of DataFrames
+        :raises DatabaseUploadFailed: If the file can't be read or cast
+        """
+        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+        types = CSVReader._prepare_read_csv(kwargs)
+        max_rows = kwargs.get("nrows")
+        total_rows = 0
+        started = False
+
         try:
-            types = None
-            if "dtype" in kwargs and kwargs["dtype"]:
-                custom_types, pandas_types = CSVReader._split_types(kwargs["dtype"])
-                if pandas_types:
-                    kwargs["dtype"] = pandas_types
-                else:
-                    kwargs.pop("dtype", None)
-
-                # Custom types for our manual casting
-                types = custom_types if custom_types else None
-
-            if "chunksize" in kwargs:
-                chunks = []
-                total_rows = 0
-                max_rows = kwargs.get("nrows")
-                chunk_iterator = pd.read_csv(
-                    filepath_or_buffer=file.stream,
-                    **kwargs,
-                )
+            # pandas stops reading at ``nrows``: reading until the end rather than
+            # breaking out of the loop keeps the file open to be read again
+            for chunk in pd.read_csv(filepath_or_buffer=file.stream, **kwargs):
+                if max_rows is not None:
+                    # Only take the needed rows from this chunk
+                    chunk = chunk.iloc[: max_rows - total_rows]
+                if types:
+                    chunk = CSVReader._cast_column_types(chunk, types, kwargs)
+
+                total_rows += len(chunk)
+                started = True
+                yield chunk
+        except DatabaseUploadFailed:
+            raise
+        except UnicodeDecodeError as ex:
+            # chunks already returned can't be read again with another encoding
+            if encoding != DEFAULT_ENCODING or started:
+                raise DatabaseUploadFailed(
+                    message=_("Parsing error: %(error)s", error=str(ex))
+                ) from ex
 
-                for chunk in chunk_iterator:
-                    # Check if adding this chunk would exceed the row limit
-                    if max_rows is not None and total_rows + len(chunk) > max_rows:
-                        # Only take the needed rows from this chunk
-                        remaining_rows = max_rows - total_rows
-                        chunk = chunk.iloc[:remaining_rows]
-                        chunks.append(chunk)
-                        break
-
-                    chunks.append(chunk)
-                    total_rows += len(chunk)
-
-                    # Break if we've reached the desired number of rows
-                    if max_rows is not None and total_rows >= max_rows:
-                        break
-
-                if chunks:
-                    try:
-                        result = pd.concat(chunks, ignore_index=False)
-                    except Exception as ex:
-                        logger.warning(
-                            "Error concatenating CSV chunks: %s. "
-                            "This may be due to inconsistent date parsing "
-                            "across chunks.",
-                            str(ex),
-                        )
-                        raise
-
-                    # When using chunking, we need to reset and rebuild the index
-                    if kwargs.get("index_col") is not None:
-                        # The index was already set by pandas during read_csv
-                        # Just need to ensure it's properly named after concatenation
-                        index_col = kwargs.get("index_col")
-                        if isinstance(index_col, str):
-                            result.index.name = index_col
-                    df = result
-            else:
-                df = pd.read_csv(
-                    filepath_or_buffer=file.stream,
-                    **kwargs,
+            file.seek(0)
+            detected_encoding = CSVReader._detect_encoding(file)
+            if detected_encoding != encoding:
+                kwargs["encoding"] = detected_encoding
+                if types:
+                    kwargs["dtype"] = {**(kwargs.get("dtype") or {}), **types}
+                yield from CSVReader._read_csv_chunks(file, kwargs)
+                return
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except (
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
+
+    @staticmethod
+    def _read_csv(  # noqa: C901
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> pd.DataFrame:
+        if "chunksize" in kwargs:
+            chunks = list(CSVReader._read_csv_chunks(file, kwargs))
+            try:
+                df = pd.concat(chunks, ignore_index=False)
+            except (TypeError, ValueError) as ex:
+                logger.warning(
+                    "Error concatenating CSV chunks: %s. "
+                    "This may be due to inconsistent date parsing "
+                    "across chunks.",
+                    str(ex),
                 )
+                raise DatabaseUploadFailed(
+                    message=_("Parsing error: %(error)s", error=str(ex))
+                ) from ex
+
+            # When using chunking, we need to reset and rebuild the index
+            if kwargs.get("index_col") is not None:
+                # The index was already set by pandas during read_csv
+                # Just need to ensure it's properly named after concatenation
+                index_col = kwargs.get("index_col")
+                if isinstance(index_col, str):
+                    df.index.name = index_col
+            return df
+
+        encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+        try:
+            types = CSVReader._prepare_read_csv(kwargs)
+            df = pd.read_csv(
+                filepath_or_buffer=file.stream,
+                **kwargs,
+            )
 
             if types:
                 df = CSVReader._cast_column_types(df, types, kwargs)
@@ -470,19 +528,8 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
-    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
-        """
-        Read CSV file into a DataFrame
-
-        :return: pandas DataFrame
-        :throws DatabaseUploadFailed: if there is an error reading the file
-        """
-        rows_to_read = self._options.get("rows_to_read")
-        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
-
-        use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
-
-        kwargs = {
+    def _get_read_csv_kwargs(self) -> dict[str, Any]:
+        return {
             "encoding": self._options.get("encoding", DEFAULT_ENCODING),
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -499,7 +546,7 @@ class CSVReader(BaseDataReader):
                 if self._options.get("null_values")  # None if an empty list
                 else None
             ),
-            "nrows": rows_to_read,
+            "nrows": self._options.get("rows_to_read"),
             "parse_dates": self._options.get("column_dates"),
             "sep": self._options.get("delimiter", ","),
             "skip_blank_lines": self._options.get("skip_blank_lines", False),
@@ -513,12 +560,107 @@ class CSVReader(BaseDataReader):
             "cache_dates": True,
         }
 
+    def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
+        """
+        Read CSV file into a DataFrame
+
+        :return: pandas DataFrame
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        rows_to_read = self._options.get("rows_to_read")
+        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+
+        use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
+
+        kwargs = self._get_read_csv_kwargs()
         if use_chunking:
             kwargs["chunksize"] = chunk_size
             kwargs["iterator"] = True
 
         return self._read_csv(file, kwargs)
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into DataFrames of at most ``UPLOAD_ROWS_PER_CHUNK`` rows
+
+        The file is read twice, chunk by chunk: first to find the column types of the
+        whole file, then to cast each chunk to them.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        kwargs = self._get_read_csv_kwargs()
+        kwargs["chunksize"] = current_app.config["UPLOAD_ROWS_PER_CHUNK"]
+        kwargs["iterator"] = True
+
+        # The types of each chunk are inferred independently, while the first chunk
+        # creates the table: read the file once to find the types of all the rows.
+        first_pass_kwargs = dict(kwargs)
+        dtypes = self._combine_dtypes(self._read_csv_chunks(file, first_pass_kwargs))
+        kwargs["encoding"] = first_pass_kwargs["encoding"]
+        file.seek(0)
+
+        # Columns mixing text with other values are read as text, as the type of the
+        # values of the first chunk would be the type of the column otherwise
+        if text_columns := [
+            column for column, dtype in dtypes.items() if isinstance(dtype, str)
+        ]:
+            kwargs["dtype"] = {
+                **dict.fromkeys(text_columns, "str"),
+                **(kwargs["dtype"] or {}),
+            }
+            if kwargs["parse_dates"]:
+                kwargs["parse_dates"] = [
+                    column
+                    for column in kwargs["parse_dates"]
+                    if column not in text_columns
+                ]
+
+        for chunk in self._read_csv_chunks(file, kwargs):
+            yield chunk.astype(
+                {
+                    column: dtype
+                    for column, dtype in dtypes.items()
+                    if not isinstance(dtype, str) and chunk[column].dtype != dtype
+                }
+            )
+
+    @staticmethod
+    def _combine_dtypes(chunks: Iterator[pd.DataFrame]) -> dict[str, Any]:
+        """
+        Find the column types of DataFrames once concatenated.
+
+        As with ``pd.concat``, columns are widened to a type holding the values of all
+        chunks, and chunks where a column is only missing values don't change its type.
+        Columns mixing text with other values are ``"str"``.
+
+        :param chunks: The DataFrames
+        :return: The type of each column
+        """
+        dtypes: dict[str, set[Any]] = {}
+        missing: dict[str, set[Any]] = {}
+        has_missing: set[str] = set()
+        for chunk in chunks:
+            for column, series in chunk.items():
+                if series.isna().all():
+                    missing.setdefault(column, set()).add(series.dtype)
+                else:
+                    dtypes.setdefault(column, set()).add(series.dtype)
+                if series.hasnans:
+                    has_missing.add(column)
+
+        combined: dict[str, Any] = {}
+        for column in {**dtypes, **missing}:
+            dtype = find_common_type(list(dtypes.get(column) or missing[column]))
+            if len(dtypes.get(column, ())) > 1 and dtype == np.dtype("object"):
+                dtype = "str"
+            elif column in has_missing and dtype.kind in "iu":
+                dtype = np.dtype("float64")
+            elif column in has_missing and dtype.kind == "b":
+                dtype = np.dtype("object")
+            combined[column] = dtype
+        return combined
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
         Get metadata from a CSV file
@@ -229,7 +229,8 @@ def load_data(data_uri: str, dataset: SqlaTable, database: Database) -> None:
             chunksize=CHUNKSIZE,
             dtype=dtype,
             index=False,
-            method="multi",
+            method=database.db_engine_spec.get_to_sql_method(connection.dialect)
+            or "multi",
         )
     else:
         logger.warning("Loading data outside the import transaction")
@@ -245,5 +246,6 @@ def load_data(data_uri: str, dataset: SqlaTable, database: Database) -> None:
                 chunksize=CHUNKSIZE,
                 dtype=dtype,
                 index=False,
-                method="multi",
+                method=database.db_engine_spec.get_to_sql_method(engine.dialect)
+                or "multi",
             )
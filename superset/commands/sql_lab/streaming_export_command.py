@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-"""Command for streaming CSV exports of SQL Lab query results."""
+"""Command for streaming exports of SQL Lab query results."""
 
 from __future__ import annotations
 
@@ -24,6 +24,7 @@ from flask_babel import gettext as __
 
 from superset import db
 from superset.commands.streaming_export.base import BaseStreamingCSVExportCommand
+from superset.commands.streaming_export.writers import StreamingExportFormat
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
@@ -33,7 +34,7 @@ from superset.sqllab.limiting_factor import LimitingFactor
 
 class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
     """
-    Command to execute a streaming CSV export of SQL Lab query results.
+    Command to execute a streaming export of SQL Lab query results.
 
     This command handles SQL Lab-specific logic:
     - Query validation and access control
@@ -45,6 +46,9 @@ class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
         self,
         client_id: str,
         chunk_size: int = 1000,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
+        encoding: str | None = None,
+        delimiter: str = ",",
     ):
         """
         Initialize the SQL Lab streaming export command.
@@ -52,8 +56,11 @@ class StreamingSqlResultExportCommand(BaseStreamingCSVExportCommand):
         Args:
             client_id: The SQL Lab query client ID
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            export_format: Format of the export (default: CSV)
+            encoding: Encoding of CSV chunks, yielded as strings if None
+            delimiter: Delimiter of CSV fields (default: ",")
         """
-        super().__init__(chunk_size)
+        super().__init__(chunk_size, export_format, encoding, delimiter)
         self._client_id = client_id
         self._query: Query | None = None
 
@@ -14,27 +14,38 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-"""Base command for streaming CSV exports."""
+"""Base command for streaming exports."""
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import logging
 import time
 from abc import abstractmethod
 from contextlib import contextmanager
-from typing import Any, Callable, Generator
+from itertools import chain
+from typing import Any, Callable, Generator, Sequence
 
 from flask import current_app as app, g, has_app_context
 from sqlalchemy import text
 
 from superset import db
 from superset.commands.base import BaseCommand
+from superset.commands.streaming_export.writers import (
+    StreamingExportFormat,
+    WRITERS,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def utf8_size(data: str) -> int:
+    """Return the size of a string encoded as UTF-8, encoding only non-ASCII data."""
+    return len(data) if data.isascii() else len(data.encode("utf-8"))
+
+
 @contextmanager
 def preserve_g_context(
     captured_g: dict[str, Any],
@@ -55,10 +66,10 @@ def preserve_g_context(
 
 class BaseStreamingCSVExportCommand(BaseCommand):
     """
-    Base class for streaming CSV export commands.
+    Base class for streaming export commands.
 
     Provides shared functionality for:
-    - Generating CSV data in chunks
+    - Generating CSV, XLSX, Parquet or Arrow IPC data in chunks
     - Managing database connections
     - Buffering data for efficient streaming
     - Error handling with user-friendly messages
@@ -68,14 +79,27 @@ class BaseStreamingCSVExportCommand(BaseCommand):
     - _get_row_limit(): Return optional row limit for the export
     """
 
-    def __init__(self, chunk_size: int = 1000):
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
+        encoding: str | None = None,
+        delimiter: str = ",",
+    ):
         """
         Initialize the streaming export command.
 
         Args:
             chunk_size: Number of rows to fetch per database query (default: 1000)
+            export_format: Format of the export (default: CSV)
+            encoding: Encoding of CSV chunks, which are yielded as bytes when set
+                and as strings otherwise (default: None)
+            delimiter: Delimiter of CSV fields (default: ",")
         """
         self._chunk_size = chunk_size
+        self._export_format = export_format
+        self._encoding = encoding
+        self._delimiter = delimiter
         self._current_app = app._get_current_object()
 
     @abstractmethod
@@ -102,11 +126,25 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         """Write CSV header and return header data with byte count."""
         csv_writer.writerow(columns)
         header_data = buffer.getvalue()
-        total_bytes = len(header_data.encode("utf-8"))
+        total_bytes = utf8_size(header_data)
         buffer.seek(0)
         buffer.truncate()
         return header_data, total_bytes
 
+    def _fetch_batches(
+        self, result_proxy: Any, limit: int | None
+    ) -> Generator[Sequence[Any], None, None]:
+        """Fetch database rows in batches of at most chunk_size, up to the limit."""
+        row_count = 0
+
+        while rows := result_proxy.fetchmany(self._chunk_size):
+            if limit is not None and row_count + len(rows) >= limit:
+                yield rows[: limit - row_count]
+                break
+
+            row_count += len(rows)
+            yield rows
+
     def _process_rows(
         self,
         result_proxy: Any,
@@ -117,42 +155,74 @@ class BaseStreamingCSVExportCommand(BaseCommand):
         """
         Process database rows and yield CSV data chunks.
 
-        Yields tuples of (data_chunk, row_count, byte_count).
+        Each batch of rows is serialized in a single call, and the buffer is flushed
+        once it reaches the threshold. Yields tuples of (data_chunk, row_count,
+        byte_count).
         """
         row_count = 0
         flush_threshold = 65536  # 64KB
 
-        while rows := result_proxy.fetchmany(self._chunk_size):
-            for row in rows:
-                # Apply limit if specified
-                if limit is not None and row_count >= limit:
-                    break
-
-                csv_writer.writerow(row)
-                row_count += 1
-
-                # Check buffer size and flush if needed
-                current_size = buffer.tell()
-                if current_size >= flush_threshold:
-                    data = buffer.getvalue()
-                    data_bytes = len(data.encode("utf-8"))
-                    yield data, row_count, data_bytes
-                    buffer.seek(0)
-                    buffer.truncate()
-
-            # Break outer loop if limit reached
-            if limit is not None and row_count >= limit:
-                break
+        for rows in self._fetch_batches(result_proxy, limit):
+            csv_writer.writerows(rows)
+            row_count += len(rows)
+
+            # Check buffer size and flush if needed
+            if buffer.tell() >= flush_threshold:
+                data = buffer.getvalue()
+                yield data, row_count, utf8_size(data)
+                buffer.seek(0)
+                buffer.truncate()
 
         # Flush remaining buffer
         if remaining_data := buffer.getvalue():
-            data_bytes = len(remaining_data.encode("utf-8"))
-            yield remaining_data, row_count, data_bytes
+            yield remaining_data, row_count, utf8_size(remaining_data)
+
+    def _stream_csv(
+        self, result_proxy: Any, columns: list[str], limit: int | None
+    ) -> Generator[tuple[str | bytes, int, int], None, None]:
+        """Yield CSV data chunks, starting with the header."""
+        # Use StringIO with csv.writer for proper escaping
+        buffer = io.StringIO()
+        csv_writer = csv.writer(
+            buffer,
+            delimiter=self._delimiter,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+
+        header_data, header_bytes = self._write_csv_header(columns, csv_writer, buffer)
+        chunks = chain(
+            [(header_data, 0, header_bytes)],
+            self._process_rows(result_proxy, csv_writer, buffer, limit),
+        )
+        if self._encoding is None:
+            yield from chunks
+            return
+
+        # the incremental encoder writes the BOM of encodings like utf-8-sig once
+        encoder = codecs.getincrementalencoder(self._encoding)()
+        for data, row_count, _ in chunks:
+            encoded = encoder.encode(data)
+            yield encoded, row_count, len(encoded)
+
+    def _stream_binary(
+        self, result_proxy: Any, columns: list[str], limit: int | None
+    ) -> Generator[tuple[bytes, int, int], None, None]:
+        """Yield data chunks of a binary format, written batch by batch."""
+        writer = WRITERS[self._export_format](columns)
+        row_count = 0
+
+        for rows in self._fetch_batches(result_proxy, limit):
+            row_count += len(rows)
+            for data in writer.write(rows):
+                yield data, row_count, len(data)
+
+        for data in writer.close():
+            yield data, row_count, len(data)
 
     def _execute_query_and_stream(
         self, sql: str, database: Any, limit: int | None
-    ) -> Generator[str, None, None]:
-        """Execute query with streaming and yield CSV chunks."""
+    ) -> Generator[str | bytes, None, None]:
+        """Execute query with streaming and yield data chunks."""
         start_time = time.time()
         total_bytes = 0
 
@@ -169,22 +239,15 @@ class BaseStreamingCSVExportCommand(BaseCommand):
 
                     columns = list(result_proxy.keys())
 
-                    # Use StringIO with csv.writer for proper escaping
-                    buffer = io.StringIO()
-                    csv_writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
-
-                    # Write CSV header
-                    header_data, header_bytes = self._write_csv_header(
-                        columns, csv_writer, buffer
-                    )
-                    total_bytes += header_bytes
-                    yield header_data
+                    chunks: Generator[tuple[Any, int, int], None, None]
+                    if self._export_format == StreamingExportFormat.CSV:
+                        chunks = self._stream_csv(result_proxy, columns, limit)
+                    else:
+                        chunks = self._stream_binary(result_proxy, columns, limit)
 
                     # Process rows and yield chunks
                     row_count = 0
-                    for data_chunk, rows_processed, chunk_bytes in self._process_rows(
-                        result_proxy, csv_writer, buffer, limit
-                    ):
+                    for data_chunk, rows_processed, chunk_bytes in chunks:
                         total_bytes += chunk_bytes
                         row_count = rows_processed
                         yield data_chunk
@@ -193,19 +256,21 @@ class BaseStreamingCSVExportCommand(BaseCommand):
                     total_time = time.time() - start_time
                     total_mb = total_bytes / (1024 * 1024)
                     logger.info(
-                        "Streaming CSV completed: %s rows, %.1fMB in %.2fs",
+                        "%s: %s rows, %.1fMB in %.2fs",
+                        f"Streaming {self._export_format.upper()} completed",
                         f"{row_count:,}",
                         total_mb,
                         total_time,
                     )
 
-    def run(self) -> Callable[[], Generator[str, None, None]]:
+    def run(self) -> Callable[[], Generator[str | bytes, None, None]]:
         """
-        Execute the streaming CSV export.
+        Execute the streaming export.
 
         Returns:
-            A callable that returns a generator yielding CSV data chunks as strings.
-            The callable is needed to maintain Flask app context during streaming.
+            A callable that returns a generator yielding data chunks, as strings for
+            CSV and as bytes for the binary formats. The callable is needed to
+            maintain Flask app context during streaming.
         """
         # Load all needed data while session is still active
         # to avoid DetachedInstanceError
@@ -217,14 +282,14 @@ class BaseStreamingCSVExportCommand(BaseCommand):
             g._get_current_object().__dict__.copy() if has_app_context() else {}
         )
 
-        def csv_generator() -> Generator[str, None, None]:
-            """Generator that yields CSV data chunks."""
+        def csv_generator() -> Generator[str | bytes, None, None]:
+            """Generator that yields data chunks."""
             with self._current_app.app_context():
                 with preserve_g_context(captured_g):
                     try:
                         yield from self._execute_query_and_stream(sql, database, limit)
                     except Exception as e:
-                        logger.error("Error in streaming CSV generator: %s", e)
+                        logger.error("Error in streaming export generator: %s", e)
                         import traceback
 
                         logger.error("Traceback: %s", traceback.format_exc())
@@ -0,0 +1,305 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Writers for the binary formats of streaming exports."""
+
+from __future__ import annotations
+
+import tempfile
+import uuid
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xlsxwriter
+
+from superset.utils.backports import StrEnum
+from superset.utils.excel import format_excel_values
+
+# size of the chunks read back from temporary files
+READ_CHUNK_SIZE = 65536  # 64KB
+
+
+class StreamingExportFormat(StrEnum):
+    """
+    Format of a streaming export
+    """
+
+    CSV = "csv"
+    XLSX = "xlsx"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+class StreamingExportWriter:
+    """
+    Base class for the writers of binary streaming exports.
+
+    Writers receive the rows fetched from the database in batches, and return the
+    chunks of the file that can be sent to the client so far.
+    """
+
+    mimetype: str
+
+    def __init__(self, columns: list[str]):
+        self.columns = columns
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> list[bytes]:
+        """Write a batch of rows, returning the chunks ready to be sent."""
+        raise NotImplementedError()
+
+    def close(self) -> Iterator[bytes]:
+        """Finish the file, yielding its remaining chunks."""
+        raise NotImplementedError()
+
+
+class ExcelStreamingWriter(StreamingExportWriter):
+    """
+    Write rows to a workbook in constant memory mode.
+
+    Rows are flushed to disk as they are written, but since the XLSX file is a zip
+    archive it can only be sent once the workbook is closed.
+    """
+
+    mimetype = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    # maximum number of rows of a worksheet, including the header
+    max_rows = 1_048_576
+
+    def __init__(self, columns: list[str]):
+        super().__init__(columns)
+        self._file = tempfile.TemporaryFile()  # pylint: disable=consider-using-with
+        self._workbook = xlsxwriter.Workbook(
+            self._file,
+            {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+                "remove_timezone": True,
+            },
+        )
+        self._worksheet = self._add_worksheet()
+        self._row = 1
+
+    def _add_worksheet(self) -> Any:
+        worksheet = self._workbook.add_worksheet()
+        for type_ in (uuid.UUID, dict, list, bytes):
+            worksheet.add_write_handler(type_, self._write_string)
+        worksheet.write_row(0, 0, self.columns)
+        return worksheet
+
+    @staticmethod
+    def _write_string(
+        worksheet: Any, row: int, col: int, value: Any, *args: Any
+    ) -> Any:
+        return worksheet.write_string(row, col, str(value), *args)
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> list[bytes]:
+        df = format_excel_values(
+            pd.DataFrame.from_records(
+                [tuple(row) for row in rows],
+                columns=self.columns,
+                coerce_float=True,
+            )
+        )
+        for values in df.itertuples(index=False, name=None):
+            if self._row == self.max_rows:
+                # continue on a new worksheet
+                self._worksheet = self._add_worksheet()
+                self._row = 1
+            self._worksheet.write_row(self._row, 0, values)
+            self._row += 1
+        return []
+
+    def close(self) -> Iterator[bytes]:
+        try:
+            self._workbook.close()
+            self._file.seek(0)
+            while data := self._file.read(READ_CHUNK_SIZE):
+                yield data
+        finally:
+            self._file.close()
+
+
+class _BufferSink:
+    """
+    Writable file-like object keeping the data written to it until drained.
+
+    The position keeps increasing across drains, since Arrow writers rely on it to
+    compute offsets.
+    """
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> list[bytes]:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return [data] if data else []
+
+
+def _to_string_array(values: list[Any]) -> pa.Array:
+    return pa.array(
+        [None if value is None else str(value) for value in values],
+        type=pa.string(),
+    )
+
+
+def _to_array(values: list[Any], type_: pa.DataType | None = None) -> pa.Array:
+    """
+    Convert a column of values to an Arrow array, cast to a given type if any.
+    """
+    try:
+        array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # values Arrow can't convert, eg, UUIDs or mixed types, are exported as strings
+        return _to_string_array(values)
+
+    if type_ is None or array.type == type_:
+        return array
+    if pa.types.is_string(type_) and not pa.types.is_null(array.type):
+        return _to_string_array(values)
+    return array.cast(type_)
+
+
+def _widen_type(type_: pa.DataType) -> pa.DataType:
+    """
+    Widen a type inferred from the first batch, so that it fits the next batches.
+
+    The precision and scale of decimals can vary from row to row, eg, for unbounded
+    numeric columns, so they are exported as floats, like in Excel exports.
+    """
+    if pa.types.is_null(type_) or pa.types.is_nested(type_):
+        return pa.string()
+    if pa.types.is_decimal(type_):
+        return pa.float64()
+    return type_
+
+
+class ArrowStreamingWriter(StreamingExportWriter):
+    """
+    Write rows as an Arrow IPC stream, buffering batches into record batches.
+
+    The schema is inferred from the first buffered rows, so that values of a column
+    whose type varies across fetched batches, eg, integers and floats, are widened
+    to a common type.
+    """
+
+    mimetype = "application/vnd.apache.arrow.stream"
+
+    # number of rows buffered before writing a record batch
+    row_group_size = 65536
+
+    def __init__(self, columns: list[str]):
+        super().__init__(columns)
+        self._sink = _BufferSink()
+        self._schema: pa.Schema | None = None
+        self._writer: Any = None
+        self._values: list[list[Any]] = [[] for _ in columns]
+        self._buffered_rows = 0
+
+    def _open(self, schema: pa.Schema) -> Any:
+        return pa.ipc.new_stream(self._sink, schema)
+
+    def _write_table(self, table: pa.Table) -> None:
+        self._writer.write_table(table)
+
+    def _to_table(self, values: list[list[Any]]) -> pa.Table:
+        if self._schema is None:
+            arrays = []
+            for column in values:
+                array = _to_array(column)
+                arrays.append(_to_array(column, _widen_type(array.type)))
+            self._schema = pa.schema(
+                [
+                    pa.field(name, array.type)
+                    for name, array in zip(self.columns, arrays, strict=False)
+                ]
+            )
+        else:
+            arrays = [
+                _to_array(column, field.type)
+                for column, field in zip(values, self._schema, strict=False)
+            ]
+        return pa.Table.from_arrays(arrays, schema=self._schema)
+
+    def _flush(self) -> None:
+        if not self._buffered_rows:
+            return
+        table = self._to_table(self._values)
+        if self._writer is None:
+            self._writer = self._open(table.schema)
+        self._write_table(table)
+        self._values = [[] for _ in self.columns]
+        self._buffered_rows = 0
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> list[bytes]:
+        for column, values in zip(self._values, zip(*rows, strict=False), strict=False):
+            column.extend(values)
+        self._buffered_rows += len(rows)
+        if self._buffered_rows >= self.row_group_size:
+            self._flush()
+        return self._sink.drain()
+
+    def close(self) -> Iterator[bytes]:
+        self._flush()
+        if self._writer is None:
+            # no rows, the columns are exported as strings
+            self._writer = self._open(
+                pa.schema([pa.field(name, pa.string()) for name in self.columns])
+            )
+        self._writer.close()
+        yield from self._sink.drain()
+
+
+class ParquetStreamingWriter(ArrowStreamingWriter):
+    """
+    Write rows as a Parquet file, buffering batches into row groups.
+    """
+
+    mimetype = "application/vnd.apache.parquet"
+
+    def _open(self, schema: pa.Schema) -> Any:
+        return pq.ParquetWriter(self._sink, schema)
+
+    def _write_table(self, table: pa.Table) -> None:
+        self._writer.write_table(table, row_group_size=table.num_rows)
+
+
+WRITERS: dict[StreamingExportFormat, type[StreamingExportWriter]] = {
+    StreamingExportFormat.XLSX: ExcelStreamingWriter,
+    StreamingExportFormat.PARQUET: ParquetStreamingWriter,
+    StreamingExportFormat.ARROW: ArrowStreamingWriter,
+}
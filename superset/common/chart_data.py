@@ -24,11 +24,12 @@ class ChartDataResultFormat(StrEnum):
 
     CSV = "csv"
     JSON = "json"
+    PARQUET = "parquet"
     XLSX = "xlsx"
 
     @classmethod
     def table_like(cls) -> set["ChartDataResultFormat"]:
-        return {cls.CSV} | {cls.XLSX}
+        return {cls.CSV} | {cls.XLSX} | {cls.PARQUET}
 
 
 class ChartDataResultType(StrEnum):
@@ -98,38 +98,30 @@ class QueryContextProcessor:
             force_cached=force_cached,
         )
 
-        if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
+        # coalesce identical queries running concurrently, eg, when the cache of a
+        # popular dashboard expires, so that only one of them hits the database
+        lock_token = None
+        if (
+            query_obj
+            and cache_key
+            and not cache.is_loaded
+            and not force_query
+            and (
+                lock_timeout := current_app.config["CHART_QUERY_SINGLE_FLIGHT_TIMEOUT"]
+            )
+        ):
+            cache, lock_token = QueryCacheManager.get_or_lock(
+                key=cache_key,
+                region=CacheRegion.DATA,
+                lock_timeout=lock_timeout,
+            )
 
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+        try:
+            if query_obj and cache_key and not cache.is_loaded:
+                self._load_query_result(query_obj, cache, cache_key, force_query)
+        finally:
+            if lock_token:
+                QueryCacheManager.release_lock(cache_key, CacheRegion.DATA, lock_token)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -200,6 +192,43 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _load_query_result(
+        self,
+        query_obj: QueryObject,
+        cache: QueryCacheManager,
+        cache_key: str,
+        force_query: bool,
+    ) -> None:
+        """Run the query of a query object and cache its result"""
+        try:
+            if invalid_columns := [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if (col not in self._qc_datasource.column_names and col != DTTM_ALIAS)
+            ]:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            query_result = self.get_query_result(query_obj)
+            annotation_data = self.get_annotation_data(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=force_query,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -248,6 +277,8 @@ class QueryContextProcessor:
             elif self._query_context.result_format == ChartDataResultFormat.XLSX:
                 excel.apply_column_types(df, coltypes)
                 result = excel.df_to_excel(df, **current_app.config["EXCEL_EXPORT"])
+            elif self._query_context.result_format == ChartDataResultFormat.PARQUET:
+                result = df.rename(columns=str).to_parquet(index=include_index)
             return result or ""
 
         return df.to_dict(orient="records")
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Serialization of DataFrames as Arrow IPC streams for the chart data cache.
+
+Unpickling a DataFrame rebuilds the whole object graph, which is slow for large
+frames and for object columns. Frames are instead stored as an Arrow IPC stream
+next to a small header describing them, which can be read without copying the
+buffers.
+
+Only frames that round-trip exactly are serialized with Arrow; the others, eg, with
+object columns holding lists or mixed types, keep being pickled as is.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, TypedDict
+
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_object_dtype
+
+ARROW_FORMAT = "arrow"
+
+
+class SerializedDataFrame(TypedDict):
+    format: str
+    columns: list[str]
+    object_columns: list[str]
+    num_rows: int
+    data: bytes
+
+
+def _is_object_type_preserved(type_: pa.DataType) -> bool:
+    """
+    Return whether an object column inferred as a given type is read back as the
+    same Python objects.
+    """
+    return (
+        pa.types.is_string(type_)
+        or pa.types.is_large_string(type_)
+        or pa.types.is_binary(type_)
+        or pa.types.is_large_binary(type_)
+        or pa.types.is_boolean(type_)
+        or pa.types.is_decimal(type_)
+        or pa.types.is_date32(type_)
+        or pa.types.is_int64(type_)
+        or pa.types.is_null(type_)
+    )
+
+
+def serialize_dataframe(df: pd.DataFrame) -> Optional[SerializedDataFrame]:
+    """
+    Serialize a DataFrame as an Arrow IPC stream.
+
+    :param df: The DataFrame
+    :returns: The serialized DataFrame, or None if it can't be serialized with Arrow
+        without altering it
+    """
+    if (
+        not isinstance(df.index, pd.RangeIndex)
+        or df.columns.has_duplicates
+        or not all(isinstance(column, str) for column in df.columns)
+    ):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except Exception:  # pylint: disable=broad-except
+        # eg. `OverflowError` on integers which don't fit in 64 bits; the caller
+        # falls back to pickling the DataFrame
+        return None
+
+    object_columns = [
+        column for column, dtype in df.dtypes.items() if is_object_dtype(dtype)
+    ]
+    if not all(
+        _is_object_type_preserved(table.schema.field(column).type)
+        for column in object_columns
+    ):
+        return None
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return {
+        "format": ARROW_FORMAT,
+        "columns": list(df.columns),
+        "object_columns": object_columns,
+        "num_rows": len(df),
+        "data": sink.getvalue().to_pybytes(),
+    }
+
+
+def deserialize_dataframe(serialized: SerializedDataFrame) -> pd.DataFrame:
+    """
+    Deserialize a DataFrame serialized with `serialize_dataframe`.
+
+    :param serialized: The serialized DataFrame
+    :returns: The DataFrame
+    """
+    reader = pa.ipc.open_stream(pa.py_buffer(serialized["data"]))
+    table = reader.read_all()
+    df = table.to_pandas(integer_object_nulls=True, date_as_object=True)
+    for column in serialized["object_columns"]:
+        if not is_object_dtype(df[column]):
+            df[column] = df[column].astype(object)
+
+    return df
+
+
+def is_serialized_dataframe(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("format") == ARROW_FORMAT
@@ -17,14 +17,23 @@
 from __future__ import annotations
 
 import logging
+import pickle
+import time
+import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from flask import current_app
 from flask_caching import Cache
+from flask_caching.backends.rediscache import RedisCache
 from pandas import DataFrame
 
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.dataframe_serialization import (
+    deserialize_dataframe,
+    is_serialized_dataframe,
+    serialize_dataframe,
+)
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -32,6 +41,7 @@ from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
+from superset.utils.compression import compress, decompress
 from superset.utils.core import error_msg_from_exception, get_stacktrace
 
 logger = logging.getLogger(__name__)
@@ -41,6 +51,22 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+# key holding the pickled and compressed value in regions with a compression codec
+COMPRESSED_VALUE_KEY = "compressed_value"
+
+# prefix of the keys used to coalesce concurrent queries for the same cache key
+SINGLE_FLIGHT_LOCK_PREFIX = "single_flight_lock"
+# seconds between checks while waiting for another worker to populate the cache
+SINGLE_FLIGHT_POLL_INTERVAL = 0.1
+# deletes a lock only if it's still held by the caller, ie, it hasn't expired and
+# been taken over by another worker in the meantime
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class QueryCacheManager:
     """
@@ -100,6 +126,9 @@ class QueryCacheManager:
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
+
+        In the data region the dataframe is stored as an Arrow IPC stream when it can
+        be serialized without altering it, which is faster to load than a pickle.
         """
         try:
             self.status = query_result.status
@@ -134,6 +163,10 @@ class QueryCacheManager:
                 "queried_dttm": self.queried_dttm,
                 "dttm": self.queried_dttm,  # Backwards compatibility
             }
+            if region == CacheRegion.DATA and (
+                serialized_df := serialize_dataframe(self.df)
+            ):
+                value["df"] = serialized_df
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
                     key=key,
@@ -170,7 +203,10 @@ class QueryCacheManager:
             logger.debug("CACHE GET - Key: %s, Region: %s", key, region)
             current_app.config["STATS_LOGGER"].incr("loading_from_cache")
             try:
+                cache_value = cls._decompress_value(cache_value)
                 query_cache.df = cache_value["df"]
+                if is_serialized_dataframe(query_cache.df):
+                    query_cache.df = deserialize_dataframe(query_cache.df)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -222,8 +258,106 @@ class QueryCacheManager:
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
+            if codec := current_app.config["CACHE_COMPRESSION"].get(region):
+                value = {COMPRESSED_VALUE_KEY: compress(pickle.dumps(value), codec)}
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
 
+    @staticmethod
+    def _decompress_value(cache_value: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return the original value of a cache entry stored with compression.
+
+        Entries are decoded based on how they were stored rather than on the current
+        configuration, so that they remain readable after the codec changes.
+        """
+        if (compressed := cache_value.get(COMPRESSED_VALUE_KEY)) is None:
+            return cache_value
+
+        value = pickle.loads(decompress(compressed))  # noqa: S301
+        # `set_and_log_cache` timestamps the stored entry
+        return {**value, "dttm": cache_value.get("dttm", value.get("dttm"))}
+
+    @classmethod
+    def get_or_lock(
+        cls,
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+        lock_timeout: int = 60,
+    ) -> tuple[QueryCacheManager, str | None]:
+        """
+        Get a cached value or, if missing, the lock to compute it (single-flight).
+
+        When another worker already holds the lock for the key, wait for it to cache
+        the value. If it releases the lock without caching anything, eg, because the
+        query failed, the lock is taken over by one of the waiting workers.
+
+        The lock is an entry in the cache region added atomically, so that workers in
+        different processes are coalesced when the cache is shared, eg, Redis. It
+        expires after `lock_timeout` seconds, which is also how long to wait for.
+
+        :param key: The cache key
+        :param region: The cache region
+        :param lock_timeout: The timeout of the lock, in seconds
+        :returns: The cache manager and, if the caller holds the lock, its token, in
+            which case it should compute and cache the value and then call
+            `release_lock` with the token; otherwise the cache manager is loaded,
+            unless waiting timed out
+        """
+        stats_logger = current_app.config["STATS_LOGGER"]
+        lock_key = f"{SINGLE_FLIGHT_LOCK_PREFIX}:{key}"
+        deadline = time.monotonic() + lock_timeout
+        waited = False
+
+        while True:
+            token = uuid.uuid4().hex
+            if _cache[region].add(lock_key, token, timeout=lock_timeout):
+                # the value might have been cached since it was last read
+                query_cache = cls.get(key, region)
+                if not query_cache.is_loaded:
+                    return query_cache, token
+                cls.release_lock(key, region, token)
+            else:
+                query_cache = cls.get(key, region)
+
+            if query_cache.is_loaded:
+                if waited:
+                    stats_logger.incr("single_flight.coalesced")
+                return query_cache, None
+
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out waiting for a concurrent query on %s", key)
+                stats_logger.incr("single_flight.timeout")
+                return query_cache, None
+
+            waited = True
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+    @staticmethod
+    def release_lock(key: str, region: CacheRegion, token: str) -> None:
+        """
+        Release a lock returned by `get_or_lock`, unless it's now held by another
+        worker because it expired.
+
+        The check and the deletion are atomic with Redis; with other backends the
+        lock could still expire in between.
+
+        :param key: The cache key
+        :param region: The cache region
+        :param token: The token of the lock
+        """
+        lock_key = f"{SINGLE_FLIGHT_LOCK_PREFIX}:{key}"
+        backend = _cache[region].cache
+        if isinstance(backend, RedisCache):
+            # pylint: disable=protected-access
+            backend._write_client.eval(
+                RELEASE_LOCK_SCRIPT,
+                1,
+                f"{backend._get_prefix()}{lock_key}",
+                backend.serializer.dumps(token),
+            )
+        elif backend.get(lock_key) == token:
+            backend.delete(lock_key)
+
     @staticmethod
     def delete(
         key: str | None,
@@ -80,8 +80,19 @@ if TYPE_CHECKING:
 # Realtime stats logger, a StatsD implementation exists
 STATS_LOGGER = DummyStatsLogger()
 
+# Engine used to encode and decode JSON in `superset.utils.json`, which serializes API
+# responses, chart data and results backend payloads. "orjson" (requires the `orjson`
+# package) natively serializes dates and UUIDs and is much faster than "simplejson";
+# its output is compact, and values it doesn't support, eg, integers larger than 64
+# bits, are encoded with simplejson.
+JSON_ENGINE = "simplejson"
+
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `AsyncDBEventLogger` writes to the metadata database in batches from a
+# background thread instead of during the request, eg:
+#
+#     EVENT_LOGGER = AsyncDBEventLogger(flush_interval=5, batch_size=500)
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -168,6 +179,18 @@ NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
 
+# Maximum number of time comparison (time offset) queries of a single chart that
+# are executed concurrently, after checking the cache. With the default of 1 the
+# offset queries run sequentially after the main query. Concurrent queries run in
+# threads with a copy of the current app context and their own metadata database
+# session.
+TIME_OFFSET_QUERIES_MAX_WORKERS = 1
+
+# When time offset queries run concurrently, maximum number of them that can run at
+# the same time against a given database, across all the requests served by a
+# process.
+TIME_OFFSET_QUERIES_MAX_PER_DATABASE = 4
+
 # SupersetClient HTTP retry configuration
 # Controls retry behavior for all HTTP requests made through SupersetClient
 # This helps handle transient server errors (like 502 Bad Gateway) automatically
@@ -1091,6 +1114,59 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# When the data cache misses, identical chart queries running concurrently, eg, when
+# the cache of a popular dashboard expires, can be coalesced so that only one of them
+# runs while the others wait for it to populate the cache. Set a timeout (in seconds)
+# to enable it: waiting requests run the query themselves after that long. The lock
+# is stored in the cache defined by `DATA_CACHE_CONFIG`, which needs to be shared
+# across processes, eg, Redis, for queries to be coalesced across workers.
+CHART_QUERY_SINGLE_FLIGHT_TIMEOUT = 0
+
+# Row level security filters are looked up in the metadata database every time a
+# query is built or its cache key is computed; they are memoized for the duration
+# of a request. Set a timeout (in seconds) to also cache them across requests and
+# processes in the cache defined by `CACHE_CONFIG`. Cached filters are invalidated
+# whenever an RLS filter or a role changes.
+RLS_FILTERS_CACHE_TIMEOUT = 0
+
+# The latest partitions of Presto, Trino and Hive tables are looked up with a query to
+# the warehouse when building `SELECT *` queries and table metadata, and when
+# rendering the `latest_partition` and `latest_sub_partition` macros. Lookups are
+# cached per process and table for this long (in seconds), and concurrent lookups for
+# the same table are coalesced; set to 0 to disable the cache. With
+# `LATEST_PARTITION_CACHE_REFRESH`, entries older than half the timeout are refreshed
+# in a background thread when read, so that the partitions of frequently queried
+# tables are never looked up while serving a request. Hits, misses and coalesced
+# lookups are reported to the `STATS_LOGGER` as `latest_partition_cache.*`.
+LATEST_PARTITION_CACHE_TIMEOUT = 60
+LATEST_PARTITION_CACHE_REFRESH = False
+# Maximum number of partition lookups to keep per process, in an LRU
+LATEST_PARTITION_CACHE_SIZE = 1024
+
+# Compression codecs for the query results cached when rendering charts, by cache
+# region: "default" for `CACHE_CONFIG` and "data" for `DATA_CACHE_CONFIG`. Supported
+# codecs are "zlib", "zstd", "lz4" (requires the `lz4` package) and "none"; values in
+# regions without a codec are stored as is. Cached values record their codec, so
+# entries written with another codec can still be read after changing it, eg:
+#
+#     CACHE_COMPRESSION = {"data": "zstd"}
+CACHE_COMPRESSION: dict[str, str] = {}
+
+# The permissions granted to the roles of a user, grouped by permission name, are
+# loaded once per request and used by the listing endpoints and `raise_for_access`
+# instead of querying the metadata database for every check. Set a timeout (in
+# seconds) to also cache them across requests and processes in the cache defined by
+# `CACHE_CONFIG`. Cached permissions are invalidated whenever a role, a permission,
+# a database or a dataset changes.
+PERMISSIONS_CACHE_TIMEOUT = 0
+
+# The datasets used by the charts of a dashboard, trimmed to the columns and metrics
+# the charts need, are serialized by `/api/v1/dashboard/<id>/datasets`. Set a timeout
+# (in seconds) to cache the serialized datasets in the cache defined by
+# `CACHE_CONFIG`. Cached payloads are keyed by the last modification of the dataset,
+# its database, columns and metrics, and of the charts using it.
+DASHBOARD_DATASETS_CACHE_TIMEOUT = 0
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -1170,14 +1246,15 @@ COLUMNAR_EXTENSIONS = {"parquet", "zip"}
 ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 
 # CSV Options: key/value pairs that will be passed as argument to DataFrame.to_csv
-# method.
+# method. Streaming CSV exports use the encoding and sep options.
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8-sig"}
 
 # CSV Streaming: row threshold for using streaming CSV exports
 # When row count >= this threshold, use streaming response instead of loading
 # all data into memory. Streaming provides real-time progress and handles
-# large datasets efficiently.
+# large datasets efficiently. Chart data exported as XLSX or Parquet is streamed
+# past the same threshold.
 CSV_STREAMING_ROW_THRESHOLD = 100000
 
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
@@ -1313,6 +1390,14 @@ SQLLAB_SCHEDULE_WARNING_MESSAGE = None
 # Max payload size (MB) for SQL Lab to prevent browser hangs with large results.
 SQLLAB_PAYLOAD_MAX_MB = None
 
+# When set, SQL Lab results stored in the results backend with Arrow (see
+# `RESULTS_BACKEND_USE_MSGPACK`) are split into chunks of this many rows, each one
+# stored under its own key next to a manifest. Fetching a range of rows, eg, with the
+# `offset` and `rows` arguments of the results API, then only reads the chunks
+# covering it, and `SQLLAB_PAYLOAD_MAX_MB` applies to each chunk instead of the
+# whole result.
+SQLLAB_RESULTS_CHUNK_ROWS = 0
+
 # Force refresh while auto-refresh in dashboard
 DASHBOARD_AUTO_REFRESH_MODE: Literal["fetch", "force"] = "force"
 # Dashboard auto refresh intervals
@@ -1351,6 +1436,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
         "superset.tasks.slack",
+        "superset.tasks.upload",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1370,6 +1456,10 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "reports.prune_log",
             "schedule": crontab(minute=0, hour=0),
         },
+        "prune_uploads": {
+            "task": "prune_uploads",
+            "schedule": crontab(minute=0, hour="*"),
+        },
         # Uncomment to enable pruning of the query table
         # "prune_query": {
         #     "task": "prune_query",
@@ -1495,6 +1585,13 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Compression codec for the SQL Lab payloads stored in the results backend: "zlib",
+# "zstd", "lz4" (requires the `lz4` package) or "none". Other codecs than zlib are
+# recorded in a header of each stored payload, so payloads written with another
+# codec can still be read after changing it. zlib payloads have no header, so that
+# versions predating this setting can read them, eg, during rolling upgrades.
+RESULTS_BACKEND_COMPRESSION = "zlib"
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1550,6 +1647,22 @@ REPORTS_CSV_NA_NAMES: list[str] | None = None
 # Smaller values use less memory but may be slower for large files
 READ_CSV_CHUNK_SIZE = 1000
 
+# Number of rows of uploaded files read, cast and written to the database at a
+# time, so that the memory used by uploads doesn't depend on the size of the files.
+# Excel files, and files uploaded to engines that can't append to a table (eg, Hive
+# and Google Sheets), are still read at once. Files of several chunks appended to or
+# replacing an existing table are first uploaded to a staging table in the same
+# schema, then copied to the table, so the database needs room for a second copy.
+UPLOAD_ROWS_PER_CHUNK = 100_000
+
+# Files uploaded with `run_async` (requires the GLOBAL_ASYNC_QUERIES feature flag) are
+# stored in this folder until they're uploaded by a Celery worker, so it must be
+# shared with the workers, and must not be served by the web server. Files are
+# deleted once uploaded; the `prune_uploads` task deletes those older than
+# UPLOAD_STAGING_MAX_AGE, left behind by tasks which were lost.
+UPLOAD_STAGING_FOLDER = os.path.join(DATA_DIR, "uploads")
+UPLOAD_STAGING_MAX_AGE = timedelta(days=1)
+
 # A dictionary of items that gets merged into the Jinja context for
 # SQL Lab. The existing context gets updated with this dictionary,
 # meaning values for existing keys get overwritten by the content of this
@@ -1560,6 +1673,12 @@ READ_CSV_CHUNK_SIZE = 1000
 # return native types.
 JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 
+# Maximum number of compiled Jinja templates to keep per process. Templates of
+# virtual datasets, adhoc expressions and SQL Lab queries are compiled once and
+# shared by all the template processors, in an LRU keyed by their source. Set to 0
+# to compile templates every time they're rendered.
+JINJA_TEMPLATE_CACHE_SIZE = 256
+
 # A dictionary of macro template processors (by engine) that gets merged into global
 # template processors. The existing template processors get updated with this
 # dictionary, which means the existing keys get overwritten by the content of this
@@ -1644,6 +1763,19 @@ DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # noqa: E501
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
 
+# The progress of queries running on engines reporting it (Presto, Trino, Hive) is
+# polled with an exponential backoff: the interval between polls starts at the one
+# configured for the engine, and doubles after each poll up to this many seconds.
+# Queries finishing between two polls are detected late by up to this interval on
+# Presto and Hive, so keep it short if most queries are fast.
+QUERY_PROGRESS_MAX_POLL_INTERVAL = 5
+
+# Progress updates of the queries running in a worker process are buffered and
+# written to the metadata database in a single transaction at most this often (in
+# seconds), which also reads back their status so that stopped queries are detected
+# without reading the metadata database on every poll.
+QUERY_PROGRESS_SYNC_INTERVAL = 1
+
 # Allow list of custom authentications for each DB engine.
 # Example:
 # from your.module import AuthClass
@@ -1692,6 +1824,48 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Maximum number of SQLAlchemy engines to keep per process for analytical databases.
+# By default a new engine using `NullPool` is created every time a database is
+# queried, so every query pays for dialect initialization and for a new connection.
+# When set to a positive number, engines are cached in an LRU registry keyed by
+# database, catalog, schema, the final URL and engine params (after
+# `DB_CONNECTION_MUTATOR`), and the effective user when engines are user-specific
+# (impersonation, OAuth2 or a connection mutator). Dialects pooling connections in a
+# queue pool by default use `DB_ENGINE_POOL_OPTIONS`. Engines are disposed when the
+# database is updated or deleted, and are not shared between forked worker
+# processes. Databases behind SSH tunnels are never cached.
+DB_ENGINE_CACHE_SIZE = 0
+
+# Pool options used by cached engines; `engine_params` from the database extra take
+# precedence. Note that the total number of connections per process can be up to
+# `DB_ENGINE_CACHE_SIZE * (pool_size + max_overflow)`.
+DB_ENGINE_POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+# Maximum number of processed adhoc SQL expressions to keep per process. Chart
+# queries validate and rewrite every custom SQL metric, column, ordering and
+# WHERE/HAVING clause with sqlglot; the results are cached in an LRU keyed by the
+# database engine and the rendered expression, so that dashboard loads and native
+# filter changes only compile them once. Expressions with sub-queries are never
+# cached, since they include the RLS predicates of the current user. Set to 0 to
+# disable the cache. Compilation and execution times of chart queries are reported
+# to the `STATS_LOGGER` as `sqla_query.time_compiling_query` and
+# `sqla_query.time_executing_query`.
+QUERY_PLAN_CACHE_SIZE = 1024
+
+# Maximum number of parsed SQL scripts to keep per process. The same SQL is parsed
+# several times while running a query (security checks, limits, RLS) and for every
+# chart query on a virtual dataset; parsed scripts are cached in an LRU keyed by SQL
+# and engine, and copied before being used. Large scripts use a lot of memory once
+# parsed, so lower the size if needed; set to 0 to disable the cache. Hits and
+# misses are reported to the `STATS_LOGGER` as `sql_parse_cache.hit` and
+# `sql_parse_cache.miss`.
+SQL_PARSE_CACHE_SIZE = 256
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -2225,6 +2399,19 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
 
+# Push of async query events for deployments without the websocket server:
+# `/api/v1/async_event/stream` streams the events as Server-Sent Events, and
+# `/api/v1/async_event/?timeout=<seconds>` waits for new events instead of returning
+# an empty list. Waiting connections hold a web server worker, so these require an
+# asynchronous worker class (eg, gevent) or threads, and their number is limited per
+# process; further streams get a 429 and further long polls return immediately.
+GLOBAL_ASYNC_QUERIES_STREAM_MAX_CONNECTIONS = 100
+# Maximum number of seconds a connection waits without sending anything: streams
+# send a heartbeat and long polls return an empty list
+GLOBAL_ASYNC_QUERIES_STREAM_HEARTBEAT = 15
+# Maximum duration of a stream in seconds, after which clients reconnect
+GLOBAL_ASYNC_QUERIES_STREAM_DURATION = 300
+
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
 # - Set 'CACHE_TYPE' to 'RedisSentinelCache' for RedisSentinelCacheBackend.
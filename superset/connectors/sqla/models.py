@@ -2099,3 +2099,24 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+for event_name in ("after_insert", "after_update", "after_delete"):
+    sa.event.listen(
+        RowLevelSecurityFilter,
+        event_name,
+        security_manager.rls_filters_after_change,
+    )
+    sa.event.listen(
+        security_manager.role_model,
+        event_name,
+        security_manager.rls_filters_after_change,
+    )
+    for model in (
+        SqlaTable,
+        security_manager.role_model,
+        security_manager.permission_model,
+        security_manager.viewmenu_model,
+        security_manager.permissionview_model,
+    ):
+        sa.event.listen(model, event_name, security_manager.permissions_after_change)
@@ -19,8 +19,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import uuid
 from datetime import datetime
 from io import BytesIO
+from pathlib import Path
 from typing import Any, cast
 from zipfile import is_zipfile, ZipFile
 
@@ -38,7 +41,8 @@ from flask_appbuilder.models.sqla.interface import SQLAInterface
 from marshmallow import ValidationError
 from sqlalchemy.exc import NoSuchTableError, OperationalError, SQLAlchemyError
 
-from superset import event_logger
+from superset import event_logger, is_feature_enabled
+from superset.async_events.async_query_manager import AsyncQueryTokenException
 from superset.commands.database.create import CreateDatabaseCommand
 from superset.commands.database.delete import DeleteDatabaseCommand
 from superset.commands.database.exceptions import (
@@ -121,13 +125,14 @@ from superset.exceptions import (
     SupersetSecurityException,
     TableNotFoundException,
 )
-from superset.extensions import security_manager
+from superset.extensions import async_query_manager, security_manager
 from superset.models.core import Database
 from superset.sql.parse import Table
 from superset.superset_typing import FlaskResponse
 from superset.utils import json
 from superset.utils.core import (
     error_msg_from_exception,
+    get_user_id,
     get_username,
     parse_js_uri_path_item,
 )
@@ -1743,6 +1748,12 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                     properties:
                       message:
                         type: string
+            202:
+              description: Async upload job metadata, when `run_async` is set
+              content:
+                application/json:
+                  schema:
+                    type: object
             400:
               $ref: '#/components/responses/400'
             401:
@@ -1767,17 +1778,64 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
                 reader = ColumnarReader(parameters)
             else:
                 return self.response_400(message="Unexpected Invalid file type")
-            UploadCommand(
+            command = UploadCommand(
                 pk,
                 parameters["table_name"],
                 parameters["file"],
                 parameters.get("schema"),
                 reader,
-            ).run()
+            )
+            if parameters.get("run_async"):
+                return self._upload_async(command, pk, parameters)
+            command.run()
         except ValidationError as error:
             return self.response_400(message=error.messages)
         return self.response(201, message="OK")
 
+    def _upload_async(
+        self,
+        command: UploadCommand,
+        pk: int,
+        parameters: dict[str, Any],
+    ) -> Response:
+        """
+        Store an uploaded file in ``UPLOAD_STAGING_FOLDER`` and upload it in a Celery
+        task.
+
+        The upload is validated before the task is submitted, and the events of the
+        job report the number of rows uploaded as the task runs.
+        """
+        if not is_feature_enabled("GLOBAL_ASYNC_QUERIES"):
+            return self.response_400(
+                message="Asynchronous uploads require the GLOBAL_ASYNC_QUERIES "
+                "feature flag"
+            )
+        try:
+            channel_id = async_query_manager.parse_channel_id_from_request(request)
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        command.validate()
+
+        file = parameters.pop("file")
+        folder = app.config["UPLOAD_STAGING_FOLDER"]
+        os.makedirs(folder, exist_ok=True)
+        file_path = os.path.join(folder, f"{uuid.uuid4()}{Path(file.filename).suffix}")
+        file.save(file_path)
+        try:
+            job_metadata = async_query_manager.submit_upload_job(
+                channel_id,
+                pk,
+                file_path,
+                file.filename,
+                parameters,
+                get_user_id(),
+            )
+        except Exception:
+            os.remove(file_path)
+            raise
+        return self.response(202, **job_metadata)
+
     @expose("/<int:pk>/function_names/", methods=("GET",))
     @protect()
     @safe
@@ -1147,6 +1147,13 @@ class UploadPostSchema(BaseUploadFilePostSchemaMixin):
         allow_none=False,
         metadata={"description": "The name of the table to be created/appended"},
     )
+    run_async = fields.Boolean(
+        metadata={
+            "description": "Upload the file in a background task and return "
+            "immediately, reporting the progress of the upload as async events. "
+            "Requires the GLOBAL_ASYNC_QUERIES feature flag."
+        }
+    )
 
     # ------------
     # CSV Schema
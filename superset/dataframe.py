@@ -17,14 +17,32 @@
 """Superset utilities for pandas.DataFrame."""
 
 import logging
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+from pandas.core.dtypes.cast import maybe_box_native
 
 from superset.utils.core import JS_MAX_INTEGER
 
 logger = logging.getLogger(__name__)
 
+# types that are returned unchanged by ``df_to_records``, other than missing values
+_PASSTHROUGH_TYPES = {
+    bool,
+    bytes,
+    date,
+    datetime,
+    Decimal,
+    float,
+    pd.Timestamp,
+    str,
+    type(None),
+}
+
 
 def _convert_big_integers(val: Any) -> Any:
     """
@@ -37,6 +55,43 @@ def _convert_big_integers(val: Any) -> Any:
     return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
 
 
+def _column_to_values(series: pd.Series) -> list[Any]:
+    """
+    Convert a column to a list of JSON friendly Python values.
+
+    Missing values are converted to None, and integers larger than
+    ``JS_MAX_INTEGER`` are cast to strings. Numeric columns are processed with NumPy,
+    and only object and extension columns are traversed in Python.
+
+    :param series: the column to process
+    :returns: the list of values in the column
+    """
+    dtype = series.dtype
+
+    if dtype == np.dtype(object) or isinstance(dtype, ExtensionDtype):
+        values = series.tolist()
+        # only box and inspect values one by one when the column contains types
+        # that might need conversion, eg, NumPy scalars or integers
+        if not _PASSTHROUGH_TYPES.issuperset(map(type, values)):
+            values = [_convert_big_integers(maybe_box_native(val)) for val in values]
+    elif dtype.kind in "iu":
+        array = series.to_numpy()
+        values = array.tolist()
+        for index in np.flatnonzero(
+            (array > JS_MAX_INTEGER) | (array < -JS_MAX_INTEGER)
+        ):
+            values[index] = str(values[index])
+        return values
+    elif dtype.kind in "fb":
+        values = series.to_numpy().tolist()
+    else:
+        values = list(series)
+
+    for index in np.flatnonzero(series.isna().to_numpy()):
+        values[index] = None
+    return values
+
+
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
@@ -51,12 +106,13 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         logger.warning(
             "DataFrame columns are not unique, some columns will be omitted."
         )
-    records = dframe.to_dict(orient="records")
 
-    for record in records:
-        for key in record:
-            record[key] = (
-                None if pd.isna(record[key]) else _convert_big_integers(record[key])
-            )
+    # like ``to_dict``, the last column wins when names are duplicated
+    positions = {column: i for i, column in enumerate(dframe.columns)}
+    if not positions:
+        return []
+
+    columns = list(positions)
+    values = [_column_to_values(dframe.iloc[:, i]) for i in positions.values()]
 
-    return records
+    return [dict(zip(columns, row, strict=False)) for row in zip(*values, strict=False)]
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -49,7 +50,7 @@ from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from marshmallow.validate import Range
 from sqlalchemy import column, select, types
-from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
@@ -86,6 +87,8 @@ from superset.utils.network import is_hostname_valid, is_port_open
 from superset.utils.oauth2 import encode_oauth2_state
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.connectors.sqla.models import TableColumn
     from superset.databases.schemas import TableMetadataResponse
     from superset.models.core import Database
@@ -481,6 +484,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     time_groupby_inline = False
     limit_method = LimitMethod.FORCE_LIMIT
     supports_multivalues_insert = False
+    # Does the engine spec implement a native bulk load path in `bulk_insert`, used
+    # instead of multi-values inserts when uploading dataframes
+    supports_bulk_insert = False
     allows_joins = True
     allows_subqueries = True
     allows_alias_in_select = True
@@ -536,6 +542,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether uploaded files can be appended to a table chunk by chunk, by calling
+    # `df_to_sql` with `if_exists="append"`; if False, files are uploaded at once
+    supports_file_upload_append = True
+
     # Is the DB engine spec able to change the default schema? This requires implementing  # noqa: E501
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -1329,13 +1339,82 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
+            to_sql_kwargs["method"] = cls.get_to_sql_method(engine.dialect)
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def get_to_sql_method(cls, dialect: Dialect) -> str | Callable[..., Any] | None:
+        """
+        Return the insertion method to pass to `pandas.DataFrame.to_sql`.
+
+        This is the native bulk load path of the engine if it has one, otherwise
+        multi-values inserts if they're supported, or one insert per row.
+
+        :param dialect: The SQLAlchemy dialect of the database
+        :return: The `method` argument of `pandas.DataFrame.to_sql`
+        """
+        if cls.supports_bulk_insert:
+            return cls.bulk_insert
+        if dialect.supports_multivalues_insert or cls.supports_multivalues_insert:
+            return "multi"
+        return None
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: SQLTable,
+        connection: Connection,
+        columns: list[str],
+        rows: Iterable[tuple[Any, ...]],
+    ) -> int | None:
+        """
+        Insert rows into a table, using the native bulk load path of the engine.
+
+        This is called by `pandas.DataFrame.to_sql` as its insertion method when
+        `supports_bulk_insert` is set, and should be overridden by engine specs
+        setting it. The default implementation runs a single `executemany` insert.
+
+        :param table: The pandas table the rows are inserted into
+        :param connection: The SQLAlchemy connection
+        :param columns: The names of the columns
+        :param rows: The rows to insert, as tuples of values
+        :return: The number of rows inserted, if known
+        """
+        result = connection.execute(
+            table.table.insert(),
+            [dict(zip(columns, row, strict=True)) for row in rows],
+        )
+        return result.rowcount
+
+    @staticmethod
+    def _process_bind_values(
+        table: SQLTable,
+        connection: Connection,
+        columns: list[str],
+        rows: Iterable[tuple[Any, ...]],
+    ) -> Iterable[tuple[Any, ...]]:
+        """
+        Convert rows with the bind processors of the types of their columns.
+
+        Bulk load paths going straight to the DB-API driver use this so that values
+        are stored the same way as when inserted through SQLAlchemy, eg. datetimes
+        in SQLite or JSON in PostgreSQL.
+        """
+        dialect = connection.dialect
+        processors = [
+            table.table.c[column].type.dialect_impl(dialect).bind_processor(dialect)
+            for column in columns
+        ]
+        if not any(processors):
+            return rows
+        return (
+            tuple(
+                value if process is None or value is None else process(value)
+                for process, value in zip(processors, row, strict=True)
+            )
+            for row in rows
+        )
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
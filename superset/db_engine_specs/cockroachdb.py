@@ -26,6 +26,8 @@ from superset.db_engine_specs.postgres import PostgresEngineSpec
 class CockroachDbEngineSpec(PostgresEngineSpec):
     engine = "cockroachdb"
     engine_name = "CockroachDB"
+    # `COPY ... FROM STDIN` with the CSV format is not supported by all versions
+    supports_bulk_insert = False
 
     metadata = {
         "description": (
@@ -27,6 +27,8 @@ class CloudflareD1EngineSpec(SqliteEngineSpec):
     engine = "d1"
     engine_name = "Cloudflare D1"
     default_driver = "d1"
+    # the D1 DB-API driver is not `sqlite3`, so use multi-values inserts
+    supports_bulk_insert = False
 
     metadata = {
         "description": "Cloudflare D1 is a serverless SQLite database.",
@@ -18,9 +18,11 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
+from uuid import uuid4
 
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -28,6 +30,7 @@ from flask import current_app as app
 from flask_babel import gettext as __
 from marshmallow import fields, Schema
 from sqlalchemy import types
+from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 
@@ -38,6 +41,8 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.utils.core import GenericDataType, get_user_agent, QuerySource
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database
 
 
@@ -197,6 +202,7 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
     sqlalchemy_uri_placeholder = "duckdb:////path/to/duck.db"
     supports_multivalues_insert = True
+    supports_bulk_insert = True
 
     metadata = {
         "description": (
@@ -348,6 +354,56 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: SQLTable,
+        connection: Connection,
+        columns: list[str],
+        rows: Iterable[tuple[Any, ...]],
+    ) -> int | None:
+        """
+        Insert rows by registering them as an Arrow table and selecting from it.
+
+        DuckDB scans Arrow tables natively, so that the rows are loaded in a single
+        `INSERT INTO ... SELECT` instead of being bound one by one. Columns that can't
+        be converted to Arrow arrays, eg. with mixed types, are inserted with the
+        default implementation.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa
+
+        data = list(zip(*rows, strict=True))
+        if not data:
+            return 0
+
+        try:
+            arrow_table = pa.table(
+                {f"_{i}": pa.array(values) for i, values in enumerate(data)}
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return super().bulk_insert(
+                table,
+                connection,
+                columns,
+                zip(*data, strict=True),
+            )
+
+        preparer = connection.dialect.identifier_preparer
+        view_name = f"__superset_bulk_insert_{uuid4().hex}"
+        sql = "INSERT INTO {table} ({columns}) SELECT * FROM {view}".format(  # noqa: S608
+            table=preparer.format_table(table.table),
+            columns=", ".join(preparer.quote(column) for column in columns),
+            view=view_name,
+        )
+        dbapi_connection = connection.connection
+        dbapi_connection.register(view_name, arrow_table)
+        try:
+            connection.exec_driver_sql(sql)
+        finally:
+            dbapi_connection.unregister(view_name)
+        return arrow_table.num_rows
+
     @staticmethod
     def get_extra_params(
         database: Database, source: QuerySource | None = None
@@ -37,7 +37,6 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.sql.expression import ColumnClause, Select
 
 from superset import db
-from superset.common.db_query_status import QueryStatus
 from superset.constants import TimeGrain
 from superset.db_engine_specs.base import BaseEngineSpec, DatabaseCategory
 from superset.db_engine_specs.presto import PrestoEngineSpec
@@ -46,6 +45,7 @@ from superset.extensions import cache_manager
 from superset.models.sql_lab import Query
 from superset.sql.parse import Table
 from superset.superset_typing import ResultSetColumnType
+from superset.utils.query_progress import get_poll_intervals, progress_tracker
 
 if TYPE_CHECKING:
     from superset.models.core import Database
@@ -96,6 +96,7 @@ class HiveEngineSpec(PrestoEngineSpec):
 
     supports_dynamic_schema = True
     supports_cross_catalog_queries = False
+    supports_file_upload_append = False
 
     metadata = {
         "description": (
@@ -364,70 +365,67 @@ class HiveEngineSpec(PrestoEngineSpec):
             hive.ttypes.TOperationState.INITIALIZED_STATE,
             hive.ttypes.TOperationState.RUNNING_STATE,
         )
+        if sleep_interval := app.config.get("HIVE_POLL_INTERVAL"):
+            logger.warning(
+                "HIVE_POLL_INTERVAL is deprecated and will be removed in 3.0. "
+                "Please use DB_POLL_INTERVAL_SECONDS instead"
+            )
+        else:
+            sleep_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 5)
+        poll_intervals = get_poll_intervals(sleep_interval)
         polled = cursor.poll()
         last_log_line = 0
         tracking_url = None
         job_id = None
         query_id = query.id
-        while polled.operationState in unfinished_states:
-            # Queries don't terminate when user clicks the STOP button on SQL LAB.
-            # Refresh session so that the `query.status` modified in stop_query in
-            # views/core.py is reflected here.
-            db.session.refresh(query)
-            query = db.session.query(type(query)).filter_by(id=query_id).one()
-            if query.status == QueryStatus.STOPPED:
-                cursor.cancel()
-                break
-
-            try:
-                logs = cursor.fetch_logs()
-                log = "\n".join(logs) if logs else ""
-            except Exception:  # pylint: disable=broad-except
-                logger.warning("Call to GetLog() failed")
-                log = ""
-
-            if log:
-                log_lines = log.splitlines()
-                progress = cls.progress(log_lines)
-                logger.info(
-                    "Query %s: Progress total: %s", str(query_id), str(progress)
-                )
-                needs_commit = False
-                if progress > query.progress:
-                    query.progress = progress
-                    needs_commit = True
-                if not tracking_url:
-                    tracking_url = cls.get_tracking_url_from_logs(log_lines)
-                    if tracking_url:
-                        job_id = tracking_url.split("/")[-2]
-                        logger.info(
-                            "Query %s: Found the tracking url: %s",
-                            str(query_id),
-                            tracking_url,
-                        )
-                        query.tracking_url = tracking_url
-                        logger.info("Query %s: Job id: %s", str(query_id), str(job_id))
-                        needs_commit = True
-                if job_id and len(log_lines) > last_log_line:
-                    # Wait for job id before logging things out
-                    # this allows for prefixing all log lines and becoming
-                    # searchable in something like Kibana
-                    for l in log_lines[last_log_line:]:  # noqa: E741
-                        logger.info("Query %s: [%s] %s", str(query_id), str(job_id), l)
-                    last_log_line = len(log_lines)
-                if needs_commit:
-                    db.session.commit()  # pylint: disable=consider-using-transaction
-            if sleep_interval := app.config.get("HIVE_POLL_INTERVAL"):
-                logger.warning(
-                    "HIVE_POLL_INTERVAL is deprecated and will be removed in 3.0. "
-                    "Please use DB_POLL_INTERVAL_SECONDS instead"
-                )
-            else:
-                sleep_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(
-                    cls.engine, 5
-                )
-            time.sleep(sleep_interval)
-            polled = cursor.poll()
+        with progress_tracker.track(query):
+            while polled.operationState in unfinished_states:
+                # Queries don't terminate when user clicks the STOP button on SQL LAB.
+                # The status modified in stop_query is synced by the progress tracker.
+                if progress_tracker.is_stopped(query):
+                    cursor.cancel()
+                    break
+
+                try:
+                    logs = cursor.fetch_logs()
+                    log = "\n".join(logs) if logs else ""
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning("Call to GetLog() failed")
+                    log = ""
+
+                if log:
+                    log_lines = log.splitlines()
+                    progress = cls.progress(log_lines)
+                    logger.info(
+                        "Query %s: Progress total: %s", str(query_id), str(progress)
+                    )
+                    if progress > (query.progress or 0):
+                        progress_tracker.update(query, progress)
+                    if not tracking_url:
+                        tracking_url = cls.get_tracking_url_from_logs(log_lines)
+                        if tracking_url:
+                            job_id = tracking_url.split("/")[-2]
+                            logger.info(
+                                "Query %s: Found the tracking url: %s",
+                                str(query_id),
+                                tracking_url,
+                            )
+                            query.tracking_url = tracking_url
+                            logger.info(
+                                "Query %s: Job id: %s", str(query_id), str(job_id)
+                            )
+                            db.session.commit()  # pylint: disable=consider-using-transaction
+                    if job_id and len(log_lines) > last_log_line:
+                        # Wait for job id before logging things out
+                        # this allows for prefixing all log lines and becoming
+                        # searchable in something like Kibana
+                        for l in log_lines[last_log_line:]:  # noqa: E741
+                            logger.info(
+                                "Query %s: [%s] %s", str(query_id), str(job_id), l
+                            )
+                        last_log_line = len(log_lines)
+                time.sleep(next(poll_intervals))
+                polled = cursor.poll()
 
     @classmethod
     def get_columns(
@@ -42,7 +42,6 @@ from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.sql.expression import ColumnClause, Select
 
 from superset import cache_manager, db, is_feature_enabled
-from superset.common.db_query_status import QueryStatus
 from superset.constants import TimeGrain
 from superset.db_engine_specs.base import BaseEngineSpec, DatabaseCategory
 from superset.db_engine_specs.exceptions import SupersetDBAPIProgrammingError
@@ -62,6 +61,8 @@ from superset.result_set import destringify
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
+from superset.utils.partition_cache import partition_cache
+from superset.utils.query_progress import get_poll_intervals, progress_tracker
 
 if TYPE_CHECKING:
     from superset.models.core import Database
@@ -589,6 +590,25 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_partition('foo_table')
         (['ds'], ('2018-01-01',))
         """
+        return partition_cache.get_or_load(
+            partition_cache.get_key(database, table, "latest_partition", show_first),
+            database,
+            lambda database: cls._get_latest_partition(
+                database,
+                table,
+                show_first,
+                indexes,
+            ),
+        )
+
+    @classmethod
+    def _get_latest_partition(
+        cls,
+        database: Database,
+        table: Table,
+        show_first: bool,
+        indexes: list[dict[str, Any]] | None,
+    ) -> tuple[list[str], list[str] | None]:
         if indexes is None:
             indexes = database.get_indexes(table)
 
@@ -655,6 +675,24 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
+        return partition_cache.get_or_load(
+            partition_cache.get_key(
+                database,
+                table,
+                "latest_sub_partition",
+                *sorted(kwargs.items()),
+            ),
+            database,
+            lambda database: cls._get_latest_sub_partition(database, table, **kwargs),
+        )
+
+    @classmethod
+    def _get_latest_sub_partition(
+        cls,
+        database: Database,
+        table: Table,
+        **kwargs: Any,
+    ) -> Any:
         indexes = database.get_indexes(table)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
@@ -1353,43 +1391,44 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         poll_interval = query.database.connect_args.get(
             "poll_interval", app.config["PRESTO_POLL_INTERVAL"]
         )
+        poll_intervals = get_poll_intervals(poll_interval)
         logger.info("Query %i: Polling the cursor for progress", query_id)
         polled = cursor.poll()
         # poll returns dict -- JSON status information or ``None``
         # if the query is done
         # https://github.com/dropbox/PyHive/blob/
         # b34bdbf51378b3979eaf5eca9e956f06ddc36ca0/pyhive/presto.py#L178
-        while polled:
-            # Update the object and wait for the kill signal.
-            stats = polled.get("stats", {})
-
-            query = db.session.query(type(query)).filter_by(id=query_id).one()
-            if query.status in [QueryStatus.STOPPED, QueryStatus.TIMED_OUT]:
-                cursor.cancel()
-                break
-
-            if stats:
-                state = stats.get("state")
+        with progress_tracker.track(query):
+            while polled:
+                # Update the object and wait for the kill signal.
+                stats = polled.get("stats", {})
 
-                # if already finished, then stop polling
-                if state == "FINISHED":
+                if progress_tracker.is_stopped(query):
+                    cursor.cancel()
                     break
 
-                completed_splits = float(stats.get("completedSplits"))
-                total_splits = float(stats.get("totalSplits"))
-                if total_splits and completed_splits:
-                    progress = 100 * (completed_splits / total_splits)
-                    logger.info(
-                        "Query %s progress: %s / %s splits",
-                        query_id,
-                        completed_splits,
-                        total_splits,
-                    )
-                    query.progress = max(query.progress, progress)
-                    db.session.commit()
-            time.sleep(poll_interval)
-            logger.info("Query %i: Polling the cursor for progress", query_id)
-            polled = cursor.poll()
+                if stats:
+                    state = stats.get("state")
+
+                    # if already finished, then stop polling
+                    if state == "FINISHED":
+                        break
+
+                    completed_splits = float(stats.get("completedSplits"))
+                    total_splits = float(stats.get("totalSplits"))
+                    if total_splits and completed_splits:
+                        progress = 100 * (completed_splits / total_splits)
+                        logger.info(
+                            "Query %s progress: %s / %s splits",
+                            query_id,
+                            completed_splits,
+                            total_splits,
+                        )
+                        if progress > (query.progress or 0):
+                            progress_tracker.update(query, progress)
+                time.sleep(next(poll_intervals))
+                logger.info("Query %i: Polling the cursor for progress", query_id)
+                polled = cursor.poll()
 
     @classmethod
     def _extract_error_message(cls, ex: Exception) -> str:
@@ -33,6 +33,8 @@ class ShillelaghEngineSpec(SqliteEngineSpec):
     drivers = {"apsw": "SQLite driver"}
     default_driver = "apsw"
     sqlalchemy_uri_placeholder = "shillelagh://"
+    # the shillelagh DB-API cursor does not support `executemany`
+    supports_bulk_insert = False
 
     allows_joins = True
     allows_subqueries = True
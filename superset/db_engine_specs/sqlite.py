@@ -18,12 +18,14 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy import types
+from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.reflection import Inspector
 
 from superset.constants import TimeGrain
@@ -31,6 +33,8 @@ from superset.db_engine_specs.base import BaseEngineSpec, DatabaseCategory
 from superset.errors import SupersetErrorType
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database
 
 
@@ -43,6 +47,7 @@ class SqliteEngineSpec(BaseEngineSpec):
 
     disable_ssh_tunneling = True
     supports_multivalues_insert = True
+    supports_bulk_insert = True
 
     metadata = {
         "description": "SQLite is a self-contained, serverless SQL database engine.",
@@ -145,6 +150,37 @@ class SqliteEngineSpec(BaseEngineSpec):
         """Need to disregard the schema for Sqlite"""
         return set(inspector.get_table_names())
 
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: SQLTable,
+        connection: Connection,
+        columns: list[str],
+        rows: Iterable[tuple[Any, ...]],
+    ) -> int | None:
+        """
+        Insert rows with a single `executemany` on the DB-API cursor.
+
+        SQLite has no bulk load statement, but going straight to the driver skips
+        building one parameter dictionary per row, and the SQL compilation of
+        multi-values inserts, which are limited to a few hundred rows each. Values
+        are still converted by the bind processors of their column types, so that
+        eg. datetimes are stored the same way as through SQLAlchemy.
+        """
+        preparer = connection.dialect.identifier_preparer
+        rows = cls._process_bind_values(table, connection, columns, rows)
+        sql = "INSERT INTO {table} ({columns}) VALUES ({values})".format(  # noqa: S608
+            table=preparer.format_table(table.table),
+            columns=", ".join(preparer.quote(column) for column in columns),
+            values=", ".join("?" for _ in columns),
+        )
+        cursor = connection.connection.cursor()
+        try:
+            cursor.executemany(sql, rows)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
     @classmethod
     def get_function_names(
         cls,
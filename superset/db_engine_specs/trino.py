@@ -30,7 +30,6 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchTableError
 
 from superset import db
-from superset.common.db_query_status import QueryStatus
 from superset.constants import QUERY_CANCEL_KEY, QUERY_EARLY_CANCEL_KEY
 from superset.db_engine_specs.base import (
     BaseEngineSpec,
@@ -49,6 +48,7 @@ from superset.sql.parse import Table
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import json
 from superset.utils.core import create_ssl_cert_file, get_user_agent, QuerySource
+from superset.utils.query_progress import get_poll_intervals, progress_tracker
 
 if TYPE_CHECKING:
     from superset.models.core import Database
@@ -278,45 +278,49 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
         terminal_states = {"FINISHED", "FAILED", "CANCELED"}
         state = "QUEUED"
         progress = 0.0
-        poll_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 1)
+        poll_intervals = get_poll_intervals(
+            app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 1)
+        )
         max_wait_time = app.config.get("SQLLAB_ASYNC_TIME_LIMIT_SEC", 21600)
         start_time = time.time()
-        while state not in terminal_states:
-            if time.time() - start_time > max_wait_time:
-                logger.warning("Query %d: Progress polling timed out", query.id)
-                break
-            # Check for errors raised in execute_thread
-            if execute_result is not None and execute_result.get("error"):
-                break
-
-            # Check if execute_event is set (thread completed)
-            if execute_event is not None and execute_event.is_set():
-                break
-
-            # if query cancelation was requested prior to the handle_cursor call, but
-            # the query was still executed, trigger the actual query cancelation now
-            if query.extra.get(QUERY_EARLY_CANCEL_KEY) or query.status in [
-                QueryStatus.STOPPED,
-                QueryStatus.TIMED_OUT,
-            ]:
-                cls.cancel_query(
-                    cursor=cursor,
-                    query=query,
-                    cancel_query_id=cancel_query_id,
-                )
-                break
+        with progress_tracker.track(query):
+            while state not in terminal_states:
+                if time.time() - start_time > max_wait_time:
+                    logger.warning("Query %d: Progress polling timed out", query.id)
+                    break
+                # Check for errors raised in execute_thread
+                if execute_result is not None and execute_result.get("error"):
+                    break
+
+                # Check if execute_event is set (thread completed)
+                if execute_event is not None and execute_event.is_set():
+                    break
+
+                # if query cancelation was requested prior to the handle_cursor call,
+                # but the query was still executed, trigger the actual query
+                # cancelation now
+                if progress_tracker.is_stopped(query):
+                    cls.cancel_query(
+                        cursor=cursor,
+                        query=query,
+                        cancel_query_id=cancel_query_id,
+                    )
+                    break
 
-            info = getattr(cursor, "stats", {}) or {}
-            state = info.get("state", "UNKNOWN")
-            completed_splits = float(info.get("completedSplits", 0))
-            total_splits = float(info.get("totalSplits", 1) or 1)
-            progress = math.floor((completed_splits / (total_splits or 1)) * 100)
+                info = getattr(cursor, "stats", {}) or {}
+                state = info.get("state", "UNKNOWN")
+                completed_splits = float(info.get("completedSplits", 0))
+                total_splits = float(info.get("totalSplits", 1) or 1)
+                progress = math.floor((completed_splits / (total_splits or 1)) * 100)
 
-            if progress != query.progress:
-                query.progress = progress
-                db.session.commit()  # pylint: disable=consider-using-transaction
+                if progress != query.progress:
+                    progress_tracker.update(query, progress)
 
-            time.sleep(poll_interval)
+                # wake up as soon as the query completes
+                if execute_event is not None:
+                    execute_event.wait(next(poll_intervals))
+                else:
+                    time.sleep(next(poll_intervals))
 
     @classmethod
     def execute_with_cursor(
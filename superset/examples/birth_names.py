@@ -84,7 +84,7 @@ def load_data(tbl_name: str, database: Database, sample: bool = False) -> None:
                 "state": String(10),
                 "name": String(255),
             },
-            method="multi",
+            method=database.db_engine_spec.get_to_sql_method(engine.dialect) or "multi",
             index=False,
         )
     logger.debug("Done loading table!")
@@ -157,7 +157,8 @@ def load_parquet_table(  # noqa: C901
                 schema=schema,
                 if_exists="replace",
                 chunksize=500,
-                method="multi",
+                method=database.db_engine_spec.get_to_sql_method(engine.dialect)
+                or "multi",
                 index=False,
             )
 
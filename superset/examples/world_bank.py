@@ -78,7 +78,8 @@ def load_world_bank_health_n_pop(  # pylint: disable=too-many-locals
                     "country_name": String(255),
                     "region": String(255),
                 },
-                method="multi",
+                method=database.db_engine_spec.get_to_sql_method(engine.dialect)
+                or "multi",
                 index=False,
             )
 
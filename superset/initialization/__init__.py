@@ -60,8 +60,9 @@ from superset.extensions import (
     talisman,
 )
 from superset.security import SupersetSecurityManager
-from superset.sql.parse import SQLGLOT_DIALECTS
+from superset.sql.parse import parse_cache, SQLGLOT_DIALECTS
 from superset.superset_typing import FlaskResponse
+from superset.utils import json
 from superset.utils.core import is_test, pessimistic_connection_handling
 from superset.utils.decorators import transaction
 from superset.utils.log import DBEventLogger, get_event_logger_from_cfg_value
@@ -689,7 +690,6 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         @self.superset_app.context_processor
         def get_common_bootstrap_data() -> dict[str, Any]:
             # Import here to avoid circular imports
-            from superset.utils import json
             from superset.views.base import common_bootstrap_payload
 
             def serialize_bootstrap_data() -> str:
@@ -727,6 +727,8 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         # Configuration of feature_flags must be done first to allow init features
         # conditionally
         self.configure_feature_flags()
+        self.configure_json_engine()
+        self.configure_lru_caches()
         self.configure_db_encrypt()
         self.setup_db()
 
@@ -918,6 +920,27 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
             self.config, self.superset_app.debug
         )
 
+    def configure_json_engine(self) -> None:
+        json.set_engine(self.config["JSON_ENGINE"])
+
+    def configure_lru_caches(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.jinja_context import CachedSandboxedEnvironment
+        from superset.utils.engine_cache import engine_cache
+        from superset.utils.partition_cache import partition_cache
+        from superset.utils.query_plan_cache import query_plan_cache
+
+        parse_cache.configure(
+            self.config["SQL_PARSE_CACHE_SIZE"],
+            self.config["STATS_LOGGER"],
+        )
+        query_plan_cache.configure(self.config["QUERY_PLAN_CACHE_SIZE"])
+        CachedSandboxedEnvironment.code_cache.configure(
+            self.config["JINJA_TEMPLATE_CACHE_SIZE"]
+        )
+        partition_cache.configure(self.config["LATEST_PARTITION_CACHE_SIZE"])
+        engine_cache.configure(self.config["DB_ENGINE_CACHE_SIZE"])
+
     def configure_db_encrypt(self) -> None:
         encrypted_field_factory.init_app(self.superset_app)
 
@@ -20,16 +20,26 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Hashable
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
+from types import CodeType
 from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
 
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import (
+    DebugUndefined,
+    Environment,
+    nodes,
+    TemplateSyntaxError,
+    UndefinedError,
+)
+from jinja2.compiler import CodeGenerator, Frame
 from jinja2.exceptions import SecurityError
+from jinja2.lexer import newline_re
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
@@ -57,6 +67,7 @@ from superset.utils.core import (
     get_username,
     merge_extra_filters,
 )
+from superset.utils.lru import LRUCache
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -650,6 +661,96 @@ def to_datetime(
     return datetime.strptime(value, format)
 
 
+class RuntimeFilterCodeGenerator(CodeGenerator):
+    """
+    Code generator evaluating filters at render time.
+
+    Jinja evaluates constant expressions in the output at compile time, calling the
+    filters of the environment compiling the template. Only literals are evaluated,
+    so that the compiled code can be rendered in other environments.
+    """
+
+    def _output_child_to_const(
+        self,
+        node: nodes.Expr,
+        frame: Frame,
+        finalize: Any,
+    ) -> str:
+        if not isinstance(node, (nodes.TemplateData, nodes.Const)):
+            raise nodes.Impossible()
+        return super()._output_child_to_const(node, frame, finalize)
+
+
+class CachedSandboxedEnvironment(SandboxedEnvironment):
+    """
+    Sandboxed environment sharing compiled templates between its instances.
+
+    A new environment is created for every template processor, so templates would
+    otherwise be parsed and compiled on every query. The compiled code of a template
+    only depends on its source and on the filters and tests of the environment, so
+    it's kept in a bounded LRU shared by all instances, and bound to the environment
+    and the context at render time.
+
+    Constant folding is disabled, since it calls filters at compile time, and some
+    filters, like ``where_in``, depend on the database of the processor.
+    """
+
+    code_generator_class = RuntimeFilterCodeGenerator
+
+    # sized by `JINJA_TEMPLATE_CACHE_SIZE`
+    code_cache: LRUCache[Hashable, CodeType] = LRUCache()
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs["optimized"] = False
+        super().__init__(**kwargs)
+
+    def compile(  # type: ignore[override]
+        self,
+        source: Any,
+        name: str | None = None,
+        filename: str | None = None,
+        raw: bool = False,
+        defer_init: bool = False,
+    ) -> Any:
+        if not isinstance(source, str) or name or filename or raw or defer_init:
+            return super().compile(source, name, filename, raw, defer_init)
+
+        key = (type(self), tuple(self.filters), tuple(self.tests), source)
+        if (code := self.code_cache.get(key)) is not None:
+            return code
+
+        code = super().compile(source)
+        self.code_cache.set(key, code)
+        return code
+
+    def is_static(self, source: Any) -> bool:
+        """
+        Return whether a source has no Jinja syntax, and can be rendered as is.
+        """
+        if not isinstance(source, str):
+            return False
+        delimiters = (
+            self.block_start_string,
+            self.variable_start_string,
+            self.comment_start_string,
+            self.line_statement_prefix,
+            self.line_comment_prefix,
+        )
+        return not any(delimiter and delimiter in source for delimiter in delimiters)
+
+    def render_static(self, source: str) -> str:
+        """
+        Render a source without Jinja syntax, without compiling it.
+
+        Like the Jinja lexer, this normalizes the newlines and removes the trailing
+        one, so that the output is the same as rendering the template.
+        """
+        lines = newline_re.split(source)[::2]
+        if not self.keep_trailing_newline and lines[-1] == "":
+            del lines[-1]
+        return self.newline_sequence.join(lines)
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -680,7 +781,9 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
-        self.env: Environment = SandboxedEnvironment(undefined=DebugUndefined)
+        self.env: CachedSandboxedEnvironment = CachedSandboxedEnvironment(
+            undefined=DebugUndefined
+        )
         self.set_context(**kwargs)
 
         # custom filters
@@ -704,6 +807,9 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
+        if self.env.is_static(sql):
+            return self.env.render_static(sql)
+
         try:
             template = self.env.from_string(sql)
         except (
@@ -941,6 +1047,9 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
+        if self.env.is_static(sql):
+            return self.env.render_static(sql)
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
@@ -954,6 +1063,9 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
+        if self.env.is_static(sql):
+            return self.env.render_static(sql)
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
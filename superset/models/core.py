@@ -57,7 +57,7 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
 from superset_core.api.models import Database as CoreDatabase
@@ -85,6 +85,8 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_query_source_from_request, get_username
+from superset.utils.engine_cache import engine_cache, freeze_engine_params
+from superset.utils.hashing import hash_from_str
 from superset.utils.oauth2 import (
     check_for_oauth2,
     get_oauth2_access_token,
@@ -490,7 +492,11 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+
+        # engines behind SSH tunnels are bound to an ephemeral local port, so they
+        # can't be reused once the tunnel is closed
+        use_engine_cache = engine_cache.is_enabled() and not self.ssh_tunnel
+        if not use_engine_cache and nullpool:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -543,10 +549,63 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
                 security_manager,
                 source,
             )
-        try:
-            return create_engine(sqlalchemy_url, **engine_kwargs)
-        except Exception as ex:
-            raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        def factory() -> Engine:
+            try:
+                if use_engine_cache:
+                    engine_kwargs.update(
+                        self._get_pool_options(sqlalchemy_url, engine_kwargs)
+                    )
+                return create_engine(sqlalchemy_url, **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        if not use_engine_cache:
+            return factory()
+
+        # ``changed_on`` is part of the key so that other processes, which don't see
+        # the ORM events fired when the database is updated, also stop using stale
+        # engines; the user is only part of it when engines are user-specific, so
+        # that users share the pool of the database otherwise
+        user_specific = bool(
+            self.impersonate_user or access_token or DB_CONNECTION_MUTATOR
+        )
+        key = (
+            self.id,
+            self.changed_on,
+            catalog,
+            schema,
+            effective_username if user_specific else None,
+            hash_from_str(
+                sqlalchemy_url.render_as_string(hide_password=False)
+                + repr(freeze_engine_params(engine_kwargs))
+            ),
+        )
+        return engine_cache.get_or_create(key, factory)
+
+    @staticmethod
+    def _get_pool_options(
+        sqlalchemy_url: URL,
+        engine_kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Return the `DB_ENGINE_POOL_OPTIONS` missing from the engine params.
+
+        The options are only valid for queue pools, so they're not used for dialects
+        with another default pool class, eg, SQLite, nor when a pool class is given.
+        """
+        poolclass = engine_kwargs.get("poolclass")
+        if poolclass is None:
+            dialect = sqlalchemy_url.get_dialect()
+            poolclass = dialect.get_pool_class(sqlalchemy_url)
+        if not issubclass(poolclass, QueuePool):
+            return {}
+
+        return {
+            key: value
+            for key, value in app.config["DB_ENGINE_POOL_OPTIONS"].items()
+            if key not in engine_kwargs
+        }
 
     def add_database_to_signature(
         self,
@@ -1327,6 +1386,20 @@ class Database(CoreDatabase, AuditMixinNullable, ImportExportMixin):  # pylint:
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+for event_name in ("after_insert", "after_update", "after_delete"):
+    sqla.event.listen(Database, event_name, security_manager.permissions_after_change)
+
+
+def invalidate_engine_cache(
+    mapper: Any,  # pylint: disable=unused-argument
+    connection: Connection,  # pylint: disable=unused-argument
+    target: Database,
+) -> None:
+    engine_cache.invalidate(target.id)
+
+
+sqla.event.listen(Database, "after_update", invalidate_engine_cache)
+sqla.event.listen(Database, "after_delete", invalidate_engine_cache)
 
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
@@ -19,7 +19,7 @@ from __future__ import annotations
 import logging
 import uuid
 from collections import defaultdict, deque
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import sqlalchemy as sqla
 from flask import current_app as app
@@ -31,21 +31,30 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    func,
     Integer,
+    select,
     String,
     Table,
     Text,
     UniqueConstraint,
 )
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import relationship, subqueryload
+from sqlalchemy.orm import joinedload, relationship, selectinload, subqueryload
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.sql.elements import BinaryExpression
 from superset_core.api.models import Dashboard as CoreDashboard
 
 from superset import db, is_feature_enabled, security_manager
-from superset.connectors.sqla.models import BaseDatasource, SqlaTable
+from superset.connectors.sqla.models import (
+    BaseDatasource,
+    SqlaTable,
+    SqlMetric,
+    TableColumn,
+)
 from superset.daos.datasource import DatasourceDAO
+from superset.extensions import cache_manager
+from superset.models.core import Database
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.models.slice import Slice
 from superset.models.user_attributes import UserAttribute
@@ -53,11 +62,62 @@ from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.tasks.utils import get_current_user
 from superset.thumbnails.digest import get_dashboard_digest
 from superset.utils import core as utils, json
+from superset.utils.hashing import hash_from_str
 
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 
 
+def get_dataset_payload_cache_keys(
+    slices_by_datasource: dict[tuple[type[BaseDatasource], int], set[Slice]],
+) -> dict[tuple[type[BaseDatasource], int], str]:
+    """
+    Compute the cache keys of the datasets payloads trimmed for a set of slices.
+
+    The keys change whenever the dataset, its database, its columns or its metrics,
+    or any of the slices, change; they're computed in a single query, without
+    loading the datasets.
+
+    :param slices_by_datasource: The slices using each datasource
+    :returns: The cache key of each dataset payload
+    """
+    dataset_ids = [
+        datasource_id
+        for cls_model, datasource_id in slices_by_datasource
+        if cls_model is SqlaTable
+    ]
+    if not dataset_ids:
+        return {}
+
+    children_versions = [
+        select(aggregate).where(model.table_id == SqlaTable.id).scalar_subquery()
+        for model in (TableColumn, SqlMetric)
+        for aggregate in (func.max(model.changed_on), func.count(model.id))
+    ]
+    rows = (
+        db.session.query(
+            SqlaTable.id,
+            SqlaTable.changed_on,
+            Database.changed_on,
+            *children_versions,
+        )
+        .join(Database, SqlaTable.database_id == Database.id)
+        .filter(SqlaTable.id.in_(dataset_ids))
+        .all()
+    )
+
+    cache_keys = {}
+    for dataset_id, *versions in rows:
+        key = (SqlaTable, dataset_id)
+        slices = sorted(
+            (slc.id, str(slc.changed_on)) for slc in slices_by_datasource[key]
+        )
+        digest = hash_from_str(str((versions, slices)))
+        cache_keys[key] = f"dataset_payload:{dataset_id}:{digest}"
+
+    return cache_keys
+
+
 def copy_dashboard(_mapper: Mapper, _connection: Connection, target: Dashboard) -> None:
     dashboard_id = app.config["DASHBOARD_TEMPLATE_ID"]
     if dashboard_id is None:
@@ -222,6 +282,27 @@ class Dashboard(CoreDashboard, AuditMixinNullable, ImportExportMixin):
             .all()
         }
 
+    @staticmethod
+    def _fetch_datasources(
+        cls_model: type[BaseDatasource],
+        datasource_ids: Iterable[int],
+    ) -> list[BaseDatasource]:
+        """
+        Fetch the datasources of a given type for serialization.
+
+        The relationships of datasets are eagerly loaded, so that the number of
+        queries doesn't grow with the number of datasets.
+        """
+        query = db.session.query(cls_model).filter(cls_model.id.in_(datasource_ids))
+        if issubclass(cls_model, SqlaTable):
+            query = query.options(
+                joinedload(SqlaTable.database),
+                selectinload(SqlaTable.columns),
+                selectinload(SqlaTable.metrics),
+                selectinload(SqlaTable.owners),
+            )
+        return query.all()
+
     @property
     def charts(self) -> list[str]:
         return [slc.chart for slc in self.slices]
@@ -287,18 +368,33 @@ class Dashboard(CoreDashboard, AuditMixinNullable, ImportExportMixin):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: list[dict[str, Any]] = []
-
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
-            )
-
-            if datasource:
+        result: dict[tuple[type[BaseDatasource], int], dict[str, Any]] = {}
+        cache_keys: dict[tuple[type[BaseDatasource], int], str] = {}
+        stats_logger = app.config["STATS_LOGGER"]
+
+        if timeout := app.config["DASHBOARD_DATASETS_CACHE_TIMEOUT"]:
+            cache_keys = get_dataset_payload_cache_keys(slices_by_datasource)
+            cached_payloads = cache_manager.cache.get_many(*cache_keys.values())
+            for key, payload in zip(cache_keys, cached_payloads, strict=True):
+                if payload is not None:
+                    stats_logger.incr("dashboard_datasets_cache.hit")
+                    result[key] = payload
+
+        missing: dict[type[BaseDatasource], set[int]] = defaultdict(set)
+        for cls_model, datasource_id in slices_by_datasource:
+            if (cls_model, datasource_id) not in result:
+                missing[cls_model].add(datasource_id)
+
+        for cls_model, datasource_ids in missing.items():
+            for datasource in self._fetch_datasources(cls_model, datasource_ids):
+                key = (cls_model, datasource.id)
                 # Filter out unneeded fields from the datasource payload
-                result.append(datasource.data_for_slices(slices))
+                result[key] = datasource.data_for_slices(slices_by_datasource[key])
+                if key in cache_keys:
+                    stats_logger.incr("dashboard_datasets_cache.miss")
+                    cache_manager.cache.set(cache_keys[key], result[key], timeout)
 
-        return result
+        return [result[key] for key in slices_by_datasource if key in result]
 
     @property
     def params(self) -> str:
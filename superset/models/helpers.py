@@ -27,6 +27,7 @@ import re
 import uuid
 from collections.abc import Hashable
 from datetime import datetime, timedelta
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -98,6 +99,7 @@ from superset.superset_typing import (
     QueryObjectDict,
 )
 from superset.utils import core as utils, json
+from superset.utils.concurrency import get_semaphore, run_in_app_context
 from superset.utils.core import (
     DateColumn,
     DTTM_ALIAS,
@@ -119,6 +121,8 @@ from superset.utils.core import (
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
 from superset.utils.dates import datetime_to_epoch
+from superset.utils.decorators import stats_timing
+from superset.utils.query_plan_cache import query_plan_cache
 from superset.utils.rls import apply_rls
 
 
@@ -131,6 +135,7 @@ class ValidationResultDict(TypedDict):
 
 if TYPE_CHECKING:
     from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_manager import QueryCacheManager
     from superset.connectors.sqla.models import SqlMetric, TableColumn
     from superset.db_engine_specs import BaseEngineSpec
     from superset.models.core import Database
@@ -155,6 +160,18 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class PendingTimeOffset(NamedTuple):
+    """A time offset query that wasn't found in the cache and needs to run"""
+
+    offset: str
+    position: int
+    query_object_dict: dict[str, Any]
+    query_object: QueryObject
+    metrics_mapping: dict[str, str]
+    cache_key: str | None
+    cache: QueryCacheManager
+
+
 # Keys used to filter QueryObjectDict for get_sqla_query parameters
 SQLA_QUERY_KEYS = {
     "apply_fetch_values_predicate",
@@ -202,20 +219,42 @@ def validate_adhoc_subquery(
     nested sub-queries with table
     """
     parsed_statement = SQLStatement(sql, engine)
-    if parsed_statement.has_subquery():
-        if not is_feature_enabled("ALLOW_ADHOC_SUBQUERY"):
-            raise SupersetSecurityException(
-                SupersetError(
-                    error_type=SupersetErrorType.ADHOC_SUBQUERY_NOT_ALLOWED_ERROR,
-                    message=_("Custom SQL fields cannot contain sub-queries."),
-                    level=ErrorLevel.ERROR,
-                )
-            )
+    check_adhoc_subquery(parsed_statement, database, catalog, default_schema)
+    return parsed_statement.format()
 
-        # enforce RLS rules in any relevant tables
-        apply_rls(database, catalog, default_schema, parsed_statement)
 
-    return parsed_statement.format()
+def check_adhoc_subquery(
+    parsed_statement: SQLStatement,
+    database: Database,
+    catalog: str | None,
+    default_schema: str,
+) -> bool:
+    """
+    Check if a parsed adhoc SQL statement contains sub-queries.
+
+    If sub-queries are allowed, the RLS predicates that apply to the current user are
+    inserted in the statement.
+
+    :param parsed_statement: parsed adhoc sql expression
+    :returns: whether the statement contains sub-queries
+    :raise SupersetSecurityException if the statement contains sub-queries and
+    they're not allowed
+    """
+    if not parsed_statement.has_subquery():
+        return False
+
+    if not is_feature_enabled("ALLOW_ADHOC_SUBQUERY"):
+        raise SupersetSecurityException(
+            SupersetError(
+                error_type=SupersetErrorType.ADHOC_SUBQUERY_NOT_ALLOWED_ERROR,
+                message=_("Custom SQL fields cannot contain sub-queries."),
+                level=ErrorLevel.ERROR,
+            )
+        )
+
+    # enforce RLS rules in any relevant tables
+    apply_rls(database, catalog, default_schema, parsed_statement)
+    return True
 
 
 def json_to_dict(json_str: str) -> dict[Any, Any]:
@@ -919,19 +958,32 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
     ) -> Optional[str]:
         if template_processor and expression:
             expression = template_processor.process_template(expression)
-        if expression:
-            expression = validate_adhoc_subquery(
-                expression,
-                self.database,
-                self.catalog,
-                schema,
-                engine,
-            )
-            try:
-                expression = sanitize_clause(expression, engine)
-            except QueryClauseValidationException as ex:
-                raise QueryObjectValidationError(ex.message) from ex
-        return expression
+        if not expression:
+            return expression
+
+        stats_logger = app.config["STATS_LOGGER"]
+        use_cache = query_plan_cache.is_enabled()
+        if use_cache and (processed := query_plan_cache.get((engine, expression))):
+            stats_logger.incr("query_plan_cache.hit")
+            return processed
+
+        parsed_statement = SQLStatement(expression, engine)
+        has_subquery = check_adhoc_subquery(
+            parsed_statement,
+            self.database,
+            self.catalog,
+            schema,
+        )
+        try:
+            processed = sanitize_clause(parsed_statement.format(), engine)
+        except QueryClauseValidationException as ex:
+            raise QueryObjectValidationError(ex.message) from ex
+
+        # sub-queries have RLS predicates for the current user, and can't be shared
+        if use_cache and not has_subquery:
+            stats_logger.incr("query_plan_cache.miss")
+            query_plan_cache.set((engine, expression), processed)
+        return processed
 
     def _process_select_expression(
         self,
@@ -1148,8 +1200,10 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         This method is the unified entry point for query execution across all
         datasource types (Query, SqlaTable, etc.).
         """
+        stats_logger = app.config["STATS_LOGGER"]
         qry_start_dttm = datetime.now()
-        query_str_ext = self.get_query_str_extended(query_obj)
+        with stats_timing("sqla_query.time_compiling_query", stats_logger):
+            query_str_ext = self.get_query_str_extended(query_obj)
         sql = query_str_ext.sql
         status = QueryStatus.SUCCESS
         errors = None
@@ -1179,12 +1233,13 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             return df
 
         try:
-            df = self.database.get_df(
-                sql,
-                self.catalog,
-                self.schema,
-                mutator=assign_column_label,
-            )
+            with stats_timing("sqla_query.time_executing_query", stats_logger):
+                df = self.database.get_df(
+                    sql,
+                    self.catalog,
+                    self.schema,
+                    mutator=assign_column_label,
+                )
         except Exception as ex:  # pylint: disable=broad-except
             # Re-raise SupersetErrorException (includes OAuth2RedirectError)
             # to bubble up to API layer
@@ -1347,6 +1402,21 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         return result
 
+    def _query_in_thread_session(self, query_obj: QueryObjectDict) -> QueryResult:
+        """
+        Execute a query from a worker thread.
+
+        Sessions, and the objects attached to them, can't be shared across threads,
+        so the datasource is loaded again in the session of the worker thread, where
+        its relationships (columns, metrics, database) are lazy loaded safely.
+        """
+        if not sa.inspect(self).persistent:
+            return self.query(query_obj)
+        datasource = db.session.get(type(self), self.id)
+        if datasource is None:
+            raise QueryObjectValidationError(_("The datasource no longer exists"))
+        return datasource.query(query_obj)
+
     def processing_time_offsets(  # pylint: disable=too-many-locals,too-many-statements # noqa: C901
         self,
         df: pd.DataFrame,
@@ -1377,6 +1447,8 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        offset_order: list[str] = []
+        pending_offsets: list[PendingTimeOffset] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -1566,6 +1638,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
             cache = QueryCacheManager.get(cache_key, CacheRegion.DATA, force_cache)
 
+            offset_order.append(offset)
             if cache.is_loaded:
                 offset_dfs[offset] = cache.df
                 queries.append(cache.query)
@@ -1587,11 +1660,47 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 query_object_clone_dct["row_limit"] = app.config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            # Call the unified query method on the datasource
-            result = self.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            # defer execution so that the offsets missing from the cache can run
+            # concurrently; the clone is copied since it's reused across offsets
+            queries.append("")
             cache_keys.append(None)
+            pending_offsets.append(
+                PendingTimeOffset(
+                    offset=offset,
+                    position=len(queries) - 1,
+                    query_object_dict=query_object_clone_dct,
+                    query_object=copy.copy(query_object_clone),
+                    metrics_mapping=metrics_mapping,
+                    cache_key=cache_key,
+                    cache=cache,
+                )
+            )
+
+        # Call the unified query method on the datasource, running the offset
+        # queries concurrently when enabled
+        max_workers = app.config["TIME_OFFSET_QUERIES_MAX_WORKERS"]
+        query = (
+            self._query_in_thread_session
+            if max_workers > 1 and len(pending_offsets) > 1
+            else self.query
+        )
+        results = run_in_app_context(
+            [partial(query, pending.query_object_dict) for pending in pending_offsets],
+            max_workers=max_workers,
+            semaphore=get_semaphore(
+                ("time_offsets", self.database.id),
+                app.config["TIME_OFFSET_QUERIES_MAX_PER_DATABASE"],
+            )
+            if max_workers > 1
+            else None,
+        )
+
+        for pending, result in zip(pending_offsets, results, strict=True):
+            offset = pending.offset
+            metrics_mapping = pending.metrics_mapping
+            cache_key = pending.cache_key
+            cache = pending.cache
+            queries[pending.position] = result.query
 
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
@@ -1604,7 +1713,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             else:
                 # 1. normalize df, set dttm column
                 offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+                    offset_metrics_df, pending.query_object
                 )
 
                 # 2. rename extra query columns
@@ -1625,6 +1734,9 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 )
             offset_dfs[offset] = offset_metrics_df
 
+        # keep the join order deterministic, following the order of the offsets
+        offset_dfs = {offset: offset_dfs[offset] for offset in offset_order}
+
         if offset_dfs:
             df = self.join_offset_dfs(
                 df,
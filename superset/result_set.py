@@ -18,7 +18,8 @@
 
 import datetime
 import logging
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Iterable, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -111,7 +112,6 @@ class SupersetResultSet:
         column_names: list[str] = []
         pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
         stringified_arr: NDArray[Any]
 
         if cursor_description:
@@ -128,17 +128,26 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
+        # only do expensive recasting if rows can't be indexed
+        if data and (
+            not isinstance(data, list) or not isinstance(data[0], (tuple, list))
+        ):
             data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
 
-        for column in column_names:
+        # transpose the rows into columns; this only copies references to the values,
+        # which are then converted straight into Arrow arrays
+        if data and set(map(len, data)) != {len(column_names)}:
+            raise ValueError(
+                f"All rows must have {len(column_names)} values to match the cursor "
+                "description"
+            )
+        columns: list[Sequence[Any]] = [
+            list(map(itemgetter(i), data)) for i in range(len(column_names))
+        ]
+
+        for i, values in enumerate(columns):
             try:
-                pa_data.append(pa.array(array[column].tolist()))
+                pa_data.append(pa.array(values))
             except (
                 pa.lib.ArrowInvalid,
                 pa.lib.ArrowTypeError,
@@ -148,35 +157,36 @@ class SupersetResultSet:
                 # https://issues.apache.org/jira/browse/ARROW-7855
             ):
                 # attempt serialization of values as strings
-                stringified_arr = stringify_values(array[column])
+                stringified_arr = stringify_values(self.to_object_array(values))
                 pa_data.append(pa.array(stringified_arr.tolist()))
 
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series, utc=True)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+            if pa.types.is_nested(pa_data[i].type):
+                # TODO: revisit nested column serialization once nested types
+                #  are added as a natively supported column type in Superset
+                #  (superset.utils.core.GenericDataType).
+                stringified_arr = stringify_values(self.to_object_array(values))
+                pa_data[i] = pa.array(stringified_arr.tolist())
+
+            elif pa.types.is_temporal(pa_data[i].type):
+                # workaround for bug converting
+                # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+                # related: https://issues.apache.org/jira/browse/ARROW-5248
+                sample = self.first_nonempty(values)
+                if sample and isinstance(sample, datetime.datetime):
+                    try:
+                        if sample.tzinfo:
+                            tz = sample.tzinfo
+                            series = pd.Series(self.to_object_array(values))
+                            series = pd.to_datetime(series, utc=True)
+                            pa_data[i] = pa.Array.from_pandas(
+                                series,
+                                type=pa.timestamp("ns", tz=tz),
+                            )
+                    except Exception as ex:  # pylint: disable=broad-except
+                        logger.exception(ex)
+
+            # release the Python values as soon as the column has been converted
+            columns[i] = ()
 
         if not pa_data:
             column_names = []
@@ -215,9 +225,16 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Iterable[Any]) -> Any:
         return next((i for i in items if i), None)
 
+    @staticmethod
+    def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+        """
+        Build a 1D object array, without NumPy trying to unpack nested sequences.
+        """
+        return np.fromiter(values, dtype=object, count=len(values))
+
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
         column_spec = self.db_engine_spec.get_column_spec(db_type_str)
         if column_spec is None:
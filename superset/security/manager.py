@@ -20,19 +20,17 @@
 import logging
 import re
 import time
+import uuid
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_request_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.models.filters import BaseFilter
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
-    assoc_group_role,
     assoc_permissionview_role,
-    assoc_user_group,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -48,12 +46,11 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import eagerload
+from sqlalchemy.orm import eagerload, object_session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
-from sqlalchemy.sql import exists
 
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -85,7 +82,6 @@ if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
     from superset.connectors.sqla.models import (
         BaseDatasource,
-        RowLevelSecurityFilter,
         SqlaTable,
     )
     from superset.explorables.base import Explorable
@@ -111,6 +107,19 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class RLSFilterClause(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+# key in the cache holding the current version of the cached RLS filters
+RLS_FILTERS_CACHE_VERSION_KEY = "rls_filters_version"
+
+# key in the cache holding the current version of the cached user permissions
+PERMISSIONS_CACHE_VERSION_KEY = "permissions_version"
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -567,7 +576,13 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         user = g.user
         if user.is_anonymous:
             return self.is_item_public(permission_name, view_name)
-        return self._has_view_access(user, permission_name, view_name)
+
+        roles = self.get_user_roles(user)
+        if any(role.name in self.builtin_roles for role in roles):
+            return self._has_view_access(user, permission_name, view_name)
+
+        permissions = self._get_role_permissions([role.id for role in roles])
+        return view_name in permissions.get(permission_name, ())
 
     def can_access_all_queries(self) -> bool:
         """
@@ -934,45 +949,153 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
-        base_query = (
-            self.session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
+        """
+        Return the names of the view menus the user has a given permission on.
+
+        :param permission_name: The FAB permission name
+        :returns: The view-menu names
+        """
+        if not g.user.is_anonymous:
+            if get_user_id() is None:
+                return set()
+            roles = self.get_user_roles(g.user)
+        elif public_role := self.get_public_role():
+            roles = [public_role]
+        else:
+            return set()
+
+        permissions = self._get_role_permissions([role.id for role in roles])
+        return set(permissions.get(permission_name, ()))
+
+    def _get_role_permissions(self, role_ids: list[int]) -> dict[str, set[str]]:
+        """
+        Return the view menus granted to a set of roles, grouped by permission name.
+
+        Permissions are memoized for the duration of the request and, when
+        `PERMISSIONS_CACHE_TIMEOUT` is set, in the cache defined by `CACHE_CONFIG`.
+
+        :param role_ids: The IDs of the roles
+        :returns: A mapping of permission names to view-menu names
+        """
+        key = ",".join(str(role_id) for role_id in sorted(set(role_ids)))
+        stats_logger = get_conf()["STATS_LOGGER"]
+
+        request_cache = self._get_permissions_request_cache()
+        if request_cache is not None and key in request_cache:
+            stats_logger.incr("permissions_cache.request.hit")
+            return request_cache[key]
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        shared_cache_key = None
+        permissions: Optional[dict[str, set[str]]] = None
+        if timeout := get_conf()["PERMISSIONS_CACHE_TIMEOUT"]:
+            version = self._get_cache_version(PERMISSIONS_CACHE_VERSION_KEY)
+            shared_cache_key = f"permissions:{version}:{key}"
+            permissions = cache_manager.cache.get(shared_cache_key)
+            stats_logger.incr(
+                "permissions_cache.hit"
+                if permissions is not None
+                else "permissions_cache.miss"
+            )
+
+        if permissions is None:
+            permissions = self._get_role_permissions_from_db(role_ids)
+            if shared_cache_key:
+                cache_manager.cache.set(shared_cache_key, permissions, timeout=timeout)
+
+        if request_cache is not None:
+            request_cache[key] = permissions
+
+        return permissions
+
+    def _get_role_permissions_from_db(
+        self,
+        role_ids: list[int],
+    ) -> dict[str, set[str]]:
+        """
+        Query the metadata database for the permissions of a set of roles.
+
+        :param role_ids: The IDs of the roles
+        :returns: A mapping of permission names to view-menu names
+        """
+        permissions: dict[str, set[str]] = defaultdict(set)
+        if not role_ids:
+            return {}
+
+        query = (
+            self.session.query(self.permission_model.name, self.viewmenu_model.name)
+            .select_from(self.permissionview_model)
             .join(self.permission_model)
+            .join(self.viewmenu_model)
             .join(assoc_permissionview_role)
-            .join(self.role_model)
+            .filter(assoc_permissionview_role.c.role_id.in_(set(role_ids)))
+            .distinct()
         )
+        for permission_name, view_menu_name in query.all():
+            permissions[permission_name].add(view_menu_name)
 
-        if not g.user.is_anonymous:
-            user_id = get_user_id()
-
-            user_roles_filter = or_(
-                exists().where(
-                    (assoc_user_role.c.user_id == user_id)
-                    & (assoc_user_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-                exists().where(
-                    (assoc_user_group.c.user_id == user_id)
-                    & (assoc_user_group.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-            )
-
-            view_menu_names = base_query.filter(user_roles_filter).all()
-            return {s.name for s in view_menu_names}
-
-        # Properly treat anonymous user
-        if public_role := self.get_public_role():
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
-                )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+        return dict(permissions)
+
+    @staticmethod
+    def _get_permissions_request_cache() -> Optional[dict[str, dict[str, set[str]]]]:
+        """
+        Return the cache of role permissions for the current request.
+
+        Only requests get a cache, since app contexts can be long lived outside of
+        them, eg, in Celery workers.
+        """
+        if not has_request_context():
+            return None
+        if not hasattr(g, "permissions_cache"):
+            g.permissions_cache = {}
+        return g.permissions_cache
+
+    def invalidate_permissions_cache(self) -> None:
+        """
+        Invalidate the permissions cached for the current request and, if enabled,
+        the ones cached across requests.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if has_request_context() and hasattr(g, "permissions_cache"):
+            g.permissions_cache = {}
+
+        if get_conf()["PERMISSIONS_CACHE_TIMEOUT"]:
+            cache_manager.cache.set(
+                PERMISSIONS_CACHE_VERSION_KEY,
+                uuid.uuid4().hex,
+                timeout=0,
+            )
+
+    def permissions_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Invalidate the cached permissions when a role, a permission or one of the
+        objects whose view menus are managed by the security hooks changes.
+
+        The cache is invalidated right away and again once the transaction is
+        committed, so that permissions read by concurrent requests before the commit
+        are not kept around.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The changed object
+        """
+        self.invalidate_permissions_cache()
+        if session := object_session(target):
+            event.listen(
+                session,
+                "after_commit",
+                lambda _: self.invalidate_permissions_cache(),
+                once=True,
+            )
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -2714,11 +2837,16 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource | Explorable") -> list[SqlaQuery]:
+    def get_rls_filters(
+        self, table: "BaseDatasource | Explorable"
+    ) -> list[RLSFilterClause]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        Filters are memoized for the duration of the request and, when
+        `RLS_FILTERS_CACHE_TIMEOUT` is set, in the cache defined by `CACHE_CONFIG`.
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2726,6 +2854,53 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted({role.id for role in self.get_user_roles(g.user)})
+        table_id = table.data["id"]
+        key = f"{table_id}:{','.join(str(role_id) for role_id in user_roles)}"
+        stats_logger = get_conf()["STATS_LOGGER"]
+
+        request_cache = self._get_rls_filters_request_cache()
+        if request_cache is not None and key in request_cache:
+            stats_logger.incr("rls_filters_cache.request.hit")
+            return list(request_cache[key])
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        shared_cache_key = None
+        filters: Optional[list[RLSFilterClause]] = None
+        if timeout := get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]:
+            version = self._get_cache_version(RLS_FILTERS_CACHE_VERSION_KEY)
+            shared_cache_key = f"rls_filters:{version}:{key}"
+            filters = cache_manager.cache.get(shared_cache_key)
+            stats_logger.incr(
+                "rls_filters_cache.hit"
+                if filters is not None
+                else "rls_filters_cache.miss"
+            )
+
+        if filters is None:
+            filters = self._get_rls_filters_from_db(user_roles, table_id)
+            if shared_cache_key:
+                cache_manager.cache.set(shared_cache_key, filters, timeout=timeout)
+
+        if request_cache is not None:
+            request_cache[key] = filters
+
+        return list(filters)
+
+    def _get_rls_filters_from_db(
+        self,
+        user_roles: list[int],
+        table_id: int,
+    ) -> list[RLSFilterClause]:
+        """
+        Query the metadata database for the RLS filters of a table and a set of roles.
+
+        :param user_roles: The IDs of the roles of the user
+        :param table_id: The ID of the table
+        :returns: A list of filters
+        """
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2733,7 +2908,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2751,7 +2925,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
         filter_tables = self.session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.data["id"]
+            RLSFilterTables.c.table_id == table_id
         )
         query = (
             self.session.query(
@@ -2775,11 +2949,90 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [RLSFilterClause(*row) for row in query.all()]
+
+    @staticmethod
+    def _get_rls_filters_request_cache() -> Optional[dict[str, list[RLSFilterClause]]]:
+        """
+        Return the cache of RLS filters for the current request.
+
+        Only requests get a cache, since app contexts can be long lived outside of
+        them, eg, in Celery workers.
+        """
+        if not has_request_context():
+            return None
+        if not hasattr(g, "rls_filters_cache"):
+            g.rls_filters_cache = {}
+        return g.rls_filters_cache
+
+    @staticmethod
+    def _get_cache_version(version_key: str) -> str:
+        """
+        Return the version of a family of entries stored in the shared cache.
+
+        The version is part of the cache keys, so changing it invalidates all the
+        cached entries at once.
+
+        :param version_key: The key holding the version in the cache
+        :returns: The current version
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if version := cache_manager.cache.get(version_key):
+            return version
+
+        version = uuid.uuid4().hex
+        cache_manager.cache.set(version_key, version, timeout=0)
+        return version
+
+    def invalidate_rls_filters_cache(self) -> None:
+        """
+        Invalidate the RLS filters cached for the current request and, if enabled,
+        the ones cached across requests.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if has_request_context() and hasattr(g, "rls_filters_cache"):
+            g.rls_filters_cache = {}
+
+        if get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]:
+            cache_manager.cache.set(
+                RLS_FILTERS_CACHE_VERSION_KEY,
+                uuid.uuid4().hex,
+                timeout=0,
+            )
+
+    def rls_filters_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Invalidate the cached RLS filters when a filter or a role changes.
+
+        The cache is invalidated right away and again once the transaction is
+        committed, so that filters read by concurrent requests before the commit are
+        not kept around.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The changed RLS filter or role
+        """
+        self.invalidate_rls_filters_cache()
+        if session := object_session(target):
+            event.listen(
+                session,
+                "after_commit",
+                lambda _: self.invalidate_rls_filters_cache(),
+                once=True,
+            )
 
     def get_rls_sorted(
         self, table: "BaseDatasource | Explorable"
-    ) -> list["RowLevelSecurityFilter"]:
+    ) -> list[RLSFilterClause]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
@@ -50,9 +50,15 @@ from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.execution.executor import execute_sql_with_cursor
 from superset.sql.parse import SQLScript
+from superset.sqllab.chunked_results import (
+    CHUNKS_MANIFEST_KEY,
+    get_chunk_rows,
+    write_chunks,
+)
 from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import json
-from superset.utils.core import override_user, zlib_compress
+from superset.utils.compression import compress_results
+from superset.utils.core import override_user
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
 
@@ -210,6 +216,61 @@ def _finalize_successful_query(
     payload["query"]["state"] = QueryStatus.SUCCESS.value
 
 
+def _check_payload_size(serialized_payload: bytes) -> None:
+    """Raise if a serialized payload exceeds SQLLAB_PAYLOAD_MAX_MB."""
+    if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
+        serialized_payload_size = len(serialized_payload)
+        max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
+
+        if serialized_payload_size > max_bytes:
+            logger.info("Result size exceeds the allowed limit.")
+            raise SupersetErrorException(
+                SupersetError(
+                    message=(
+                        f"Result size "
+                        f"({serialized_payload_size / BYTES_IN_MB:.2f} MB) "
+                        f"exceeds the allowed limit of "
+                        f"{sql_lab_payload_max_mb} MB."
+                    ),
+                    error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+                    level=ErrorLevel.ERROR,
+                )
+            )
+
+
+def _store_statement_chunks(
+    payload: dict[str, Any],
+    key: str,
+    chunk_rows: int,
+    cache_timeout: int,
+) -> dict[str, Any] | None:
+    """
+    Store the Arrow data of each statement as chunks in the results backend.
+
+    :returns: A copy of the payload where the data of each statement is replaced by
+        its chunks manifest, or None if a chunk could not be stored
+    """
+    statements = []
+    for index, statement in enumerate(payload["statements"]):
+        if statement["data"] is None:
+            statements.append(statement)
+            continue
+
+        manifest = write_chunks(
+            results_backend,
+            f"{key}:{index}",
+            statement["data"],
+            chunk_rows,
+            cache_timeout,
+            validate_chunk=_check_payload_size,
+        )
+        if manifest is None:
+            return None
+        statements.append({**statement, "data": None, CHUNKS_MANIFEST_KEY: manifest})
+
+    return {**payload, "statements": statements}
+
+
 def _store_results_in_backend(
     query: Query,
     payload: dict[str, Any],
@@ -224,41 +285,36 @@ def _store_results_in_backend(
         key,
     )
     stats_logger = app.config["STATS_LOGGER"]
+    cache_timeout = database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+
     with stats_timing("sqllab.query.results_backend_write", stats_logger):
-        with stats_timing(
-            "sqllab.query.results_backend_write_serialization", stats_logger
-        ):
-            serialized_payload = _serialize_payload(payload)
-
-            # Check payload size limit
-            if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                serialized_payload_size = len(serialized_payload)
-                max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
-
-                if serialized_payload_size > max_bytes:
-                    logger.info("Result size exceeds the allowed limit.")
-                    raise SupersetErrorException(
-                        SupersetError(
-                            message=(
-                                f"Result size "
-                                f"({serialized_payload_size / BYTES_IN_MB:.2f} MB) "
-                                f"exceeds the allowed limit of "
-                                f"{sql_lab_payload_max_mb} MB."
-                            ),
-                            error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                            level=ErrorLevel.ERROR,
-                        )
-                    )
-
-        cache_timeout = database.cache_timeout
-        if cache_timeout is None:
-            cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
-
-        compressed = zlib_compress(serialized_payload)
-        logger.debug("*** serialized payload size: %i", len(serialized_payload))
-        logger.debug("*** compressed payload size: %i", len(compressed))
-
-        write_success = results_backend.set(key, compressed, cache_timeout)
+        from superset import results_backend_use_msgpack
+
+        stored_payload: dict[str, Any] | None = payload
+        if chunk_rows := get_chunk_rows(bool(results_backend_use_msgpack)):
+            with stats_timing(
+                "sqllab.query.results_backend_write_chunks", stats_logger
+            ):
+                stored_payload = _store_statement_chunks(
+                    payload, key, chunk_rows, cache_timeout
+                )
+
+        write_success = False
+        if stored_payload is not None:
+            with stats_timing(
+                "sqllab.query.results_backend_write_serialization", stats_logger
+            ):
+                serialized_payload = _serialize_payload(stored_payload)
+                _check_payload_size(serialized_payload)
+
+            compressed = compress_results(serialized_payload)
+            logger.debug("*** serialized payload size: %i", len(serialized_payload))
+            logger.debug("*** compressed payload size: %i", len(compressed))
+
+            write_success = results_backend.set(key, compressed, cache_timeout)
+
         if not write_success:
             logger.error(
                 "Query %s: Failed to store results in backend, key: %s",
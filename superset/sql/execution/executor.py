@@ -970,7 +970,6 @@ class SQLExecutor:
     @staticmethod
     def _get_async_query_result(query_id: int) -> Any:
         """Get the result of an async query."""
-        import pandas as pd
         from superset_core.api.types import (
             QueryResult as QueryResultType,
             QueryStatus as QueryStatusType,
@@ -1005,24 +1004,16 @@ class SQLExecutor:
                 blob = results_backend.get(query.results_key)
                 if blob:
                     try:
-                        from superset.utils.core import zlib_decompress
+                        from superset.utils.compression import decompress
 
-                        payload = msgpack.loads(zlib_decompress(blob))
+                        payload = msgpack.loads(decompress(blob))
 
                         statements = [
                             StatementResult(
                                 original_sql=stmt_data.get("original_sql", ""),
                                 executed_sql=stmt_data.get("executed_sql", ""),
-                                data=(
-                                    pd.DataFrame(
-                                        stmt_data.get("data", []),
-                                        columns=[
-                                            c.get("column_name", c.get("name", ""))
-                                            for c in stmt_data.get("columns", [])
-                                        ],
-                                    )
-                                    if stmt_data.get("data")
-                                    else None
+                                data=SQLExecutor._load_statement_data(
+                                    stmt_data, results_backend
                                 ),
                                 row_count=stmt_data.get("row_count", 0),
                                 execution_time_ms=stmt_data.get("execution_time_ms"),
@@ -1052,6 +1043,30 @@ class SQLExecutor:
             query_id=query_id,
         )
 
+    @staticmethod
+    def _load_statement_data(stmt_data: dict[str, Any], results_backend: Any) -> Any:
+        """Load the data of a statement, reading its chunks if it was chunked."""
+        import pandas as pd
+
+        from superset.result_set import SupersetResultSet
+        from superset.sqllab.chunked_results import get_manifest, read_chunks
+
+        if manifest := get_manifest(stmt_data):
+            return SupersetResultSet.convert_table_to_df(
+                read_chunks(results_backend, manifest)
+            )
+
+        if not stmt_data.get("data"):
+            return None
+
+        return pd.DataFrame(
+            stmt_data.get("data", []),
+            columns=[
+                c.get("column_name", c.get("name", ""))
+                for c in stmt_data.get("columns", [])
+            ],
+        )
+
     @staticmethod
     def _cancel_async_query(query_id: int, database: Database) -> bool:
         """Cancel an async query."""
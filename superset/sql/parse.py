@@ -46,9 +46,11 @@ from sqlglot.optimizer.scope import (
 
 from superset.exceptions import QueryClauseValidationException, SupersetParseError
 from superset.sql.dialects import DB2, Dremio, Firebolt, Pinot
+from superset.utils.lru import LRUCache
 
 if TYPE_CHECKING:
     from superset.models.core import Database
+    from superset.stats_logger import BaseStatsLogger
 
 
 logger = logging.getLogger(__name__)
@@ -336,6 +338,82 @@ InternalRepresentation = TypeVar("InternalRepresentation")
 TBaseSQLStatement = TypeVar("TBaseSQLStatement")  # pylint: disable=invalid-name
 
 
+class ParseCache:
+    """
+    A bounded, thread-safe LRU cache of parsed SQL scripts.
+
+    The same SQL is often parsed several times, eg, in the security checks, when
+    applying the limit and RLS, or for every chart query of a virtual dataset. Parsed
+    scripts are cached by SQL and engine, and callers always get copies of the cached
+    ASTs, since statements are modified in place by methods like `apply_rls` or
+    `set_limit_value`.
+
+    The cache is disabled until configured with a size, from `SQL_PARSE_CACHE_SIZE`.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        self._scripts: LRUCache[tuple[str, str], list[exp.Expression]] = LRUCache(
+            max_size
+        )
+        self.stats_logger: BaseStatsLogger | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._scripts.max_size
+
+    def configure(
+        self,
+        max_size: int,
+        stats_logger: BaseStatsLogger | None = None,
+    ) -> None:
+        """
+        Set the size of the cache, and the logger reporting hits and misses.
+        """
+        self._scripts.configure(max_size)
+        self.stats_logger = stats_logger
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.stats_logger:
+            self.stats_logger.incr(f"sql_parse_cache.{'hit' if hit else 'miss'}")
+
+    def get(self, script: str, engine: str) -> list[exp.Expression] | None:
+        """
+        Return copies of the parsed statements of a script, if cached.
+        """
+        if not self._scripts.is_enabled():
+            return None
+
+        statements = self._scripts.get((script, engine))
+        self._record(statements is not None)
+
+        if statements is None:
+            return None
+        return [ast.copy() if ast is not None else None for ast in statements]
+
+    def set(self, script: str, engine: str, statements: list[exp.Expression]) -> None:
+        """
+        Cache copies of the parsed statements of a script.
+        """
+        if not self._scripts.is_enabled():
+            return
+
+        # empty statements are parsed as None
+        copies = [ast.copy() if ast is not None else None for ast in statements]
+        self._scripts.set((script, engine), copies)
+
+
+parse_cache = ParseCache()
+
+
 class BaseSQLStatement(Generic[InternalRepresentation]):
     """
     Base class for SQL statements.
@@ -557,6 +635,20 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         """
         Parse helper.
 
+        Scripts that were parsed before are returned from the parse cache.
+        """
+        if (statements := parse_cache.get(script, engine)) is not None:
+            return statements
+
+        statements = cls._parse_script(script, engine)
+        parse_cache.set(script, engine, statements)
+        return statements
+
+    @classmethod
+    def _parse_script(cls, script: str, engine: str) -> list[exp.Expression]:
+        """
+        Parse a script with sqlglot.
+
         When the base dialect (engine="base" or unknown engines) fails to parse SQL
         containing backtick-quoted identifiers, we fall back to MySQL dialect which
         supports backticks natively. This handles cases like "Other" database type
@@ -56,13 +56,18 @@ from superset.extensions import celery_app, event_logger
 from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
+from superset.sqllab.chunked_results import (
+    CHUNKS_MANIFEST_KEY,
+    get_chunk_rows,
+    write_chunks,
+)
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import json
+from superset.utils.compression import compress_results
 from superset.utils.core import (
     override_user,
     QuerySource,
-    zlib_compress,
 )
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
@@ -332,6 +337,28 @@ def _serialize_payload(
     return json.dumps(payload, default=json.json_iso_dttm_ser, ignore_nan=True)
 
 
+def _check_payload_size(serialized_payload: Union[bytes, str]) -> None:
+    """
+    Raise if a serialized payload exceeds `SQLLAB_PAYLOAD_MAX_MB`.
+
+    :param serialized_payload: The serialized payload, or chunk of results
+    :raises SupersetErrorException: If the payload is too large
+    """
+    if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
+        serialized_payload_size = sys.getsizeof(serialized_payload)
+        max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
+
+        if serialized_payload_size > max_bytes:
+            logger.info("Result size exceeds the allowed limit.")
+            raise SupersetErrorException(
+                SupersetError(
+                    message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
+                    error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+                    level=ErrorLevel.ERROR,
+                )
+            )
+
+
 def _serialize_and_expand_data(
     result_set: SupersetResultSet,
     db_engine_spec: BaseEngineSpec,
@@ -550,41 +577,51 @@ def execute_sql_statements(  # noqa: C901
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
         )
         stats_logger = app.config["STATS_LOGGER"]
+        cache_timeout = database.cache_timeout
+        if cache_timeout is None:
+            cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+
         with stats_timing("sqllab.query.results_backend_write", stats_logger):
-            with stats_timing(
-                "sqllab.query.results_backend_write_serialization", stats_logger
-            ):
-                serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
+            stored_payload: Optional[dict[str, Any]] = payload
+            if chunk_rows := get_chunk_rows(use_arrow_data):
+                with stats_timing(
+                    "sqllab.query.results_backend_write_chunks", stats_logger
+                ):
+                    manifest = write_chunks(
+                        results_backend,
+                        key,
+                        payload["data"],
+                        chunk_rows,
+                        cache_timeout,
+                        validate_chunk=_check_payload_size,
+                    )
+                stored_payload = (
+                    {**payload, "data": None, CHUNKS_MANIFEST_KEY: manifest}
+                    if manifest
+                    else None
                 )
 
-                # Check the size of the serialized payload
-                if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                    serialized_payload_size = sys.getsizeof(serialized_payload)
-                    max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
-
-                    if serialized_payload_size > max_bytes:
-                        logger.info("Result size exceeds the allowed limit.")
-                        raise SupersetErrorException(
-                            SupersetError(
-                                message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
-                                error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                                level=ErrorLevel.ERROR,
-                            )
-                        )
+            write_success = False
+            if stored_payload is not None:
+                with stats_timing(
+                    "sqllab.query.results_backend_write_serialization", stats_logger
+                ):
+                    serialized_payload = _serialize_payload(
+                        stored_payload, cast(bool, results_backend_use_msgpack)
+                    )
 
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+                    # Check the size of the serialized payload
+                    _check_payload_size(serialized_payload)
 
-            compressed = zlib_compress(serialized_payload)
-            logger.debug(
-                "*** serialized payload size: %i", getsizeof(serialized_payload)
-            )
-            logger.debug("*** compressed payload size: %i", getsizeof(compressed))
+                compressed = compress_results(serialized_payload)
+                logger.debug(
+                    "*** serialized payload size: %i", getsizeof(serialized_payload)
+                )
+                logger.debug("*** compressed payload size: %i", getsizeof(compressed))
+
+                # Store results in backend and check if write succeeded
+                write_success = results_backend.set(key, compressed, cache_timeout)
 
-            # Store results in backend and check if write succeeded
-            write_success = results_backend.set(key, compressed, cache_timeout)
             if not write_success:
                 # Backend write failed - log error and don't set results_key
                 logger.error(
@@ -648,22 +685,10 @@ def execute_sql_statements(  # noqa: C901
                 }
             )
         # Check the size of the serialized payload (opt-in logic for return_results)
-        if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-            serialized_payload = _serialize_payload(
-                payload, cast(bool, results_backend_use_msgpack)
+        if app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
+            _check_payload_size(
+                _serialize_payload(payload, cast(bool, results_backend_use_msgpack))
             )
-            serialized_payload_size = sys.getsizeof(serialized_payload)
-            max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
-
-            if serialized_payload_size > max_bytes:
-                logger.info("Result size exceeds the allowed limit.")
-                raise SupersetErrorException(
-                    SupersetError(
-                        message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
-                        error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                        level=ErrorLevel.ERROR,
-                    )
-                )
         return payload
 
     return None
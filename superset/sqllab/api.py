@@ -34,6 +34,7 @@ from superset.commands.sql_lab.results import SqlExecutionResultsCommand
 from superset.commands.sql_lab.streaming_export_command import (
     StreamingSqlResultExportCommand,
 )
+from superset.commands.streaming_export.writers import StreamingExportFormat, WRITERS
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
 from superset.daos.database import DatabaseDAO
 from superset.daos.query import QueryDAO
@@ -340,7 +341,7 @@ class SqlLabRestApi(BaseSupersetApi):
         """Export SQL query results using streaming for large datasets.
         ---
         post:
-          summary: Export SQL query results to CSV with streaming
+          summary: Export SQL query results with streaming
           requestBody:
             description: Export parameters
             required: true
@@ -355,16 +356,24 @@ class SqlLabRestApi(BaseSupersetApi):
                     filename:
                       type: string
                       description: Optional filename for the export
+                    format:
+                      type: string
+                      enum: [csv, xlsx, parquet, arrow]
+                      description: Optional format of the export, CSV by default
                     expected_rows:
                       type: integer
                       description: Optional expected row count for progress tracking
           responses:
             200:
-              description: Streaming CSV export
+              description: Streaming export
               content:
                 text/csv:
                   schema:
                     type: string
+                application/octet-stream:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -383,6 +392,11 @@ class SqlLabRestApi(BaseSupersetApi):
         if not client_id:
             return self.response_400(message="client_id is required")
 
+        try:
+            export_format = StreamingExportFormat(request.form.get("format", "csv"))
+        except ValueError:
+            return self.response_400(message="Unsupported export format")
+
         expected_rows = None
         if expected_rows_str := request.form.get("expected_rows"):
             try:
@@ -390,35 +404,51 @@ class SqlLabRestApi(BaseSupersetApi):
             except (ValueError, TypeError):
                 logger.warning("Invalid expected_rows value: %s", expected_rows_str)
 
-        return self._create_streaming_csv_response(client_id, filename, expected_rows)
+        return self._create_streaming_response(
+            client_id, filename, expected_rows, export_format
+        )
 
-    def _create_streaming_csv_response(
+    def _create_streaming_response(
         self,
         client_id: str,
         filename: str | None = None,
         expected_rows: int | None = None,
+        export_format: StreamingExportFormat = StreamingExportFormat.CSV,
     ) -> Response:
-        """Create a streaming CSV response for large SQL Lab result sets."""
+        """Create a streaming response for large SQL Lab result sets."""
         # Execute streaming command
         # TODO: Make chunk size configurable via SUPERSET_CONFIG
         chunk_size = 1024
-        command = StreamingSqlResultExportCommand(client_id, chunk_size)
+        # Get encoding and delimiter from config
+        csv_export = app.config.get("CSV_EXPORT", {})
+        encoding = csv_export.get("encoding", "utf-8")
+        command = StreamingSqlResultExportCommand(
+            client_id,
+            chunk_size,
+            export_format,
+            encoding=encoding,
+            delimiter=csv_export.get("sep", ","),
+        )
         command.validate()
 
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = secure_filename(f"sqllab_{client_id}_{timestamp}.csv")
+            filename = secure_filename(
+                f"sqllab_{client_id}_{timestamp}.{export_format}"
+            )
 
         # Get the callable that returns the generator
         csv_generator_callable = command.run()
 
-        # Get encoding from config
-        encoding = app.config.get("CSV_EXPORT", {}).get("encoding", "utf-8")
+        if export_format == StreamingExportFormat.CSV:
+            mimetype = f"text/csv; charset={encoding}"
+        else:
+            mimetype = WRITERS[export_format].mimetype
 
         # Create response with streaming headers
         response = Response(
             csv_generator_callable(),  # Call the callable to get generator
-            mimetype=f"text/csv; charset={encoding}",
+            mimetype=mimetype,
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
                 "Cache-Control": "no-cache",
@@ -431,7 +461,8 @@ class SqlLabRestApi(BaseSupersetApi):
         response.implicit_sequence_conversion = False
 
         logger.info(
-            "SQL Lab streaming CSV export started: client_id=%s, filename=%s",
+            "SQL Lab streaming %s export started: client_id=%s, filename=%s",
+            export_format,
             client_id,
             filename,
         )
@@ -481,7 +512,8 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        offset = params.get("offset", 0)
+        result = SqlExecutionResultsCommand(key=key, rows=rows, offset=offset).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -0,0 +1,184 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Chunked storage of SQL Lab results in the results backend.
+
+When ``SQLLAB_RESULTS_CHUNK_ROWS`` is set, the Arrow data of a result is split into
+record batches of a fixed number of rows, each one stored compressed under its own
+key. The payload stored under the results key keeps all the metadata and, instead of
+the data, a manifest describing the chunks::
+
+    {
+        "key": "<results key>",
+        "row_count": 250000,
+        "chunk_rows": 10000,
+        "num_chunks": 25,
+    }
+
+Readers can then fetch a range of rows by reading only the chunks covering it.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Optional, TypedDict
+
+import pyarrow as pa
+from flask import current_app
+from flask_caching.backends.base import BaseCache
+
+from superset.exceptions import SerializationError
+from superset.sqllab.utils import write_ipc_buffer
+from superset.utils.compression import (
+    compress_results,
+    decompress,
+    DECOMPRESSION_ERRORS,
+)
+
+logger = logging.getLogger(__name__)
+
+# key in the stored payload holding the chunks manifest, replacing the data
+CHUNKS_MANIFEST_KEY = "data_chunks"
+
+
+class ChunksManifest(TypedDict):
+    key: str
+    row_count: int
+    chunk_rows: int
+    num_chunks: int
+
+
+def get_chunk_key(key: str, index: int) -> str:
+    return f"{key}:chunk:{index}"
+
+
+def split_ipc_buffer(data: bytes, chunk_rows: int) -> tuple[int, list[bytes]]:
+    """
+    Split an Arrow IPC stream into streams of at most ``chunk_rows`` rows each.
+
+    Slicing is zero-copy, so only the resulting streams are materialized. A result
+    without rows still produces one chunk, so that its schema is preserved.
+
+    :param data: The Arrow IPC stream
+    :param chunk_rows: The maximum number of rows per chunk
+    :returns: The total number of rows and the chunks
+    """
+    table = pa.ipc.open_stream(pa.BufferReader(data)).read_all()
+    chunks = [
+        write_ipc_buffer(table.slice(offset, chunk_rows)).to_pybytes()
+        for offset in range(0, max(table.num_rows, 1), chunk_rows)
+    ]
+    return table.num_rows, chunks
+
+
+def write_chunks(
+    results_backend: BaseCache,
+    key: str,
+    data: bytes,
+    chunk_rows: int,
+    cache_timeout: int,
+    validate_chunk: Optional[Callable[[bytes], None]] = None,
+) -> Optional[ChunksManifest]:
+    """
+    Store an Arrow IPC stream in the results backend as a set of chunks.
+
+    :param results_backend: The results backend
+    :param key: The key prefix of the chunks
+    :param data: The Arrow IPC stream
+    :param chunk_rows: The maximum number of rows per chunk
+    :param cache_timeout: The timeout of the stored chunks
+    :param validate_chunk: Optional callable run on each chunk before storing it,
+        eg, to enforce a size limit
+    :returns: The manifest of the chunks, or None if a chunk could not be stored
+    """
+    row_count, chunks = split_ipc_buffer(data, chunk_rows)
+    for index, chunk in enumerate(chunks):
+        if validate_chunk:
+            validate_chunk(chunk)
+        if not results_backend.set(
+            get_chunk_key(key, index),
+            compress_results(chunk),
+            cache_timeout,
+        ):
+            logger.error("Failed to store chunk %d of results %s", index, key)
+            return None
+
+    return {
+        "key": key,
+        "row_count": row_count,
+        "chunk_rows": chunk_rows,
+        "num_chunks": len(chunks),
+    }
+
+
+def read_chunks(
+    results_backend: BaseCache,
+    manifest: ChunksManifest,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> pa.Table:
+    """
+    Read a range of rows from chunked results, fetching only the chunks covering it.
+
+    :param results_backend: The results backend
+    :param manifest: The manifest of the chunks
+    :param offset: The first row to read
+    :param limit: The maximum number of rows to read; all the remaining rows if None
+    :returns: The rows as an Arrow table
+    :raises SerializationError: If a chunk is missing or can't be deserialized
+    """
+    chunk_rows = manifest["chunk_rows"]
+    row_count = manifest["row_count"]
+    offset = max(min(offset, row_count), 0)
+    stop = row_count if limit is None else min(offset + max(limit, 0), row_count)
+
+    first = min(offset // chunk_rows, manifest["num_chunks"] - 1)
+    last = max((stop - 1) // chunk_rows, first)
+
+    tables = [
+        _read_chunk(results_backend, manifest["key"], index)
+        for index in range(first, last + 1)
+    ]
+    table = pa.concat_tables(tables)
+    return table.slice(offset - first * chunk_rows, stop - offset)
+
+
+def _read_chunk(results_backend: BaseCache, key: str, index: int) -> pa.Table:
+    blob = results_backend.get(get_chunk_key(key, index))
+    if not blob:
+        raise SerializationError(f"Chunk {index} of results {key} is missing")
+
+    try:
+        buffer = decompress(blob)
+        return pa.ipc.open_stream(pa.BufferReader(buffer)).read_all()
+    except (pa.ArrowException, *DECOMPRESSION_ERRORS) as ex:
+        raise SerializationError(f"Unable to deserialize chunk {index}") from ex
+
+
+def get_manifest(payload: dict[str, Any]) -> Optional[ChunksManifest]:
+    return payload.get(CHUNKS_MANIFEST_KEY)
+
+
+def get_chunk_rows(use_msgpack: bool) -> int:
+    """
+    Return the number of rows per chunk, or 0 if results should not be chunked.
+
+    Only results serialized with Arrow can be chunked.
+    """
+    if not use_msgpack:
+        return 0
+    return current_app.config["SQLLAB_RESULTS_CHUNK_ROWS"] or 0
@@ -22,11 +22,11 @@ it needs to call create_app() in order to initialize things properly
 
 from typing import Any
 
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 
 # Superset framework imports
 from superset import create_app
-from superset.extensions import celery_app, db
+from superset.extensions import celery_app, db, event_logger
 
 # Init the Flask app / configure everything
 flask_app = create_app()
@@ -47,6 +47,12 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
         db.engine.dispose()
 
 
+@worker_process_shutdown.connect
+def flush_event_logger(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # prefork children exit without running `atexit` handlers
+    event_logger.flush()
+
+
 @task_postrun.connect
 def teardown(  # pylint: disable=unused-argument
     retval: Any,
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any
+
+from flask import current_app
+from werkzeug.datastructures import FileStorage
+
+from superset.commands.database.uploaders.base import (
+    BaseDataReader,
+    UploadCommand,
+    UploadFileType,
+)
+from superset.commands.database.uploaders.columnar_reader import ColumnarReader
+from superset.commands.database.uploaders.csv_reader import CSVReader
+from superset.commands.database.uploaders.excel_reader import ExcelReader
+from superset.extensions import async_query_manager, celery_app, security_manager
+from superset.utils.core import override_user
+
+logger = logging.getLogger(__name__)
+
+READERS: dict[str, type[BaseDataReader]] = {
+    UploadFileType.CSV: CSVReader,
+    UploadFileType.EXCEL: ExcelReader,
+    UploadFileType.COLUMNAR: ColumnarReader,
+}
+
+
+@celery_app.task(name="upload_file")
+def upload_file(
+    job_metadata: dict[str, Any],
+    database_id: int,
+    file_path: str,
+    filename: str,
+    options: dict[str, Any],
+) -> None:
+    """
+    Upload a file stored in ``UPLOAD_STAGING_FOLDER`` to a database, as the user who
+    sent it.
+
+    The number of rows uploaded is reported as a running job event after each chunk,
+    and the file is deleted once the upload is done.
+
+    :param job_metadata: The async job metadata
+    :param database_id: The ID of the database to upload the file to
+    :param file_path: The path of the stored file
+    :param filename: The name of the file, as uploaded
+    :param options: The upload parameters, including the file type and table name
+    """
+
+    def on_progress(rows: int) -> None:
+        async_query_manager.update_job(
+            job_metadata,
+            async_query_manager.STATUS_RUNNING,
+            rows_uploaded=rows,
+        )
+
+    user = security_manager.get_user_by_id(job_metadata.get("user_id"))
+    with override_user(user, force=False):
+        try:
+            with open(file_path, "rb") as stream:
+                UploadCommand(
+                    database_id,
+                    options["table_name"],
+                    FileStorage(stream, filename=filename),
+                    options.get("schema"),
+                    READERS[options["type"]](options),  # type: ignore
+                    on_progress=on_progress,
+                ).run()
+            async_query_manager.update_job(
+                job_metadata,
+                async_query_manager.STATUS_DONE,
+            )
+        except Exception as ex:
+            error = ex.message if hasattr(ex, "message") else str(ex)
+            async_query_manager.update_job(
+                job_metadata,
+                async_query_manager.STATUS_ERROR,
+                errors=[{"message": error}],
+            )
+            raise
+        finally:
+            try:
+                os.remove(file_path)
+            except OSError:
+                logger.warning("Unable to remove uploaded file %s", file_path)
+
+
+@celery_app.task(name="prune_uploads")
+def prune_uploads() -> None:
+    """
+    Delete the files in ``UPLOAD_STAGING_FOLDER`` older than ``UPLOAD_STAGING_MAX_AGE``.
+
+    Upload tasks delete their file once done, so these belong to tasks which were
+    lost, eg. when a worker was killed or no worker picked the task.
+    """
+    folder = current_app.config["UPLOAD_STAGING_FOLDER"]
+    cutoff = time.time() - current_app.config["UPLOAD_STAGING_MAX_AGE"].total_seconds()
+    try:
+        entries = list(os.scandir(folder))
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                logger.info("Removed stale uploaded file %s", entry.path)
+        except OSError:
+            logger.warning("Unable to remove uploaded file %s", entry.path)
@@ -0,0 +1,206 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compression codecs for values stored in the results backend and the caches.
+
+Values compressed with zlib are stored without header, like the results backend
+stored payloads before codecs were introduced, so that they remain readable by
+older versions, eg, during rolling upgrades. Values compressed with other codecs
+start with a short header identifying the codec, so that values written with a
+different codec, eg, before the configuration changed, can still be decoded.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+from flask import current_app
+
+try:
+    import zstandard
+
+    zstd_installed = True
+except ImportError:
+    zstd_installed = False
+
+try:
+    import lz4.frame
+
+    lz4_installed = True
+except ImportError:
+    lz4_installed = False
+
+from superset.exceptions import SupersetException
+
+# zlib streams start with 0x78, so this can't be mistaken for a zlib value
+MAGIC = b"\xffSPC"
+HEADER_SIZE = len(MAGIC) + 1
+
+# errors raised when decompressing corrupted or truncated values
+DECOMPRESSION_ERRORS: tuple[type[Exception], ...] = (zlib.error, SupersetException)
+if zstd_installed:
+    DECOMPRESSION_ERRORS += (zstandard.ZstdError,)
+if lz4_installed:
+    # lz4 raises runtime errors for invalid frames
+    DECOMPRESSION_ERRORS += (RuntimeError,)
+
+
+class CompressionCodec:
+    """
+    Base class for compression codecs.
+    """
+
+    # name used in the configuration
+    name: str
+    # identifier stored in the header of compressed values, should never change
+    codec_id: int
+    # package providing the codec, when it's an optional dependency
+    package: str | None = None
+
+    def is_available(self) -> bool:
+        return True
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+    def decompress(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+
+class NoneCodec(CompressionCodec):
+    name = "none"
+    codec_id = 0
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+class ZlibCodec(CompressionCodec):
+    name = "zlib"
+    codec_id = 1
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec(CompressionCodec):
+    name = "zstd"
+    codec_id = 2
+    package = "zstandard"
+
+    def is_available(self) -> bool:
+        return zstd_installed
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+class Lz4Codec(CompressionCodec):
+    name = "lz4"
+    codec_id = 3
+    package = "lz4"
+
+    def is_available(self) -> bool:
+        return lz4_installed
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4.frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4.frame.decompress(data)
+
+
+CODECS: dict[str, CompressionCodec] = {
+    codec.name: codec for codec in (NoneCodec(), ZlibCodec(), ZstdCodec(), Lz4Codec())
+}
+CODECS_BY_ID: dict[int, CompressionCodec] = {
+    codec.codec_id: codec for codec in CODECS.values()
+}
+
+
+def get_codec(name: str | None) -> CompressionCodec:
+    """
+    Return a codec by name, where None means no compression.
+
+    :param name: The name of the codec
+    :returns: The codec
+    :raises SupersetException: If the codec is unknown or its library is missing
+    """
+    codec = CODECS.get(name or NoneCodec.name)
+    if codec is None:
+        raise SupersetException(f"Unknown compression codec: {name}")
+    if not codec.is_available():
+        raise SupersetException(
+            f"The {codec.name} compression codec requires the {codec.package} package"
+        )
+    return codec
+
+
+def compress(data: bytes | str, codec_name: str | None) -> bytes:
+    """
+    Compress data with a given codec, prefixing it with the codec header unless the
+    codec is zlib.
+
+    :param data: The data to compress; strings are encoded as UTF-8
+    :param codec_name: The name of the codec
+    :returns: The compressed data
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    codec = get_codec(codec_name)
+    if codec.name == ZlibCodec.name:
+        return codec.compress(data)
+    return MAGIC + bytes([codec.codec_id]) + codec.compress(data)
+
+
+def decompress(blob: bytes | str, decode: bool = False) -> Any:
+    """
+    Decompress data written by `compress`.
+
+    :param blob: The compressed data
+    :param decode: Whether to decode the result as UTF-8
+    :returns: The decompressed data, as bytes or as a string
+    """
+    if isinstance(blob, str):
+        blob = blob.encode("utf-8")
+
+    if blob[: len(MAGIC)] == MAGIC and len(blob) >= HEADER_SIZE:
+        codec_id = blob[len(MAGIC)]
+        if codec_id not in CODECS_BY_ID:
+            raise SupersetException(f"Unknown compression codec ID: {codec_id}")
+        data = get_codec(CODECS_BY_ID[codec_id].name).decompress(blob[HEADER_SIZE:])
+    else:
+        data = zlib.decompress(blob)
+
+    return data.decode("utf-8") if decode else data
+
+
+def compress_results(data: bytes | str) -> bytes:
+    """
+    Compress a payload for the results backend with `RESULTS_BACKEND_COMPRESSION`.
+    """
+    return compress(data, current_app.config["RESULTS_BACKEND_COMPRESSION"])
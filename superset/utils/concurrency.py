@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Helpers for running work concurrently inside a Flask app context."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Callable, Hashable, TypeVar
+
+from flask import (
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+    request,
+)
+
+from superset.extensions import security_manager
+from superset.security.guest_token import GuestUser
+
+T = TypeVar("T")
+
+# request data read by the callables, eg. the form data used by Jinja templates; the
+# user is loaded again in each worker thread rather than copied
+COPIED_G_ATTRIBUTES = ("form_data", "logs_context")
+
+_semaphores: dict[Hashable, threading.BoundedSemaphore] = {}
+_semaphores_lock = threading.Lock()
+
+
+def get_semaphore(key: Hashable, limit: int) -> threading.BoundedSemaphore:
+    """
+    Return a process-wide semaphore for a given key, eg, a database ID.
+
+    The limit is only used the first time a semaphore is requested for a key.
+    """
+    with _semaphores_lock:
+        if key not in _semaphores:
+            _semaphores[key] = threading.BoundedSemaphore(limit)
+        return _semaphores[key]
+
+
+def _get_user_loader(user: Any) -> Callable[[], Any]:
+    """
+    Return a callable loading a user again, in the session of the current thread.
+
+    Users and their roles are ORM objects bound to the session of the thread which
+    loaded them, so they're not shared with other threads; anonymous users aren't
+    loaded from the metadata database and are used as is.
+    """
+    if isinstance(user, security_manager.user_model) and user.id is not None:
+        user_id = user.id
+        return lambda: security_manager.get_user_by_id(user_id)
+    if isinstance(user, GuestUser):
+        token = user.guest_token
+        return lambda: security_manager.get_guest_user_from_token(token)
+    return lambda: user
+
+
+def capture_g() -> Callable[[], None]:
+    """
+    Capture the attributes of ``flask.g`` needed to run work in another thread.
+
+    :returns: A callable setting them in the app context of another thread, with
+        the current user loaded in its own SQLAlchemy session
+    """
+    if not has_app_context():
+        return lambda: None
+
+    attributes = {
+        name: getattr(g, name) for name in COPIED_G_ATTRIBUTES if hasattr(g, name)
+    }
+    load_user = _get_user_loader(g.user) if hasattr(g, "user") else None
+
+    def restore() -> None:
+        for name, value in attributes.items():
+            setattr(g, name, value)
+        if load_user:
+            g.user = load_user()
+
+    return restore
+
+
+def run_in_app_context(
+    funcs: list[Callable[[], T]],
+    max_workers: int,
+    semaphore: AbstractContextManager[Any] | None = None,
+) -> list[T]:
+    """
+    Run callables concurrently, each one in a copy of the current Flask context.
+
+    Worker threads get a new app context (and request context, if there's one) with
+    the current user and request data of ``flask.g`` (see `capture_g`). Each worker
+    uses its own SQLAlchemy session, where the user is loaded again.
+
+    Results are returned in the same order as the callables; if any of them raises,
+    the exception of the first failing callable (in order) is re-raised.
+
+    :param funcs: The callables to run
+    :param max_workers: Maximum number of threads; with 1 the callables run
+        sequentially in the current thread
+    :param semaphore: Optional semaphore acquired around each call, used to limit
+        concurrency across requests
+    :returns: The results of the callables
+    """
+    semaphore = semaphore or nullcontext()
+
+    if max_workers <= 1 or len(funcs) <= 1:
+        results = []
+        for func in funcs:
+            with semaphore:
+                results.append(func())
+        return results
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    restore_g = capture_g()
+    request_context = (
+        request._get_current_object().environ  # pylint: disable=protected-access
+        if has_request_context()
+        else None
+    )
+
+    def run(func: Callable[[], T]) -> T:
+        context = (
+            app.request_context(request_context)
+            if request_context is not None
+            else app.app_context()
+        )
+        with context:
+            restore_g()
+            with semaphore:
+                return func()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(funcs))) as executor:
+        futures = [executor.submit(run, func) for func in funcs]
+        return [future.result() for future in futures]
@@ -0,0 +1,171 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Process-wide registry of SQLAlchemy engines for analytical databases.
+
+Creating an engine initializes the dialect and, with ``NullPool``, every checkout
+opens a brand new connection to the warehouse. When ``DB_ENGINE_CACHE_SIZE`` is set
+engines are kept around in a bounded LRU registry so that connections can be pooled
+and reused across requests.
+
+Engines are never shared across processes: the registry is reset in a forked child
+(gunicorn and Celery prefork workers) without closing the parent's connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Hashable
+
+from sqlalchemy.engine import Engine
+
+from superset.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+EngineKey = tuple[Hashable, ...]
+
+
+def freeze_engine_params(value: Any) -> Hashable:
+    """
+    Return a hashable form of engine params, to be used in engine keys.
+
+    Values which aren't JSON-like, eg. pool classes, SSL contexts or callables, are
+    represented by their type, which unlike their string representation doesn't
+    contain memory addresses; they're derived from the database, which is already
+    part of the key.
+
+    :param value: The engine params, or one of their values
+    :returns: A hashable value, equal for equivalent params
+    """
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (str(key), freeze_engine_params(item)) for key, item in value.items()
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_engine_params(item) for item in value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    type_ = value if isinstance(value, type) else type(value)
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+class EngineCache:
+    """
+    A bounded, thread-safe LRU registry of SQLAlchemy engines.
+
+    Keys are tuples whose first element is the database ID, so that all the engines
+    belonging to a given database can be invalidated when it changes.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        self._engines: LRUCache[EngineKey, Engine] = LRUCache(
+            max_size,
+            on_evict=self._evict,
+        )
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def configure(self, max_size: int) -> None:
+        """
+        Set the number of engines to keep, disposing of those that don't fit anymore.
+        """
+        self._engines.configure(max_size)
+
+    def is_enabled(self) -> bool:
+        return self._engines.is_enabled()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def __contains__(self, key: EngineKey) -> bool:
+        return key in self._engines
+
+    @staticmethod
+    def _evict(engine: Engine) -> None:
+        logger.debug("Evicting engine %s from the engine cache", engine.url)
+        engine.dispose()
+
+    def _check_pid(self) -> None:
+        """
+        Drop engines inherited from a parent process.
+
+        Pooled connections must not be shared across processes, so after a fork the
+        engines are discarded without closing the connections, which still belong to
+        the parent.
+        """
+        if (pid := os.getpid()) == self._pid:
+            return
+
+        for _, engine in self._engines.items():
+            engine.dispose(close=False)
+        self._engines.clear()
+        self._pid = pid
+
+    def get_or_create(
+        self,
+        key: EngineKey,
+        factory: Callable[[], Engine],
+    ) -> Engine:
+        """
+        Return the engine for a given key, creating it if needed.
+
+        :param key: The engine key; the first element should be the database ID
+        :param factory: Callable that creates a new engine
+        :returns: A cached or newly created engine
+        """
+        with self._lock:
+            self._check_pid()
+
+            if engine := self._engines.get(key):
+                return engine
+
+            engine = factory()
+            self._engines.set(key, engine)
+            return engine
+
+    def invalidate(self, database_id: Any) -> None:
+        """
+        Dispose of all the engines belonging to a given database.
+
+        :param database_id: The database ID
+        """
+        with self._lock:
+            self._check_pid()
+
+            for key, engine in self._engines.items():
+                if key[0] == database_id:
+                    self._engines.pop(key)
+                    engine.dispose()
+
+    def clear(self) -> None:
+        """
+        Dispose of all the cached engines.
+        """
+        with self._lock:
+            self._check_pid()
+
+            for _, engine in self._engines.items():
+                engine.dispose()
+            self._engines.clear()
+
+
+engine_cache = EngineCache()
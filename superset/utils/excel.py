@@ -26,20 +26,53 @@ def quote_formulas(df: pd.DataFrame) -> pd.DataFrame:
     """
     Make sure to quote any formulas for security reasons.
     """
-    formula_prefixes = {"=", "+", "-", "@"}
+    formula_prefixes = ("=", "+", "-", "@")
 
     for col in df.select_dtypes(include="object").columns:
-        df[col] = df[col].apply(
-            lambda x: (
-                f"'{x}"
-                if isinstance(x, str) and len(x) and x[0] in formula_prefixes
-                else x
-            )
-        )
+        try:
+            is_formula = df[col].str.startswith(formula_prefixes, na=False)
+        except AttributeError:
+            # the column has no string values
+            continue
+
+        mask = is_formula.to_numpy()
+        if mask.any():
+            values = df[col].to_numpy(copy=True)
+            values[mask] = [f"'{value}" for value in values[mask]]
+            df[col] = values
 
     return df
 
 
+def stringify_large_numbers(series: pd.Series) -> pd.Series:
+    """
+    Convert numbers too large for Excel to strings.
+
+    Excel does not support numbers larger than 10^15.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return series
+
+    # comparisons with missing values of nullable dtypes are missing too
+    too_large = (series.abs() > 10**15).fillna(False)
+    if not too_large.any():
+        return series
+    return series.astype(object).mask(too_large, series.astype(str))
+
+
+def format_excel_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare the values of a dataframe to be written cell by cell to a worksheet.
+
+    Formulas are quoted, numbers too large for Excel are converted to strings and
+    missing values are replaced with None, so that they are written as blank cells.
+    """
+    df = quote_formulas(df)
+    for column in df.select_dtypes(include="number").columns:
+        df[column] = stringify_large_numbers(df[column])
+    return df.astype(object).where(df.notna(), None)
+
+
 def df_to_excel(df: pd.DataFrame, **kwargs: Any) -> Any:
     output = io.BytesIO()
 
@@ -66,14 +99,7 @@ def apply_column_types(
     for column, column_type in zip(df.columns, column_types, strict=False):
         if column_type == GenericDataType.NUMERIC:
             try:
-                df[column] = pd.to_numeric(df[column])
-                # if the number is too large, convert it to a string
-                # Excel does not support numbers larger than 10^15
-                df[column] = df[column].apply(
-                    lambda x: str(x)
-                    if isinstance(x, (int, float)) and abs(x) > 10**15
-                    else x
-                )
+                df[column] = stringify_large_numbers(pd.to_numeric(df[column]))
             except ValueError:
                 df[column] = df[column].astype(str)
         elif isinstance(df[column].dtype, pd.DatetimeTZDtype):
@@ -31,9 +31,42 @@ from simplejson import JSONDecodeError
 from superset.constants import PASSWORD_MASK
 from superset.utils.dates import datetime_to_epoch, EPOCH
 
+try:
+    import orjson
+
+    orjson_installed = True
+except ImportError:
+    orjson_installed = False
+
 logging.getLogger("MARKDOWN").setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+SIMPLEJSON_ENGINE = "simplejson"
+ORJSON_ENGINE = "orjson"
+
+# the engine used by `dumps` and `loads`, set from `JSON_ENGINE` by `set_engine`
+_engine = SIMPLEJSON_ENGINE
+
+
+def set_engine(name: str) -> None:
+    """
+    Set the engine used to encode and decode JSON.
+
+    :param name: The name of the engine, "simplejson" or "orjson"
+    :raises ValueError: If the engine is unknown or its library is missing
+    """
+    global _engine  # pylint: disable=global-statement
+
+    if name not in {SIMPLEJSON_ENGINE, ORJSON_ENGINE}:
+        raise ValueError(f"Unknown JSON engine: {name}")
+    if name == ORJSON_ENGINE and not orjson_installed:
+        raise ValueError("The orjson JSON engine requires the orjson package")
+    _engine = name
+
+
+def get_engine() -> str:
+    return _engine
+
 
 class DashboardEncoder(simplejson.JSONEncoder):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -209,6 +242,15 @@ def dumps(  # pylint: disable=too-many-arguments
     :returns: String object in the JSON compatible form
     """
 
+    if (
+        _engine == ORJSON_ENGINE
+        and cls is None
+        and ignore_nan
+        and (results := _orjson_dumps(obj, default, sort_keys, indent, separators))
+        is not None
+    ):
+        return results
+
     results_string = ""
     dumps_kwargs: Dict[str, Any] = {
         "default": default,
@@ -243,6 +285,19 @@ def loads(
     :param object_hook: function that will be called to decode objects values
     :returns: A Python object deserialized from string
     """
+    if (
+        _engine == ORJSON_ENGINE
+        and encoding is None
+        and not allow_nan
+        and object_hook is None
+    ):
+        try:
+            return orjson.loads(obj)
+        except orjson.JSONDecodeError:
+            # let simplejson either parse it, eg, integers larger than 64 bits, or
+            # raise the error callers expect
+            pass
+
     return simplejson.loads(
         obj,
         encoding=encoding,
@@ -251,6 +306,51 @@ def loads(
     )
 
 
+def _orjson_dumps(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]],
+    sort_keys: bool,
+    indent: Union[str, int, None],
+    separators: Union[tuple[str, str], None],
+) -> Optional[str]:
+    """
+    Dump an object with orjson, if the options and the object are supported.
+
+    orjson natively serializes dates and UUIDs, and writes NaN as null; `default` is
+    called for other types, and for dates when it's not an ISO 8601 serializer. NumPy
+    values are passed to `default` too, as with simplejson, since orjson would encode
+    eg. `datetime64` arrays as ISO 8601 strings rather than how `default` does. The
+    output is compact unless indented.
+
+    :returns: The JSON string, or None if simplejson should be used instead
+    """
+    if indent not in {None, 2} or separators not in {None, (",", ":")}:
+        return None
+
+    def orjson_default(obj: Any) -> Any:
+        # simplejson encodes `np.float64`, a subclass of `float`, natively
+        if isinstance(obj, np.float64):
+            return float(obj)
+        if default is None:
+            raise TypeError(f"Unserializable object {obj} of type {type(obj)}")
+        return default(obj)
+
+    option = orjson.OPT_NON_STR_KEYS
+    if default not in {json_iso_dttm_ser, pessimistic_json_iso_dttm_ser}:
+        option |= orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+
+    try:
+        return orjson.dumps(obj, default=orjson_default, option=option).decode("utf-8")
+    except TypeError:
+        # eg, integers larger than 64 bits or objects `default` can't serialize; the
+        # latter fail again with simplejson, raising the error callers expect
+        return None
+
+
 def redact_sensitive(
     payload: dict[str, Any],
     sensitive_fields: set[str],
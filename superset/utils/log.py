@@ -16,10 +16,15 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -28,6 +33,7 @@ from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
 from flask import g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset.extensions import stats_logger_manager
@@ -324,6 +330,9 @@ class AbstractEventLogger(ABC):
         """Decorator that instrument `update_log_payload` to kwargs"""
         return self._wrapper(f, allow_extra_payload=True)
 
+    def flush(self) -> None:  # noqa: B027
+        """Write any buffered events; called when a worker process shuts down"""
+
 
 def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
     """
@@ -371,7 +380,7 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
+    def log(  # pylint: disable=too-many-arguments
         self,
         user_id: int | None,
         action: str,
@@ -386,24 +395,18 @@ class DBEventLogger(AbstractEventLogger):
         from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+        logs = [
+            Log(**values)
+            for values in self.get_log_values(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
             )
-            logs.append(log)
+        ]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -422,6 +425,180 @@ class DBEventLogger(AbstractEventLogger):
                     "DBEventLogger failed to rollback the session after failure"
                 )
 
+    @staticmethod
+    def get_log_values(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Return the column values of the log rows of a set of records"""
+        values = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            values.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return values
+
+
+class AsyncDBEventLogger(DBEventLogger):
+    """
+    Event logger that commits logs to Superset DB in batches, from a background thread
+
+    Events are buffered in a bounded in-memory queue instead of being written as part
+    of the request, and written by a daemon thread using its own connections, every
+    ``flush_interval`` seconds or as soon as ``batch_size`` events are buffered.
+    Events logged while the queue is full are dropped and counted in ``dropped``.
+    Buffered events are flushed when the process exits.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 5,
+        batch_size: int = 500,
+        max_queue_size: int = 10000,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(max_queue_size)
+        self._engine: Engine | None = None
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self._atexit_registered = False
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+
+        self._start(db.engine)
+
+        # the timestamp is the time of the event, not the time it's written
+        dttm = datetime.utcnow()
+        for values in self.get_log_values(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        ):
+            try:
+                self._queue.put_nowait({**values, "dttm": dttm})
+            except queue.Full:
+                self._drop(1)
+
+    def _start(self, engine: Engine) -> None:
+        """
+        Start the background thread, if it's not running in the current process.
+
+        Threads don't survive a fork, so a forked worker (gunicorn, Celery prefork)
+        discards the queue inherited from its parent and starts its own thread.
+        """
+        with self._lock:
+            if (pid := os.getpid()) != self._pid:
+                self._queue = queue.Queue(self.max_queue_size)
+                self._thread = None
+                self._pid = pid
+
+            if self._thread is None:
+                self._engine = engine
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="AsyncDBEventLogger",
+                    daemon=True,
+                )
+                self._thread.start()
+
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def _run(self) -> None:
+        while True:
+            if batch := self._get_batch():
+                self._write(batch)
+
+    def _get_batch(self) -> list[dict[str, Any]]:
+        """
+        Wait for a batch of events, until it's full or the flush interval elapses.
+        """
+        batch: list[dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.models.core import Log
+
+        try:
+            with self._engine.begin() as connection:  # type: ignore
+                connection.execute(Log.__table__.insert(), batch)
+        except Exception:  # pylint: disable=broad-except
+            # the thread must survive errors, eg, the metadata database being down
+            logger.exception(
+                "AsyncDBEventLogger failed to write %d event(s)", len(batch)
+            )
+            self._drop(len(batch))
+
+    def _drop(self, count: int) -> None:
+        with self._lock:
+            self.dropped += count
+        stats_logger_manager.instance.incr("event_logger.dropped")
+
+    def flush(self) -> None:
+        """Write all the buffered events from the calling thread"""
+        if self._engine is None or self._pid != os.getpid():
+            return
+
+        while True:
+            batch: list[dict[str, Any]] = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if not batch:
+                break
+            self._write(batch)
+
 
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
@@ -0,0 +1,117 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A bounded, thread-safe LRU cache, for the process-wide caches of Superset."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded, thread-safe LRU cache.
+
+    Unlike `functools.lru_cache`, the cache is sized after being created, when the app
+    is initialized from the configuration, and is disabled until then or while the
+    size is 0. `on_evict` is called, outside of the lock, with the values evicted to
+    respect the size, eg. to release their resources.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        on_evict: Callable[[V], None] | None = None,
+    ) -> None:
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._on_evict = on_evict
+        self.max_size = max_size
+
+    def configure(self, max_size: int) -> None:
+        """
+        Set the size of the cache, evicting the entries that don't fit anymore.
+        """
+        with self._lock:
+            self.max_size = max_size
+            evicted = self._evict()
+        self._evicted(evicted)
+
+    def is_enabled(self) -> bool:
+        return self.max_size > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def _evict(self) -> list[V]:
+        evicted = []
+        while len(self._entries) > max(self.max_size, 0):
+            evicted.append(self._entries.popitem(last=False)[1])
+        return evicted
+
+    def _evicted(self, values: list[V]) -> None:
+        if self._on_evict:
+            for value in values:
+                self._on_evict(value)
+
+    def get(self, key: K) -> V | None:
+        """
+        Return a cached value, marking it as the most recently used.
+        """
+        with self._lock:
+            if (value := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Cache a value, evicting the least recently used ones beyond the size.
+        """
+        if not self.is_enabled():
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            evicted = self._evict()
+        self._evicted(evicted)
+
+    def pop(self, key: K) -> V | None:
+        """
+        Remove a value from the cache, returning it.
+        """
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def items(self) -> list[tuple[K, V]]:
+        """
+        Return the cached entries, from the least to the most recently used.
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -14,16 +14,258 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Optional
+from typing import Any, Optional
 
 import geohash as geohash_lib
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from flask_babel import gettext as _
 from geopy.point import Point
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype, is_object_dtype, is_string_dtype
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing.utils import _append_columns
 
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# length of the geohashes encoded by `geohash.encode`, and longest geohash decoded
+# with NumPy: its 60 bits fit in 64-bit integers
+GEOHASH_PRECISION = 12
+# number of bits of the latitudes and longitudes in these geohashes
+GEOHASH_BITS = GEOHASH_PRECISION * 5 // 2
+
+# value of each geohash character by code point, or -1 for invalid characters; the
+# null code point pads shorter geohashes
+_GEOHASH_VALUES = np.full(128, -1, dtype=np.int8)
+_GEOHASH_VALUES[0] = 0
+for _value, _char in enumerate(GEOHASH_BASE32):
+    _GEOHASH_VALUES[ord(_char)] = _GEOHASH_VALUES[ord(_char.upper())] = _value
+
+# masks to interleave the bits of two 32-bit integers, see `_spread_bits`
+_MORTON_MASKS = [
+    (16, 0x0000FFFF0000FFFF),
+    (8, 0x00FF00FF00FF00FF),
+    (4, 0x0F0F0F0F0F0F0F0F),
+    (2, 0x3333333333333333),
+    (1, 0x5555555555555555),
+]
+
+# geodetic points in decimal degrees, with an optional altitude in km or m; other
+# formats supported by geopy are parsed one by one
+_DECIMAL = r"[+-]?\d+(?:\.\d+)?"
+GEODETIC_POINT_REGEX = (
+    rf"^\s*(?P<latitude>{_DECIMAL})\s*,\s*(?P<longitude>{_DECIMAL})"
+    rf"(?:\s*,\s*(?P<altitude>{_DECIMAL})[ ]*(?P<unit>km|m))?\s*$"
+)
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Spread the bits of 32-bit integers to the even bits of 64-bit integers.
+    """
+    values = values.astype(np.uint64)
+    for shift, mask in _MORTON_MASKS:
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _compact_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Gather the even bits of 64-bit integers into 32-bit integers.
+    """
+    masks = [mask for _, mask in reversed(_MORTON_MASKS)] + [0xFFFFFFFF]
+    values = values & np.uint64(masks[0])
+    for shift, mask in zip((1, 2, 4, 8, 16), masks[1:], strict=True):
+        values = (values | (values >> np.uint64(shift))) & np.uint64(mask)
+    return values.astype(np.int64)
+
+
+def _is_text(series: Series) -> bool:
+    return is_object_dtype(series.dtype) or is_string_dtype(series.dtype)
+
+
+def decode_geohashes(geohashes: Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode geohashes into the latitudes and longitudes of the centers of their cells.
+
+    Geohashes are decoded with NumPy, as `geohash.decode` would; those which can't
+    be, eg. longer than `GEOHASH_PRECISION` or invalid, are passed to
+    `geohash.decode` one by one, raising the same errors.
+
+    :param geohashes: Geohash strings
+    :return: Latitudes and longitudes
+    :raises ValueError: If a geohash contains invalid characters
+    :raises TypeError: If a geohash is not a string
+    """
+    size = len(geohashes)
+    values = geohashes.to_numpy(dtype=object)
+    latitudes = np.empty(size, dtype=np.float64)
+    longitudes = np.empty(size, dtype=np.float64)
+
+    fast = np.zeros(size, dtype=bool)
+    if size and infer_dtype(values, skipna=False) == "string":
+        lengths = np.fromiter(map(len, values), dtype=np.int64, count=size)
+        fast = lengths <= GEOHASH_PRECISION
+
+    if fast.any():
+        lengths = lengths[fast]
+        codes = (
+            np.array(values[fast], dtype=f"U{GEOHASH_PRECISION}")
+            .view(np.uint32)
+            .reshape(-1, GEOHASH_PRECISION)
+        )
+        # code points past the table are looked up as DEL, which is invalid, and
+        # geohashes containing nulls have fewer non-null code points than characters
+        chars = _GEOHASH_VALUES[np.minimum(codes, 127)]
+        valid = (chars >= 0).all(axis=1) & (np.count_nonzero(codes, axis=1) == lengths)
+
+        # bits alternate between longitude and latitude, starting with longitude;
+        # the bits missing from shorter geohashes are zeros
+        weights = 1 << (5 * np.arange(GEOHASH_PRECISION - 1, -1, -1, dtype=np.int64))
+        bits = (chars.astype(np.int64) @ weights).view(np.uint64)
+        lat_bits = lengths * 5 // 2
+        lon_bits = lengths * 5 - lat_bits
+        lat_ints = _compact_bits(bits) >> (GEOHASH_BITS - lat_bits)
+        lon_ints = _compact_bits(bits >> np.uint64(1)) >> (GEOHASH_BITS - lon_bits)
+
+        # cells are exactly representable, so this is the same as `geohash.decode`
+        lat_deltas = 90.0 / (1 << lat_bits)
+        lon_deltas = 180.0 / (1 << lon_bits)
+        indexes = np.flatnonzero(fast)
+        fast[indexes[~valid]] = False
+        latitudes[indexes] = lat_ints * 2 * lat_deltas - 90.0 + lat_deltas
+        longitudes[indexes] = lon_ints * 2 * lon_deltas - 180.0 + lon_deltas
+
+    for index in np.flatnonzero(~fast):
+        latitudes[index], longitudes[index] = geohash_lib.decode(values[index])
+    return latitudes, longitudes
+
+
+def encode_geohashes(latitudes: Any, longitudes: Any) -> np.ndarray:
+    """
+    Encode latitudes and longitudes into geohashes, as `geohash.encode` would.
+
+    :param latitudes: Latitudes, in the [-90; 90) range
+    :param longitudes: Longitudes
+    :return: Geohashes of `GEOHASH_PRECISION` characters
+    :raises ValueError: If a coordinate is not a finite number, or a latitude is out
+        of range
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.array(longitudes, dtype=np.float64)
+    if not (np.isfinite(latitudes).all() and np.isfinite(longitudes).all()):
+        raise ValueError("Coordinates must be finite")
+    if ((latitudes < -90.0) | (latitudes >= 90.0)).any():
+        raise ValueError("Latitudes must be in the [-90; 90) range")
+
+    # wrap longitudes into [-180; 180) the way `geohash.encode` does, which only
+    # takes a few steps for the longitudes within a turn of the range
+    far = np.abs(longitudes) >= 540.0
+    longitudes[far] = np.fmod(longitudes[far], 360.0)
+    while (below := longitudes < -180.0).any():
+        longitudes[below] += 360.0
+    while (above := longitudes >= 180.0).any():
+        longitudes[above] -= 360.0
+
+    # bits alternate between longitude and latitude, starting with longitude
+    bits = (
+        _spread_bits(_get_cell_indexes(longitudes, -180.0, 360.0)) << np.uint64(1)
+    ) | _spread_bits(_get_cell_indexes(latitudes, -90.0, 180.0))
+
+    alphabet = np.frombuffer(GEOHASH_BASE32.encode(), dtype=np.uint8)
+    chars = np.stack(
+        [
+            alphabet[
+                (bits >> np.uint64(5 * (GEOHASH_PRECISION - 1 - position)))
+                & np.uint64(31)
+            ]
+            for position in range(GEOHASH_PRECISION)
+        ],
+        axis=1,
+    )
+    return chars.view(f"S{GEOHASH_PRECISION}").ravel().astype(str).astype(object)
+
+
+def _get_cell_indexes(values: np.ndarray, start: float, extent: float) -> np.ndarray:
+    """
+    Return the indexes of the cells containing values, out of `2 ** GEOHASH_BITS`.
+
+    The estimates are corrected by comparing values to the bounds of their cells,
+    which are exactly representable, so that rounding never moves a value to a
+    neighboring cell.
+    """
+    size = extent / (1 << GEOHASH_BITS)
+    indexes = np.floor((values - start) / size).astype(np.int64)
+    indexes = np.clip(indexes, 0, (1 << GEOHASH_BITS) - 1)
+    indexes -= indexes * size + start > values
+    indexes += (indexes + 1) * size + start <= values
+    return indexes
+
+
+def parse_geodetic_points(points: Series) -> tuple[np.ndarray, ...]:
+    """
+    Parse geodetic point strings into latitudes, longitudes and altitudes in km.
+
+    Points in decimal degrees, matching `GEODETIC_POINT_REGEX`, are parsed with
+    Arrow, as `geopy.point.Point` would; others are passed to `Point` one by one,
+    raising the same errors.
+
+    :param points: Geodetic point strings
+    :return: Latitudes, longitudes and altitudes
+    :raises ValueError: If a point can't be parsed
+    """
+    size = len(points)
+    values = points.to_numpy(dtype=object)
+    latitudes = np.empty(size, dtype=np.float64)
+    longitudes = np.empty(size, dtype=np.float64)
+    altitudes = np.empty(size, dtype=np.float64)
+
+    fast = np.zeros(size, dtype=bool)
+    if _is_text(points):
+        try:
+            parts = pc.extract_regex(
+                pa.array(values, type=pa.string(), from_pandas=True),
+                GEODETIC_POINT_REGEX,
+            )
+            fast = parts.is_valid().to_numpy(zero_copy_only=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+
+    if fast.any():
+        parts = parts.filter(pa.array(fast))
+
+        def to_floats(field: str) -> np.ndarray:
+            strings = parts.field(field)
+            strings = pc.if_else(pc.equal(strings, ""), "0", strings)
+            return pc.cast(strings, pa.float64()).to_numpy(
+                zero_copy_only=False, writable=True
+            )
+
+        lats, lons, alts = map(to_floats, ("latitude", "longitude", "altitude"))
+        meters = pc.equal(parts.field("unit"), "m").to_numpy(zero_copy_only=False)
+        alts[meters] /= 1000.0
+
+        # longitudes are normalized into [-180; 180), latitudes out of range are
+        # rejected by `Point`
+        far = np.abs(lons) > 180.0
+        wrapped = np.fmod(lons[far], 360.0)
+        wrapped[wrapped < -180.0] += 360.0
+        wrapped[wrapped >= 180.0] -= 360.0
+        lons[far] = wrapped
+
+        indexes = np.flatnonzero(fast)
+        fast[indexes[np.abs(lats) > 90.0]] = False
+        # adding zero turns -0.0 into 0.0, as `Point` does
+        latitudes[indexes] = lats + 0.0
+        longitudes[indexes] = lons + 0.0
+        altitudes[indexes] = alts + 0.0
+
+    for index in np.flatnonzero(~fast):
+        point = Point(values[index])
+        latitudes[index], longitudes[index], altitudes[index] = point[:3]
+    return latitudes, longitudes, altitudes
+
 
 def geohash_decode(
     df: DataFrame, geohash: str, longitude: str, latitude: str
@@ -38,9 +280,9 @@ def geohash_decode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        lonlat_df = DataFrame()
-        lonlat_df["latitude"], lonlat_df["longitude"] = zip(
-            *df[geohash].apply(geohash_lib.decode), strict=False
+        latitudes, longitudes = decode_geohashes(df[geohash])
+        lonlat_df = DataFrame(
+            {"latitude": latitudes, "longitude": longitudes}, index=df.index
         )
         return _append_columns(
             df, lonlat_df, {"latitude": latitude, "longitude": longitude}
@@ -65,14 +307,12 @@ def geohash_encode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        encode_df = df[[latitude, longitude]]
-        encode_df.columns = ["latitude", "longitude"]
-        encode_df["geohash"] = encode_df.apply(
-            lambda row: geohash_lib.encode(row["latitude"], row["longitude"]),
-            axis=1,
+        encode_df = DataFrame(
+            {"geohash": encode_geohashes(df[latitude], df[longitude])},
+            index=df.index,
         )
         return _append_columns(df, encode_df, {"geohash": geohash})
-    except ValueError as ex:
+    except (TypeError, ValueError) as ex:
         raise InvalidPostProcessingError(_("Invalid longitude/latitude")) from ex
 
 
@@ -94,22 +334,12 @@ def geodetic_parse(
     :param altitude: Name of new column to be created containing altitude.
     :return: DataFrame with decoded longitudes and latitudes
     """
-
-    def _parse_location(location: str) -> tuple[float, float, float]:
-        """
-        Parse a string containing a geodetic point and return latitude, longitude
-        and altitude
-        """
-        point = Point(location)
-        return point[0], point[1], point[2]
-
     try:
-        geodetic_df = DataFrame()
-        (
-            geodetic_df["latitude"],
-            geodetic_df["longitude"],
-            geodetic_df["altitude"],
-        ) = zip(*df[geodetic].apply(_parse_location), strict=False)
+        latitudes, longitudes, altitudes = parse_geodetic_points(df[geodetic])
+        geodetic_df = DataFrame(
+            {"latitude": latitudes, "longitude": longitudes, "altitude": altitudes},
+            index=df.index,
+        )
         columns = {"latitude": latitude, "longitude": longitude}
         if altitude:
             columns["altitude"] = altitude
@@ -0,0 +1,213 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Process-wide cache of the latest partitions of tables.
+
+Engines with partitioned tables (Presto, Trino, Hive) look up the latest partition
+of a table with a query to the warehouse when building ``SELECT *`` queries, table
+metadata, and when rendering the ``latest_partition`` macros, which happens on every
+render of the charts using them. Lookups are cached per table for
+``LATEST_PARTITION_CACHE_TIMEOUT`` seconds, and concurrent lookups for the same table
+are coalesced, so that only one of them queries the warehouse.
+
+With ``LATEST_PARTITION_CACHE_REFRESH``, entries older than half the timeout are
+refreshed in a background thread when read, so that tables that are queried often
+are never looked up while serving a request.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any, Callable, TYPE_CHECKING
+
+from flask import current_app
+
+from superset.extensions import db
+from superset.utils.concurrency import capture_g
+from superset.utils.core import get_username
+from superset.utils.lru import LRUCache
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+    from superset.sql.parse import Table
+
+logger = logging.getLogger(__name__)
+
+PartitionKey = tuple[Hashable, ...]
+PartitionLoader = Callable[["Database"], Any]
+
+
+class PartitionCache:
+    """
+    A bounded, thread-safe cache of partition lookups, with expiration.
+
+    The cache is disabled until configured with a size, from
+    `LATEST_PARTITION_CACHE_SIZE`.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        # key -> (value, time of the lookup)
+        self._entries: LRUCache[PartitionKey, tuple[Any, float]] = LRUCache(max_size)
+        # events of the lookups in progress, set when they're done
+        self._loading: dict[PartitionKey, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_timeout() -> int:
+        return current_app.config["LATEST_PARTITION_CACHE_TIMEOUT"]
+
+    def configure(self, max_size: int) -> None:
+        self._entries.configure(max_size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(
+        database: Database,
+        table: Table,
+        lookup: str,
+        *args: Hashable,
+    ) -> PartitionKey | None:
+        """
+        Return the key of a lookup, or None if it can't be cached.
+
+        Partitions visible to impersonated users can differ, so the user is part of
+        the key when the database impersonates them. Lookups against databases that
+        are not saved, eg, when testing a connection, are not cached.
+
+        :param database: The database of the table
+        :param table: The table
+        :param lookup: The name of the lookup
+        :param args: The arguments of the lookup
+        :returns: The cache key
+        """
+        if database.id is None:
+            return None
+
+        username = get_username() if database.impersonate_user else None
+        return (database.id, username, table, lookup, *args)
+
+    def get(self, key: PartitionKey) -> tuple[Any, float] | None:
+        return self._entries.get(key)
+
+    def set(self, key: PartitionKey, value: Any) -> None:
+        self._entries.set(key, (value, time.monotonic()))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_or_load(
+        self,
+        key: PartitionKey | None,
+        database: Database,
+        load: PartitionLoader,
+    ) -> Any:
+        """
+        Return the result of a lookup, from the cache if it hasn't expired.
+
+        If the same lookup is in progress in another thread, wait for it instead of
+        querying the warehouse again; if it fails, the lookup is run again. Errors
+        are not cached.
+
+        :param key: The key of the lookup, from `get_key`
+        :param database: The database to run the lookup against
+        :param load: The lookup, called with the database
+        :returns: The result of the lookup
+        """
+        timeout = self.get_timeout()
+        if key is None or timeout <= 0 or not self._entries.is_enabled():
+            return load(database)
+
+        stats_logger = current_app.config["STATS_LOGGER"]
+        while True:
+            if (entry := self.get(key)) is not None:
+                value, loaded_at = entry
+                age = time.monotonic() - loaded_at
+                if age < timeout:
+                    stats_logger.incr("latest_partition_cache.hit")
+                    if age >= timeout / 2 and current_app.config.get(
+                        "LATEST_PARTITION_CACHE_REFRESH"
+                    ):
+                        self._refresh(key, database, load)
+                    return value
+
+            with self._lock:
+                event = self._loading.get(key)
+                if event is None:
+                    event = self._loading[key] = threading.Event()
+                    break
+
+            # another thread is looking up the same partitions; if it takes too long,
+            # run the lookup in this thread as well
+            if not event.wait(timeout):
+                return load(database)
+            stats_logger.incr("latest_partition_cache.coalesced")
+
+        stats_logger.incr("latest_partition_cache.miss")
+        try:
+            value = load(database)
+            self.set(key, value)
+            return value
+        finally:
+            self._done(key, event)
+
+    def _done(self, key: PartitionKey, event: threading.Event) -> None:
+        with self._lock:
+            del self._loading[key]
+        event.set()
+
+    def _refresh(
+        self,
+        key: PartitionKey,
+        database: Database,
+        load: PartitionLoader,
+    ) -> None:
+        """
+        Run a lookup in a background thread, unless it's already in progress.
+
+        The thread runs in a new app context with the current user and request data
+        of ``flask.g`` (see `capture_g`), and loads the user and the database in its
+        own session, since the request's session may be closed by then.
+        """
+        with self._lock:
+            if key in self._loading:
+                return
+            event = self._loading[key] = threading.Event()
+
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        restore_g = capture_g()
+        model, database_id = type(database), database.id
+
+        def refresh() -> None:
+            try:
+                with app.app_context():
+                    restore_g()
+                    self.set(key, load(db.session.get(model, database_id)))
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Unable to refresh the latest partition", exc_info=True)
+            finally:
+                self._done(key, event)
+
+        app.config["STATS_LOGGER"].incr("latest_partition_cache.refresh")
+        threading.Thread(target=refresh, daemon=True).start()
+
+
+partition_cache = PartitionCache()
@@ -0,0 +1,40 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Process-wide cache of the compiled parts of chart queries.
+
+Building the SQL of a chart query validates and rewrites every adhoc SQL expression
+(metrics, columns, orderings and custom WHERE/HAVING clauses) with sqlglot, which
+dominates the compilation time of most queries. Those expressions rarely change
+between requests: loading a dashboard or changing the value of a native filter
+recompiles the same expressions over and over, so their processed form is kept in a
+bounded LRU cache, sized by ``QUERY_PLAN_CACHE_SIZE``.
+
+Entries are keyed by the database engine and the expression after Jinja rendering,
+so that templated expressions are cached per rendered value. Expressions with
+sub-queries are never cached, since row level security predicates are added to them
+depending on the current user.
+"""
+
+from __future__ import annotations
+
+from superset.utils.lru import LRUCache
+
+# keyed by the database engine and the rendered expression
+PlanKey = tuple[str, str]
+
+query_plan_cache: LRUCache[PlanKey, str] = LRUCache()
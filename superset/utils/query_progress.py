@@ -0,0 +1,214 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Progress tracking of the queries running in SQL Lab.
+
+Engine specs polling a live cursor for the progress of a query (Presto, Trino, Hive)
+used to read the status of the query from the metadata database and commit its
+progress on every poll, so that each running query wrote to the metadata database
+every second or so. Instead:
+
+- polls are spaced with an exponential backoff, from the interval configured for the
+  engine up to ``QUERY_PROGRESS_MAX_POLL_INTERVAL``;
+- progress updates are buffered, and the ones of all the queries running in the
+  process are written at most every ``QUERY_PROGRESS_SYNC_INTERVAL`` seconds, in a
+  single transaction which also reads back their status, so that stopped queries
+  are detected without reading the metadata database on every poll.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Select
+
+from superset.common.db_query_status import QueryStatus
+from superset.constants import QUERY_EARLY_CANCEL_KEY
+from superset.extensions import db
+from superset.models.sql_lab import Query
+from superset.utils import json
+
+logger = logging.getLogger(__name__)
+
+STOPPED_STATUSES = {QueryStatus.STOPPED, QueryStatus.TIMED_OUT}
+
+
+def get_poll_intervals(initial: float) -> Iterator[float]:
+    """
+    Yield the intervals between polls of a running query.
+
+    The interval doubles after each poll, up to ``QUERY_PROGRESS_MAX_POLL_INTERVAL``
+    seconds, or the initial interval if it's longer.
+
+    :param initial: The interval configured for the engine, in seconds
+    """
+    maximum = max(initial, current_app.config["QUERY_PROGRESS_MAX_POLL_INTERVAL"])
+    interval = initial
+    while True:
+        yield interval
+        interval = min(interval * 2, maximum)
+
+
+class QueryProgressTracker:
+    """
+    Track the progress and status of the queries running in the process.
+    """
+
+    def __init__(self) -> None:
+        # progress not written yet, by query ID
+        self._progress: dict[int, float] = {}
+        # last known status and early cancelation flag, by query ID
+        self._statuses: dict[int, tuple[str | None, bool]] = {}
+        self._synced_at = 0.0
+        self._syncing = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, query: Query) -> Iterator[None]:
+        """
+        Track a query while its cursor is polled.
+
+        Progress that hasn't been written yet when the query stops being tracked is
+        written right away, so that it's up to date when the query completes.
+        """
+        query_id = query.id
+        if query_id is None:
+            yield
+            return
+
+        with self._lock:
+            self._statuses[query_id] = (query.status, False)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._statuses.pop(query_id, None)
+                progress = self._progress.pop(query_id, None)
+            if progress is not None:
+                self._write({query_id: progress})
+
+    def update(self, query: Query, progress: float) -> None:
+        """
+        Update the progress of a query, to be written at the next sync.
+
+        The progress is also set on the query object, without marking it as modified.
+        """
+        set_committed_value(query, "progress", progress)
+        with self._lock:
+            if query.id in self._statuses:
+                self._progress[query.id] = progress
+
+    def is_stopped(self, query: Query) -> bool:
+        """
+        Return whether a query was stopped, timed out, or canceled before it started.
+
+        The status is read from the metadata database at most once per sync interval,
+        for all the tracked queries.
+        """
+        self.sync()
+        if query.status in STOPPED_STATUSES or query.extra.get(QUERY_EARLY_CANCEL_KEY):
+            return True
+        status, early_cancel = self._statuses.get(query.id, (None, False))
+        return status in STOPPED_STATUSES or early_cancel
+
+    def sync(self) -> None:
+        """
+        Write the pending progress and read the status of the tracked queries, unless
+        it was done less than ``QUERY_PROGRESS_SYNC_INTERVAL`` seconds ago.
+        """
+        interval = current_app.config["QUERY_PROGRESS_SYNC_INTERVAL"]
+        with self._lock:
+            now = time.monotonic()
+            if self._syncing or not self._statuses or now - self._synced_at < interval:
+                return
+            self._syncing = True
+            self._synced_at = now
+            progress, self._progress = self._progress, {}
+            query_ids = list(self._statuses)
+
+        try:
+            rows = self._write(
+                progress,
+                select(Query.id, Query.status, Query.extra_json).where(
+                    Query.id.in_(query_ids)
+                ),
+            )
+        finally:
+            with self._lock:
+                self._syncing = False
+
+        with self._lock:
+            for query_id, status, extra_json in rows:
+                if query_id in self._statuses:
+                    self._statuses[query_id] = (status, _is_early_cancel(extra_json))
+
+    def _write(
+        self,
+        progress: dict[int, float],
+        read: Select | None = None,
+    ) -> list[Any]:
+        """
+        Write progress in a single transaction, running a read in it if any.
+
+        Progress only ever increases, so that writes racing with the completion of a
+        query don't overwrite its final progress. On failure, the progress is kept to
+        be written at the next sync.
+        """
+        table = Query.__table__
+        try:
+            with db.engine.begin() as connection:
+                if progress:
+                    connection.execute(
+                        table.update()
+                        .where(table.c.id == bindparam("query_id"))
+                        .where(
+                            func.coalesce(table.c.progress, 0)
+                            < bindparam("new_progress")
+                        )
+                        .values(progress=bindparam("new_progress")),
+                        [
+                            {"query_id": query_id, "new_progress": value}
+                            for query_id, value in progress.items()
+                        ],
+                    )
+                return connection.execute(read).all() if read is not None else []
+        except SQLAlchemyError:
+            logger.warning("Unable to sync the progress of queries", exc_info=True)
+            with self._lock:
+                for query_id, value in progress.items():
+                    if query_id in self._statuses:
+                        self._progress.setdefault(query_id, value)
+            return []
+
+
+def _is_early_cancel(extra_json: str | None) -> bool:
+    try:
+        return bool((json.loads(extra_json or "{}") or {}).get(QUERY_EARLY_CANCEL_KEY))
+    except (TypeError, json.JSONDecodeError):
+        return False
+
+
+progress_tracker = QueryProgressTracker()
@@ -39,12 +39,18 @@ from superset.exceptions import (
     SupersetException,
     SupersetSecurityException,
 )
-from superset.extensions import cache_manager, feature_flag_manager, security_manager
+from superset.extensions import (
+    cache_manager,
+    feature_flag_manager,
+    results_backend_manager,
+    security_manager,
+)
 from superset.legacy import update_time_range
 from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab import chunked_results
 from superset.superset_typing import (
     ExplorableData,
     FlaskResponse,
@@ -541,8 +547,25 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize a SQL Lab payload read from the results backend.
+
+    When the results were stored in chunks only the ones covering the requested
+    rows are read; otherwise `offset` and `limit` are applied after deserializing.
+
+    :param payload: The decompressed payload
+    :param query: The query the results belong to
+    :param use_msgpack: Whether the payload is serialized with msgpack and Arrow
+    :param offset: The first row to return
+    :param limit: The maximum number of rows to return; all of them if None
+    :returns: The deserialized payload
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -551,11 +574,21 @@ def _deserialize_results_payload(
             ds_payload = msgpack.loads(payload, raw=False)
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
+            if manifest := chunked_results.get_manifest(ds_payload):
+                pa_table = chunked_results.read_chunks(
+                    results_backend_manager.results_backend,
+                    manifest,
+                    offset,
+                    limit,
+                )
+            else:
+                try:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+                except pa.ArrowSerializationError as ex:
+                    raise SerializationError("Unable to deserialize table") from ex
+                if offset or limit is not None:
+                    pa_table = pa_table.slice(offset, limit)
 
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
         ds_payload["data"] = dataframe.df_to_records(df) or []
@@ -575,7 +608,13 @@ def _deserialize_results_payload(
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+
+    if (offset or limit is not None) and ds_payload.get("data") is not None:
+        stop = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:stop]
+
+    return ds_payload
 
 
 def get_cta_schema_name(
@@ -79,6 +79,10 @@ from superset.utils.core import (
 )
 from superset.utils.date_parser import get_since_until, parse_past_timedelta
 from superset.utils.hashing import hash_from_str
+from superset.utils.pandas_postprocessing.geography import (
+    decode_geohashes,
+    parse_geodetic_points,
+)
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import BaseDatasource
@@ -1827,11 +1831,35 @@ class BaseDeckGLViz(BaseViz):
                 _("Invalid spatial point encountered: %(latlong)s", latlong=latlong)
             ) from ex
 
+    @classmethod
+    def _parse_coordinates_column(
+        cls, values: pd.Series
+    ) -> list[tuple[float, float] | None]:
+        """
+        Parse a column of coordinates, as `parse_coordinates` does for each value.
+        """
+        present = values.to_numpy(dtype=object).astype(bool)
+        try:
+            latitudes, longitudes, _ = parse_geodetic_points(values[present])
+        except Exception:  # pylint: disable=broad-except
+            # parse the values one by one to report the invalid one
+            return values.apply(cls.parse_coordinates).tolist()
+
+        points: list[tuple[float, float] | None] = [None] * len(values)
+        for index, latitude, longitude in zip(
+            np.flatnonzero(present).tolist(),
+            latitudes.tolist(),
+            longitudes.tolist(),
+            strict=True,
+        ):
+            points[index] = (latitude, longitude)
+        return points
+
     @staticmethod
     @deprecated(deprecated_in="3.0")
     def reverse_geohash_decode(geohash_code: str) -> tuple[str, str]:
-        lat, lng = geohash.decode(geohash_code)
-        return (lng, lat)
+        latitudes, longitudes = decode_geohashes(pd.Series([geohash_code]))
+        return (longitudes.item(), latitudes.item())
 
     @staticmethod
     @deprecated(deprecated_in="3.0")
@@ -1854,10 +1882,11 @@ class BaseDeckGLViz(BaseViz):
             )
         elif spatial.get("type") == "delimited":
             lon_lat_col = spatial.get("lonlatCol")
-            df[key] = df[lon_lat_col].apply(self.parse_coordinates)
+            df[key] = self._parse_coordinates_column(df[lon_lat_col])
             del df[lon_lat_col]
         elif spatial.get("type") == "geohash":
-            df[key] = df[spatial.get("geohashCol")].map(self.reverse_geohash_decode)
+            latitudes, longitudes = decode_geohashes(df[spatial.get("geohashCol")])
+            df[key] = list(zip(longitudes.tolist(), latitudes.tolist(), strict=True))
             del df[spatial.get("geohashCol")]
 
         if spatial.get("reverseCheckbox"):
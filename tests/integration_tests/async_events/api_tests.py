@@ -136,3 +136,56 @@ class TestAsyncEventApi(SupersetTestCase):
         self.client.set_cookie(app.config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_NAME"], "")
         rv = self.fetch_events()
         assert rv.status_code == 401
+
+    def _test_events_long_poll_logic(self, mock_cache):
+        with mock.patch.object(mock_cache, "xread") as mock_xread:
+            mock_xread.return_value = []
+            rv = self.client.get(
+                "api/v1/async_event/?last_id=1607471525180-0&timeout=3600"
+            )
+            response = json.loads(rv.data.decode("utf-8"))
+
+        assert rv.status_code == 200
+        channel_id = app.config["GLOBAL_ASYNC_QUERIES_REDIS_STREAM_PREFIX"] + self.UUID
+        # the timeout is capped by the heartbeat interval
+        timeout = app.config["GLOBAL_ASYNC_QUERIES_STREAM_HEARTBEAT"] * 1000
+        mock_xread.assert_called_with({channel_id: "1607471525180-0"}, 100, timeout)
+        assert response == {"result": []}
+
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_events_long_poll(self, mock_uuid4):
+        self.run_test_with_cache_backend(
+            RedisCacheBackend, self._test_events_long_poll_logic
+        )
+
+    def _test_stream_logic(self, mock_cache):
+        with mock.patch.object(
+            async_query_manager,
+            "stream_events",
+            return_value=iter([": heartbeat\n\n"]),
+        ) as mock_stream_events:
+            rv = self.client.get(
+                "api/v1/async_event/stream",
+                headers={"Last-Event-ID": "1607471525180-0"},
+            )
+
+            assert rv.status_code == 200
+            assert rv.mimetype == "text/event-stream"
+            assert rv.data == b": heartbeat\n\n"
+
+        mock_stream_events.assert_called_once_with(
+            self.UUID,
+            "1607471525180-0",
+            heartbeat=app.config["GLOBAL_ASYNC_QUERIES_STREAM_HEARTBEAT"],
+            duration=app.config["GLOBAL_ASYNC_QUERIES_STREAM_DURATION"],
+        )
+
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_stream(self, mock_uuid4):
+        self.run_test_with_cache_backend(RedisCacheBackend, self._test_stream_logic)
+
+    def test_stream_no_login(self):
+        app._got_first_request = False
+        async_query_manager_factory.init_app(app)
+        rv = self.client.get("api/v1/async_event/stream")
+        assert rv.status_code == 401
@@ -166,3 +166,84 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+EVENT_DATA = b'{"channel_id": "test_channel_id", "job_id": "1", "status": "done"}'
+
+
+@mark.parametrize(
+    "cache_backend",
+    [
+        mock.Mock(spec=RedisCacheBackend),
+        mock.Mock(spec=RedisSentinelCacheBackend),
+    ],
+)
+def test_read_events_timeout(async_query_manager, cache_backend):
+    async_query_manager._cache = cache_backend
+    async_query_manager._stream_prefix = "async-events-"
+    cache_backend.xread.return_value = [
+        [b"async-events-test_channel_id", [(b"1-0", {b"data": EVENT_DATA})]]
+    ]
+
+    events = async_query_manager.read_events("test_channel_id", "0-1", timeout=5)
+
+    cache_backend.xread.assert_called_once_with(
+        {"async-events-test_channel_id": "0-1"}, 100, 5000
+    )
+    cache_backend.xrange.assert_not_called()
+    assert events == [
+        {"id": "1-0", "channel_id": "test_channel_id", "job_id": "1", "status": "done"}
+    ]
+
+    # nothing happened before the timeout
+    cache_backend.xread.return_value = []
+    assert async_query_manager.read_events("test_channel_id", None, timeout=5) == []
+    cache_backend.xread.assert_called_with(
+        {"async-events-test_channel_id": "0-0"}, 100, 5000
+    )
+
+
+def test_read_events_sub_millisecond_timeout(async_query_manager):
+    cache_backend = mock.Mock(spec=RedisCacheBackend)
+    async_query_manager._cache = cache_backend
+    async_query_manager._stream_prefix = "async-events-"
+    cache_backend.xread.return_value = []
+
+    # BLOCK 0 would block forever, the timeout is rounded up instead
+    assert async_query_manager.read_events("test_channel_id", None, 0.0004) == []
+    cache_backend.xread.assert_called_once_with(
+        {"async-events-test_channel_id": "0-0"}, 100, 1
+    )
+
+    async_query_manager.read_events("test_channel_id", None, 1.0001)
+    cache_backend.xread.assert_called_with(
+        {"async-events-test_channel_id": "0-0"}, 100, 1001
+    )
+
+
+@mock.patch("superset.async_events.async_query_manager.time.monotonic")
+def test_stream_events(monotonic_mock, async_query_manager):
+    monotonic_mock.side_effect = [0, 1, 8, 10]
+    async_query_manager.read_events = Mock(
+        side_effect=[
+            [{"id": "1-0", "status": "running"}, {"id": "2-0", "status": "done"}],
+            [],
+        ]
+    )
+
+    messages = list(
+        async_query_manager.stream_events(
+            "test_channel_id", None, heartbeat=5, duration=10
+        )
+    )
+
+    assert messages == [
+        'id: 1-0\ndata: {"id": "1-0", "status": "running"}\n\n',
+        'id: 2-0\ndata: {"id": "2-0", "status": "done"}\n\n',
+        ": heartbeat\n\n",
+    ]
+    # the second read resumes after the last event, waiting at most until the end
+    assert async_query_manager.read_events.call_args_list == [
+        mock.call("test_channel_id", None, 5),
+        mock.call("test_channel_id", "2-0", 2),
+    ]
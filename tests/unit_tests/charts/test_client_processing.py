@@ -2656,6 +2656,51 @@ def test_pivot_multi_level_index():
     )
 
 
+def test_pivot_df_nested_subtotals():
+    """
+    Pivot table with subtotals on nested rows and columns.
+
+    Each subtotal follows the labels of its group and the subtotals of its
+    subgroups, and the totals come last.
+    """
+    df = pd.DataFrame(
+        {
+            "country": ["FR", "FR", "FR", "US", "US"],
+            "city": ["Paris", "Paris", "Lyon", "NYC", "NYC"],
+            "year": [2020, 2021, 2020, 2020, 2021],
+            "sales": [1, 2, 3, 4, 5],
+        }
+    )
+    pivoted = pivot_df(
+        df,
+        rows=["country", "city"],
+        columns=["year"],
+        metrics=["sales"],
+        aggfunc="Sum",
+        combine_metrics=True,
+        show_rows_total=True,
+        show_columns_total=True,
+    )
+
+    assert list(pivoted.columns) == [
+        (2020, "sales"),
+        (2020, "Subtotal"),
+        (2021, "sales"),
+        (2021, "Subtotal"),
+        ("Total (Sum)", ""),
+    ]
+    assert list(pivoted.index) == [
+        ("FR", "Lyon"),
+        ("FR", "Paris"),
+        ("FR", "Subtotal"),
+        ("US", "NYC"),
+        ("US", "Subtotal"),
+        ("Total (Sum)", ""),
+    ]
+    assert pivoted.loc[("FR", "Subtotal")].tolist() == [4, 4, 2, 2, 6]
+    assert pivoted.loc[("Total (Sum)", "")].tolist() == [8, 8, 7, 7, 15]
+
+
 @with_config({"REPORTS_CSV_NA_NAMES": []})
 def test_apply_client_processing_csv_format_preserves_na_strings():
     """
@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.charts.data.api import ChartDataRestApi
+from superset.commands.streaming_export.writers import StreamingExportFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+
+
+@pytest.mark.parametrize(
+    "result_format, mimetype",
+    [
+        (
+            ChartDataResultFormat.XLSX,
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ),
+        (ChartDataResultFormat.PARQUET, "application/vnd.apache.parquet"),
+    ],
+)
+def test_create_streaming_response(
+    mocker: MockerFixture,
+    app_context: None,
+    result_format: ChartDataResultFormat,
+    mimetype: str,
+) -> None:
+    """
+    Test that binary chart data exports are streamed with their mimetype.
+    """
+    command = mocker.patch("superset.charts.data.api.StreamingCSVExportCommand")
+    command.return_value.run.return_value = lambda: iter([b"data"])
+    query_context = mocker.MagicMock(result_format=result_format)
+
+    response = ChartDataRestApi._create_streaming_response(
+        mocker.MagicMock(),
+        {"query_context": query_context},
+        {"slice_name": "My Chart"},
+    )
+
+    assert command.call_args.args[2] == StreamingExportFormat(result_format)
+    assert response.mimetype == mimetype
+    assert response.headers["Content-Disposition"].startswith(
+        'attachment; filename="superset_My_Chart_'
+    )
+    assert response.headers["Content-Disposition"].endswith(f'.{result_format}"')
+    assert b"".join(response.response) == b"data"
+
+
+def test_send_chart_response_parquet(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that a Parquet chart data export below the streaming threshold is sent
+    at once.
+    """
+    mocker.patch(
+        "superset.charts.data.api.security_manager", new_callable=mocker.MagicMock
+    )
+    api = mocker.MagicMock()
+    api._should_use_streaming.return_value = False
+    query_context = mocker.MagicMock(
+        result_type=ChartDataResultType.FULL,
+        result_format=ChartDataResultFormat.PARQUET,
+    )
+
+    response = ChartDataRestApi._send_chart_response(
+        api,
+        {"query_context": query_context, "queries": [{"data": b"PAR1"}]},
+    )
+
+    assert response.mimetype == "application/vnd.apache.parquet"
+    assert response.headers["Content-Disposition"].endswith(".parquet")
+    assert response.get_data() == b"PAR1"
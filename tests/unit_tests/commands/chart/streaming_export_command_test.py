@@ -16,12 +16,15 @@
 # under the License.
 """Unit tests for Chart Streaming CSV Export Command."""
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pytest_mock import MockerFixture
 
 from superset.commands.chart.data.streaming_export_command import (
     StreamingCSVExportCommand,
 )
+from superset.commands.streaming_export.writers import StreamingExportFormat
 
 
 def _setup_chart_mocks(
@@ -256,3 +259,77 @@ def test_empty_result_set(mocker: MockerFixture) -> None:
     lines = [line.strip() for line in csv_data.strip().split("\n")]
     assert len(lines) == 1
     assert lines[0] == "col1,col2"
+
+
+def test_csv_generation_with_encoding_and_delimiter(mocker: MockerFixture) -> None:
+    """Test CSV chunks are encoded once, with the BOM, and use the delimiter."""
+    mock_db, query_context, datasource = _setup_chart_mocks(mocker)
+
+    mock_result = mocker.MagicMock()
+    mock_result.keys.return_value = ["name", "city"]
+    mock_result.fetchmany.side_effect = [
+        [("Zoë", "Zürich"), ("a;b", "Paris")],
+        [("c", None)],
+        [],
+    ]
+
+    mock_connection = mocker.MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = mock_result
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = mocker.MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    datasource.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+    mock_logger = mocker.patch("superset.commands.streaming_export.base.logger")
+
+    command = StreamingCSVExportCommand(
+        query_context,
+        chunk_size=2,
+        encoding="utf-8-sig",
+        delimiter=";",
+    )
+    chunks = list(command.run()())
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    data = b"".join(chunks)
+    assert data == '\ufeffname;city\r\nZoë;Zürich\r\n"a;b";Paris\r\nc;\r\n'.encode()
+    # the byte count is the one of the encoded data
+    assert mock_logger.info.call_args[0][3] == len(data) / (1024 * 1024)
+
+
+def test_parquet_generation(mocker: MockerFixture) -> None:
+    """Test Parquet exports of chart data are written batch by batch."""
+    mock_db, query_context, datasource = _setup_chart_mocks(mocker)
+
+    mock_result = mocker.MagicMock()
+    mock_result.keys.return_value = ["name", "value"]
+    mock_result.fetchmany.side_effect = [
+        [("a", 1), ("b", 2)],
+        [("c", None)],
+        [],
+    ]
+
+    mock_connection = mocker.MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = mock_result
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = mocker.MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    datasource.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+
+    command = StreamingCSVExportCommand(
+        query_context,
+        chunk_size=2,
+        export_format=StreamingExportFormat.PARQUET,
+    )
+    chunks = list(command.run()())
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    table = pq.read_table(pa.BufferReader(b"".join(chunks)))
+    assert table.to_pydict() == {"name": ["a", "b", "c"], "value": [1, 2, None]}
@@ -251,3 +251,26 @@ def test_columnar_reader_metadata_invalid_file():
         "Parsing error: Parquet file size is 2 bytes, "
         "smaller than the minimum file footer (8 bytes)"
     )
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+def test_columnar_reader_file_to_dataframes(app_context: None) -> None:
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(columns_read=["Name", "Age"]),
+    )
+    chunks = list(reader.file_to_dataframes(create_columnar_file(COLUMNAR_DATA)))
+
+    assert [chunk.index.tolist() for chunk in chunks] == [[0, 1], [2]]
+    assert [chunk.values.tolist() for chunk in chunks] == [
+        [["name1", 30], ["name2", 25]],
+        [["name3", 20]],
+    ]
+
+
+def test_columnar_reader_file_to_dataframes_wrong_columns() -> None:
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(columns_read=["Name", "xpto"]),
+    )
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        list(reader.file_to_dataframes(create_columnar_file(COLUMNAR_DATA)))
+    assert str(ex.value) == ("Parsing error: Columns expected but not found: ['xpto']")
@@ -1417,3 +1417,262 @@ def test_csv_reader_chunk_concatenation_error_warning(caplog):
             "inconsistent date parsing across chunks" in record.message
             for record in caplog.records
         )
+
+
+CSV_DATA_LARGE = [
+    ["Name", "Age"],
+    ["name1", "30"],
+    ["name2", "25"],
+    ["name3", "20"],
+    ["name4", "35"],
+    ["name5", "40"],
+]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+def test_csv_reader_file_to_dataframes(app_context: None) -> None:
+    """
+    Test that CSV files are read and cast in chunks, up to the rows to read.
+    """
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(
+            column_data_types={"Age": "float64"},
+            rows_to_read=3,
+        ),
+    )
+    chunks = list(csv_reader.file_to_dataframes(create_csv_file(CSV_DATA_LARGE)))
+
+    assert [chunk.index.tolist() for chunk in chunks] == [[0, 1], [2]]
+    assert [chunk["Age"].dtype for chunk in chunks] == ["float64", "float64"]
+    assert pd.concat(chunks).values.tolist() == [
+        ["name1", 30.0],
+        ["name2", 25.0],
+        ["name3", 20.0],
+    ]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+def test_csv_reader_file_to_dataframes_combined_types(app_context: None) -> None:
+    """
+    Test that chunks are cast to the column types of the whole file.
+    """
+    data = [
+        ["Name", "Count", "Value", "Flag"],
+        ["name1", "1", "1", "true"],
+        ["name2", "2", "2", "false"],
+        ["name3", "3", "1.5", ""],
+        ["name4", "", "foo", ""],
+    ]
+
+    csv_reader = CSVReader(options=CSVReaderOptions())
+    chunks = list(csv_reader.file_to_dataframes(create_csv_file(data)))
+
+    assert [chunk.dtypes.tolist() for chunk in chunks] == [
+        ["object", "float64", "object", "object"],
+        ["object", "float64", "object", "object"],
+    ]
+    assert pd.concat(chunks).replace({np.nan: None}).values.tolist() == [
+        ["name1", 1.0, "1", True],
+        ["name2", 2.0, "2", False],
+        ["name3", 3.0, "1.5", None],
+        ["name4", None, "foo", None],
+    ]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+@pytest.mark.parametrize("already_exists", ["fail", "append"])
+def test_csv_reader_read_chunks_combined_types(
+    app_context: None,
+    tmp_path,
+    already_exists: str,
+) -> None:
+    """
+    Test that the table is created with types holding the values of all chunks.
+    """
+    import sqlite3
+
+    from superset.models.core import Database
+
+    path = tmp_path / "upload.db"
+    database = Database(database_name="upload", sqlalchemy_uri=f"sqlite:///{path}")
+    data = [
+        ["Name", "Value"],
+        ["name1", "1"],
+        ["name2", "2"],
+        ["name3", "1.5"],
+        ["name4", "foo"],
+    ]
+
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists=already_exists))
+    csv_reader.read(create_csv_file(data), database, "table1", None)
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute(
+            "SELECT type FROM pragma_table_info('table1') WHERE name = 'Value'"
+        ).fetchall() == [("TEXT",)]
+        assert connection.execute("SELECT * FROM table1").fetchall() == [
+            ("name1", "1"),
+            ("name2", "2"),
+            ("name3", "1.5"),
+            ("name4", "foo"),
+        ]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+def test_csv_reader_read_chunks(app_context: None, tmp_path) -> None:
+    """
+    Test that CSV files are uploaded chunk by chunk.
+    """
+    import sqlite3
+
+    from superset.models.core import Database
+
+    path = tmp_path / "upload.db"
+    database = Database(database_name="upload", sqlalchemy_uri=f"sqlite:///{path}")
+    progress = []
+
+    csv_reader = CSVReader(options=CSVReaderOptions())
+    csv_reader.read(
+        create_csv_file(CSV_DATA_LARGE),
+        database,
+        "table1",
+        None,
+        on_progress=progress.append,
+    )
+
+    assert progress == [2, 4, 5]
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT * FROM table1").fetchall() == [
+            ("name1", 30),
+            ("name2", 25),
+            ("name3", 20),
+            ("name4", 35),
+            ("name5", 40),
+        ]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+def test_csv_reader_read_chunks_error(app_context: None, tmp_path) -> None:
+    """
+    Test that a table created by an upload failing midway is dropped.
+    """
+    import sqlite3
+
+    from superset.models.core import Database
+
+    path = tmp_path / "upload.db"
+    database = Database(database_name="upload", sqlalchemy_uri=f"sqlite:///{path}")
+    data = CSV_DATA_LARGE[:4] + [["name4", "x"]]
+
+    csv_reader = CSVReader(options=CSVReaderOptions(column_data_types={"Age": "int64"}))
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        csv_reader.read(create_csv_file(data), database, "table1", None)
+
+    assert str(ex.value) == (
+        "Cannot convert column 'Age' to int64. Found 1 error(s):\n"
+        "  • Line 5: 'x' cannot be converted to int64"
+    )
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT name FROM sqlite_master").fetchall() == []
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+@pytest.mark.parametrize(
+    "already_exists, expected",
+    [
+        ("append", [("old", 1), ("name1", 30), ("name2", 25), ("name3", 20)]),
+        ("replace", [("name1", 30), ("name2", 25), ("name3", 20)]),
+    ],
+)
+def test_csv_reader_read_chunks_existing_table(
+    app_context: None,
+    tmp_path,
+    already_exists: str,
+    expected: list[tuple[str, int]],
+) -> None:
+    """
+    Test that chunks are staged before being appended to or replacing a table.
+    """
+    import sqlite3
+
+    from superset.models.core import Database
+
+    path = tmp_path / "upload.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE table1 ("Name" TEXT, "Age" INTEGER)')
+        connection.execute("INSERT INTO table1 VALUES ('old', 1)")
+    database = Database(database_name="upload", sqlalchemy_uri=f"sqlite:///{path}")
+    progress = []
+
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists=already_exists))
+    csv_reader.read(
+        create_csv_file(CSV_DATA_LARGE[:4]),
+        database,
+        "table1",
+        None,
+        on_progress=progress.append,
+    )
+
+    assert progress == [2, 3]
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT * FROM table1").fetchall() == expected
+        assert connection.execute("SELECT name FROM sqlite_master").fetchall() == [
+            ("table1",)
+        ]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+@pytest.mark.parametrize("already_exists", ["append", "replace"])
+def test_csv_reader_read_chunks_existing_table_error(
+    app_context: None,
+    tmp_path,
+    already_exists: str,
+) -> None:
+    """
+    Test that a table is left untouched when appending to or replacing it fails.
+    """
+    import sqlite3
+
+    from superset.models.core import Database
+
+    path = tmp_path / "upload.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE table1 ("Name" TEXT, "Age" INTEGER)')
+        connection.execute("INSERT INTO table1 VALUES ('old', 1)")
+    database = Database(database_name="upload", sqlalchemy_uri=f"sqlite:///{path}")
+    # the malformed row is in the third chunk, after two chunks were staged
+    data = CSV_DATA_LARGE + [["name6", "x"]]
+
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(
+            already_exists=already_exists,
+            column_data_types={"Age": "int64"},
+        )
+    )
+    with pytest.raises(DatabaseUploadFailed):
+        csv_reader.read(create_csv_file(data), database, "table1", None)
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT * FROM table1").fetchall() == [("old", 1)]
+        assert connection.execute("SELECT name FROM sqlite_master").fetchall() == [
+            ("table1",)
+        ]
+
+
+@pytest.mark.parametrize("app", [{"UPLOAD_ROWS_PER_CHUNK": 2}], indirect=True)
+def test_csv_reader_read_without_append(app_context: None) -> None:
+    """
+    Test that files are uploaded at once to engines that can't append to tables.
+    """
+    from unittest.mock import MagicMock
+
+    database = MagicMock()
+    database.db_engine_spec.supports_file_upload_append = False
+
+    csv_reader = CSVReader(options=CSVReaderOptions(already_exists="replace"))
+    csv_reader.read(create_csv_file(CSV_DATA_LARGE), database, "table1", None)
+
+    database.db_engine_spec.df_to_sql.assert_called_once()
+    kwargs = database.db_engine_spec.df_to_sql.call_args.kwargs
+    assert kwargs["to_sql_kwargs"]["if_exists"] == "replace"
+    assert len(database.db_engine_spec.df_to_sql.call_args.args[2]) == 5
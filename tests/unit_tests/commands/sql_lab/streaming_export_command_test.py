@@ -16,14 +16,24 @@
 # under the License.
 """Unit tests for SQL Lab Streaming CSV Export Command."""
 
+import io
 from unittest.mock import MagicMock, Mock, patch
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pytest_mock import MockerFixture
 
 from superset.commands.sql_lab.streaming_export_command import (
     StreamingSqlResultExportCommand,
 )
+from superset.commands.streaming_export.writers import (
+    ArrowStreamingWriter,
+    ExcelStreamingWriter,
+    ParquetStreamingWriter,
+    StreamingExportFormat,
+)
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.sqllab.limiting_factor import LimitingFactor
@@ -538,3 +548,147 @@ def test_null_values_handling(mocker, mock_query):
     assert "1,,100" in csv_data
     assert "2,test," in csv_data
     assert ",," in csv_data
+
+
+def _read_export(export_format: StreamingExportFormat, data: bytes) -> pd.DataFrame:
+    if export_format == StreamingExportFormat.XLSX:
+        return pd.read_excel(io.BytesIO(data))
+    if export_format == StreamingExportFormat.PARQUET:
+        return pq.read_table(pa.BufferReader(data)).to_pandas()
+    return pa.ipc.open_stream(data).read_all().to_pandas()
+
+
+@pytest.mark.parametrize(
+    "export_format",
+    [
+        StreamingExportFormat.XLSX,
+        StreamingExportFormat.PARQUET,
+        StreamingExportFormat.ARROW,
+    ],
+)
+def test_binary_export_formats(mocker, mock_query, mock_result_proxy, export_format):
+    """Test XLSX, Parquet and Arrow exports are written batch by batch."""
+    mock_query.select_sql = "SELECT * FROM test"
+    mock_result_proxy.fetchmany.side_effect = [
+        [(1, "=SUM(A1:A2)", None), (2, "test2", 200)],
+        [(3, None, 300)],
+        [],
+    ]
+
+    mock_db, mock_session = _setup_sqllab_mocks(mocker, mock_query)
+
+    mock_connection = MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = (
+        mock_result_proxy
+    )
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    mock_query.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123",
+        chunk_size=2,
+        export_format=export_format,
+    )
+    command.validate()
+
+    chunks = list(command.run()())
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+
+    df = _read_export(export_format, b"".join(chunks))
+    assert list(df.columns) == ["id", "name", "value"]
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["value"].fillna(0).tolist() == [0, 200, 300]
+    # formulas are only quoted in Excel
+    name = (
+        "'=SUM(A1:A2)" if export_format == StreamingExportFormat.XLSX else "=SUM(A1:A2)"
+    )
+    assert df["name"].tolist()[:2] == [name, "test2"]
+    assert pd.isna(df["name"][2])
+
+
+def test_parquet_export_empty_result_set(mocker, mock_query):
+    """Test a Parquet export without rows keeps the columns."""
+    mock_query.select_sql = "SELECT * FROM empty_table"
+
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["col1", "col2"]
+    mock_result.fetchmany.side_effect = [[]]
+
+    mock_db, mock_session = _setup_sqllab_mocks(mocker, mock_query)
+
+    mock_connection = MagicMock()
+    mock_connection.execution_options.return_value.execute.return_value = mock_result
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.__exit__.return_value = None
+
+    mock_engine = MagicMock()
+    mock_engine.connect.return_value = mock_connection
+    mock_query.database.get_sqla_engine.return_value.__enter__.return_value = (
+        mock_engine
+    )
+
+    command = StreamingSqlResultExportCommand(
+        "test_client_123",
+        export_format=StreamingExportFormat.PARQUET,
+    )
+    command.validate()
+
+    table = pq.read_table(pa.BufferReader(b"".join(command.run()())))
+    assert table.num_rows == 0
+    assert table.column_names == ["col1", "col2"]
+
+
+@pytest.mark.parametrize(
+    "export_format, writer_class",
+    [
+        (StreamingExportFormat.PARQUET, ParquetStreamingWriter),
+        (StreamingExportFormat.ARROW, ArrowStreamingWriter),
+    ],
+)
+def test_arrow_writers_type_drift(export_format, writer_class):
+    """Test column types varying across batches are widened to a common type."""
+    writer = writer_class(["number", "mixed"])
+    writer.write([(1, 1), (2, 2)])
+    writer.write([(2.5, "x")])
+    data = b"".join([*writer.write([(3, None)]), *writer.close()])
+
+    df = _read_export(export_format, data)
+    assert df["number"].tolist() == [1.0, 2.0, 2.5, 3.0]
+    assert df["mixed"].tolist() == ["1", "2", "x", None]
+
+
+def test_arrow_writer_record_batches(mocker):
+    """Test rows are buffered into record batches with the first batch schema."""
+    mocker.patch.object(ArrowStreamingWriter, "row_group_size", 2)
+    writer = ArrowStreamingWriter(["id"])
+    assert writer.write([(1,)]) == []
+    chunks = writer.write([(2,)])
+    assert chunks
+    data = b"".join([*chunks, *writer.write([(3,), (4,)]), *writer.close()])
+
+    reader = pa.ipc.open_stream(data)
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [2, 2]
+    assert reader.schema.field("id").type == pa.int64()
+
+
+def test_excel_writer_worksheet_rollover(mocker):
+    """Test rows continue on a new worksheet once a worksheet is full."""
+    mocker.patch.object(ExcelStreamingWriter, "max_rows", 3)
+    writer = ExcelStreamingWriter(["id", "name"])
+    writer.write([(1, "a"), (2, "b")])
+    writer.write([(3, "c"), (4, "d"), (5, "e")])
+    data = b"".join(writer.close())
+
+    sheets = pd.read_excel(io.BytesIO(data), sheet_name=None)
+    assert [df.to_dict(orient="list") for df in sheets.values()] == [
+        {"id": [1, 2], "name": ["a", "b"]},
+        {"id": [3, 4], "name": ["c", "d"]},
+        {"id": [5], "name": ["e"]},
+    ]
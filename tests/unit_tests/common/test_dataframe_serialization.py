@@ -0,0 +1,82 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from superset.common.utils.dataframe_serialization import (
+    deserialize_dataframe,
+    is_serialized_dataframe,
+    serialize_dataframe,
+)
+
+
+def test_round_trip() -> None:
+    """
+    Test that dataframes are read back unchanged, including Python object types.
+    """
+    df = pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2024-01-01", periods=3, freq="D"),
+            "tz": pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC"),
+            "float": [1.5, np.nan, 3.0],
+            "int32": np.array([1, 2, 3], dtype="int32"),
+            "nullable_int": pd.array([1, None, 3], dtype="Int64"),
+            "object_int": pd.Series([1, None, 3], dtype=object),
+            "string": ["a", None, "c"],
+            "decimal": [Decimal("1.10"), None, Decimal("3")],
+            "bool": [True, False, None],
+            "date": [datetime.date(2024, 1, 1), None, datetime.date(2024, 1, 3)],
+            "empty": [None, None, None],
+            "category": pd.Categorical(["x", "y", "x"]),
+        }
+    )
+
+    serialized = serialize_dataframe(df)
+    assert is_serialized_dataframe(serialized)
+    assert serialized["num_rows"] == 3
+
+    result = deserialize_dataframe(serialized)
+    pd.testing.assert_frame_equal(result, df)
+    for column in df.columns:
+        assert [type(value) for value in result[column]] == [
+            type(value) for value in df[column]
+        ]
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": [[1, 2], [3]]}),
+        pd.DataFrame({"a": [1, "x"]}),
+        pd.DataFrame({"a": [1.5, None]}, dtype=object),
+        pd.DataFrame({"a": [2**64, 1]}),
+        pd.DataFrame({"a": [-(2**63) - 1, None]}, dtype=object),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({0: [1, 2]}),
+        pd.DataFrame({"a": [1, 2]}, index=["x", "y"]),
+    ],
+)
+def test_not_serializable(df: pd.DataFrame) -> None:
+    """
+    Test that frames which wouldn't round-trip are not serialized with Arrow.
+    """
+    assert serialize_dataframe(df) is None
@@ -0,0 +1,245 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pandas as pd
+from flask import current_app
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_manager import (
+    COMPRESSED_VALUE_KEY,
+    QueryCacheManager,
+)
+from superset.constants import CacheRegion
+
+
+def get_cache(mocker: MockerFixture) -> Cache:
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    return cache
+
+
+def test_set_and_get_compressed(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that values are compressed in regions with a codec.
+    """
+    cache = get_cache(mocker)
+    mocker.patch.dict(current_app.config, {"CACHE_COMPRESSION": {"data": "zstd"}})
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    QueryCacheManager.set(
+        "key", {"df": df, "query": "SELECT 1"}, region=CacheRegion.DATA
+    )
+    assert set(cache.get("key")) == {COMPRESSED_VALUE_KEY, "dttm"}
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert query_cache.is_loaded
+    assert query_cache.df.equals(df)
+    assert query_cache.query == "SELECT 1"
+    assert query_cache.cache_dttm == cache.get("key")["dttm"]
+
+    # entries stay readable after changing the codec
+    mocker.patch.dict(current_app.config, {"CACHE_COMPRESSION": {}})
+    assert QueryCacheManager.get("key", CacheRegion.DATA).df.equals(df)
+
+
+def test_set_and_get_uncompressed(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that values are stored as is in regions without a codec.
+    """
+    cache = get_cache(mocker)
+    mocker.patch.dict(current_app.config, {"CACHE_COMPRESSION": {}})
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    QueryCacheManager.set(
+        "key", {"df": df, "query": "SELECT 1"}, region=CacheRegion.DATA
+    )
+    assert cache.get("key")["df"].equals(df)
+    assert QueryCacheManager.get("key", CacheRegion.DATA).df.equals(df)
+
+
+def test_set_query_result_arrow(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that dataframes are stored as Arrow in the data region.
+    """
+    from superset.models.helpers import QueryResult
+
+    cache = get_cache(mocker)
+    mocker.patch.dict(current_app.config, {"CACHE_COMPRESSION": {}})
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None]})
+    query_result = QueryResult(df=df, query="SELECT 1", duration=None)
+
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=query_result,
+        region=CacheRegion.DATA,
+    )
+    assert cache.get("key")["df"]["format"] == "arrow"
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+
+def test_set_query_result_not_arrow(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that dataframes Arrow can't serialize are stored as is in the data region.
+    """
+    from superset.models.helpers import QueryResult
+
+    cache = get_cache(mocker)
+    mocker.patch.dict(current_app.config, {"CACHE_COMPRESSION": {}})
+    df = pd.DataFrame({"a": [2**64, 1]})
+    query_result = QueryResult(df=df, query="SELECT 1", duration=None)
+
+    query_cache = QueryCacheManager()
+    query_cache.set_query_result(
+        key="key",
+        query_result=query_result,
+        region=CacheRegion.DATA,
+    )
+    assert query_cache.status != QueryStatus.FAILED
+    assert cache.get("key")["df"].equals(df)
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+
+def test_get_or_lock_leader(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the first worker missing the cache gets the lock.
+    """
+    get_cache(mocker)
+
+    query_cache, lock_token = QueryCacheManager.get_or_lock(
+        "key", CacheRegion.DATA, lock_timeout=5
+    )
+    assert lock_token
+    assert not query_cache.is_loaded
+
+    QueryCacheManager.release_lock("key", CacheRegion.DATA, lock_token)
+    _, lock_token = QueryCacheManager.get_or_lock(
+        "key", CacheRegion.DATA, lock_timeout=5
+    )
+    assert lock_token
+
+
+def test_get_or_lock_follower(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that workers wait for the lock holder to populate the cache.
+    """
+    cache = get_cache(mocker)
+    mocker.patch.dict(current_app.config, {"CACHE_COMPRESSION": {}})
+    mocker.patch(
+        "superset.common.utils.query_cache_manager.SINGLE_FLIGHT_POLL_INTERVAL", 0
+    )
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    lock_token = QueryCacheManager.get_or_lock("key", CacheRegion.DATA, lock_timeout=5)[
+        1
+    ]
+    assert lock_token
+
+    def populate_cache(seconds: float) -> None:
+        # the leader caches the result while the follower is waiting
+        QueryCacheManager.set(
+            "key", {"df": df, "query": "SELECT 1"}, region=CacheRegion.DATA
+        )
+        QueryCacheManager.release_lock("key", CacheRegion.DATA, lock_token)
+
+    mocker.patch(
+        "superset.common.utils.query_cache_manager.time.sleep",
+        side_effect=populate_cache,
+    )
+    query_cache, lock_token = QueryCacheManager.get_or_lock(
+        "key", CacheRegion.DATA, lock_timeout=5
+    )
+    assert lock_token is None
+    assert query_cache.is_loaded
+    assert query_cache.df.equals(df)
+    assert cache.get("single_flight_lock:key") is None
+
+
+def test_get_or_lock_timeout(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that workers stop waiting after the lock timeout.
+    """
+    get_cache(mocker)
+    mocker.patch("superset.common.utils.query_cache_manager.time.sleep")
+    monotonic = mocker.patch("superset.common.utils.query_cache_manager.time.monotonic")
+    monotonic.side_effect = [0, 1, 2, 10]
+
+    assert QueryCacheManager.get_or_lock("key", CacheRegion.DATA, lock_timeout=5)[1]
+
+    query_cache, lock_token = QueryCacheManager.get_or_lock(
+        "key", CacheRegion.DATA, lock_timeout=5
+    )
+    assert lock_token is None
+    assert not query_cache.is_loaded
+
+
+def test_release_lock_not_owned(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that a worker doesn't release a lock taken over by another worker.
+    """
+    cache = get_cache(mocker)
+
+    lock_token = QueryCacheManager.get_or_lock("key", CacheRegion.DATA, lock_timeout=5)[
+        1
+    ]
+    # the lock expires and another worker takes it over
+    cache.delete("single_flight_lock:key")
+    other_token = QueryCacheManager.get_or_lock(
+        "key", CacheRegion.DATA, lock_timeout=5
+    )[1]
+    assert other_token != lock_token
+
+    QueryCacheManager.release_lock("key", CacheRegion.DATA, lock_token)
+    assert cache.get("single_flight_lock:key") == other_token
+
+    QueryCacheManager.release_lock("key", CacheRegion.DATA, other_token)
+    assert cache.get("single_flight_lock:key") is None
+
+
+def test_release_lock_redis(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that locks are compared and deleted atomically with Redis.
+    """
+    from flask_caching.backends.rediscache import RedisCache
+
+    from superset.common.utils.query_cache_manager import RELEASE_LOCK_SCRIPT
+
+    backend = RedisCache(key_prefix="superset_")
+    backend._write_client = mocker.MagicMock()
+    cache = mocker.MagicMock(cache=backend)
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+
+    QueryCacheManager.release_lock("key", CacheRegion.DATA, "token")
+
+    backend._write_client.eval.assert_called_once_with(
+        RELEASE_LOCK_SCRIPT,
+        1,
+        "superset_single_flight_lock:key",
+        backend.serializer.dumps("token"),
+    )
+    backend._write_client.delete.assert_not_called()
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import io
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -129,6 +130,16 @@ def test_get_data_xlsx(
     mock_df_to_excel.assert_called_once_with(df)
 
 
+def test_get_data_parquet(processor, mock_query_context):
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.PARQUET
+
+    result = processor.get_data(df, coltypes)
+    assert isinstance(result, bytes)
+    pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(result)), df)
+
+
 def test_get_data_json(processor, mock_query_context):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
     coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
@@ -1311,3 +1322,54 @@ def test_force_cached_normalizes_totals_query_row_limit():
 
     assert captured_limits == [None], "Totals query should be normalized before caching"
     mock_query_context.get_query_result.assert_not_called()
+
+
+@pytest.mark.parametrize("lock_acquired", [True, False])
+def test_get_df_payload_single_flight(
+    mocker: Any, app_context: None, lock_acquired: bool
+) -> None:
+    """
+    Test that cache misses are coalesced when single-flight is enabled.
+    """
+    from flask import current_app
+
+    from superset.common.query_object import QueryObject
+
+    mocker.patch.dict(current_app.config, {"CHART_QUERY_SINGLE_FLIGHT_TIMEOUT": 30})
+    mock_query_context = MagicMock()
+    mock_query_context.force = False
+    mock_datasource = MagicMock()
+    mock_datasource.cache_timeout = None
+    processor = QueryContextProcessor(mock_query_context)
+    processor._qc_datasource = mock_datasource
+    mocker.patch.object(processor, "query_cache_key", return_value="cache_key")
+    load_query_result = mocker.patch.object(processor, "_load_query_result")
+
+    query_obj = QueryObject(datasource=mock_datasource, columns=["col1"])
+    mocker.patch.object(query_obj, "validate")
+
+    missing = MagicMock(is_loaded=False, df=pd.DataFrame({"col1": [1]}))
+    populated = MagicMock(is_loaded=True, df=pd.DataFrame({"col1": [1]}))
+    cache_manager = mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager"
+    )
+    cache_manager.get.return_value = missing
+    cache_manager.get_or_lock.return_value = (
+        (missing, "token") if lock_acquired else (populated, None)
+    )
+
+    processor.get_df_payload(query_obj)
+
+    cache_manager.get_or_lock.assert_called_once_with(
+        key="cache_key",
+        region="data",
+        lock_timeout=30,
+    )
+    if lock_acquired:
+        load_query_result.assert_called_once_with(
+            query_obj, missing, "cache_key", False
+        )
+        cache_manager.release_lock.assert_called_once_with("cache_key", "data", "token")
+    else:
+        load_query_result.assert_not_called()
+        cache_manager.release_lock.assert_not_called()
@@ -21,8 +21,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from io import BytesIO
+from pathlib import Path
 from typing import Any
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, MagicMock, Mock
 from uuid import UUID
 
 import pytest
@@ -1102,6 +1103,86 @@ def test_csv_upload_validation(
     assert response.json == expected_response
 
 
+def test_upload_async(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that uploads with `run_async` are stored and submitted as a job.
+    """
+    mocker.patch("superset.databases.api.is_feature_enabled", return_value=True)
+    folder = tmp_path / "uploads"
+    mocker.patch.dict(current_app.config, {"UPLOAD_STAGING_FOLDER": str(folder)})
+    async_query_manager = mocker.patch(
+        "superset.databases.api.async_query_manager",
+        new_callable=MagicMock,
+    )
+    async_query_manager.parse_channel_id_from_request.return_value = "channel"
+    async_query_manager.submit_upload_job.return_value = {"job_id": "job"}
+    validate = mocker.patch.object(UploadCommand, "validate")
+    run = mocker.patch.object(UploadCommand, "run")
+
+    response = client.post(
+        "/api/v1/database/1/upload/",
+        data={
+            "type": "csv",
+            "file": create_csv_file(),
+            "table_name": "table1",
+            "run_async": "true",
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 202
+    assert response.json == {"job_id": "job"}
+    validate.assert_called_once()
+    run.assert_not_called()
+
+    channel_id, database_id, file_path, filename, options, _ = (
+        async_query_manager.submit_upload_job.call_args.args
+    )
+    assert (channel_id, database_id, filename) == ("channel", 1, "test.csv")
+    assert Path(file_path).parent == folder
+    assert Path(file_path).read_bytes() == b"Name,Age,City\r\nJohn,30,New York\r\n"
+    assert options == {
+        "type": "csv",
+        "table_name": "table1",
+        "already_exists": "fail",
+        "run_async": True,
+    }
+
+
+def test_upload_async_disabled(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that uploads with `run_async` require global async queries.
+    """
+    mocker.patch("superset.databases.api.is_feature_enabled", return_value=False)
+    run = mocker.patch.object(UploadCommand, "run")
+
+    response = client.post(
+        "/api/v1/database/1/upload/",
+        data={
+            "type": "csv",
+            "file": (create_csv_file(), "out.csv"),
+            "table_name": "table1",
+            "run_async": "true",
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 400
+    assert response.json == {
+        "message": "Asynchronous uploads require the GLOBAL_ASYNC_QUERIES feature flag"
+    }
+    run.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "filename",
     [
@@ -363,3 +363,77 @@ def test_df_to_records_with_json_serialization_like_sql_lab() -> None:
     )
     parsed_no_flag = superset_json.loads(json_str_no_flag)
     assert parsed_no_flag == parsed  # Same result
+
+
+def test_df_to_records_column_types() -> None:
+    """
+    Test that every column type produces the same records as ``to_dict``.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "int": np.array([1, 2**60, -(2**60)], dtype="int64"),
+            "uint": np.array([1, 2**63, 3], dtype="uint64"),
+            "float": [1.5, np.nan, np.inf],
+            "bool": [True, False, True],
+            "object": ["a", None, 2**60],
+            "nullable": pd.array([1, None, 2**60], dtype="Int64"),
+            "datetime": pd.to_datetime(["2020-01-01", None, "2021-01-01"]),
+            "string": pd.array(["x", None, "z"], dtype="string"),
+        }
+    )
+
+    assert df_to_records(df) == [
+        {
+            "int": 1,
+            "uint": 1,
+            "float": 1.5,
+            "bool": True,
+            "object": "a",
+            "nullable": 1,
+            "datetime": Timestamp("2020-01-01"),
+            "string": "x",
+        },
+        {
+            "int": "1152921504606846976",
+            "uint": "9223372036854775808",
+            "float": None,
+            "bool": False,
+            "object": None,
+            "nullable": None,
+            "datetime": None,
+            "string": None,
+        },
+        {
+            "int": "-1152921504606846976",
+            "uint": 3,
+            "float": np.inf,
+            "bool": True,
+            "object": "1152921504606846976",
+            "nullable": "1152921504606846976",
+            "datetime": Timestamp("2021-01-01"),
+            "string": "z",
+        },
+    ]
+    assert [type(value) for value in df_to_records(df)[0].values()] == [
+        int,
+        int,
+        float,
+        bool,
+        str,
+        int,
+        Timestamp,
+        str,
+    ]
+
+
+def test_df_to_records_duplicate_columns() -> None:
+    """
+    Test that the last column wins when column names are duplicated.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame([[1, 2, 3]], columns=["a", "b", "a"])
+
+    assert df_to_records(df) == [{"a": 3, "b": 2}]
@@ -943,3 +943,60 @@ def test_get_oauth2_authorization_uri_standard_params(mocker: MockerFixture) ->
     assert "prompt" not in query
     assert "access_type" not in query
     assert "include_granted_scopes" not in query
+
+
+def test_get_to_sql_method(mocker: MockerFixture) -> None:
+    """
+    Test that native bulk loads are preferred over multi-values inserts.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class MultiValuesEngineSpec(BaseEngineSpec):
+        supports_multivalues_insert = True
+
+    class BulkInsertEngineSpec(MultiValuesEngineSpec):
+        supports_bulk_insert = True
+
+    dialect = mocker.MagicMock(supports_multivalues_insert=False)
+    assert BaseEngineSpec.get_to_sql_method(dialect) is None
+    assert MultiValuesEngineSpec.get_to_sql_method(dialect) == "multi"
+    assert (
+        BulkInsertEngineSpec.get_to_sql_method(dialect)
+        == BulkInsertEngineSpec.bulk_insert
+    )
+
+    dialect.supports_multivalues_insert = True
+    assert BaseEngineSpec.get_to_sql_method(dialect) == "multi"
+
+
+def test_df_to_sql_bulk_insert(mocker: MockerFixture) -> None:
+    """
+    Test that dataframes are loaded in chunks with the bulk load path.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class BulkInsertEngineSpec(BaseEngineSpec):
+        supports_bulk_insert = True
+
+    database = mocker.MagicMock()
+    df = mocker.MagicMock(spec=pd.DataFrame)
+    get_engine = mocker.patch.object(BulkInsertEngineSpec, "get_engine")
+    engine = get_engine.return_value.__enter__.return_value
+
+    BulkInsertEngineSpec.df_to_sql(
+        database,
+        Table("my_table", "my_schema"),
+        df,
+        {"if_exists": "fail", "chunksize": 1000},
+    )
+
+    df.to_sql.assert_called_once_with(
+        con=engine,
+        if_exists="fail",
+        chunksize=1000,
+        name="my_table",
+        schema="my_schema",
+        method=BulkInsertEngineSpec.bulk_insert,
+    )
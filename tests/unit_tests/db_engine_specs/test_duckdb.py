@@ -163,3 +163,42 @@ def test_column_type_recognition() -> None:
     col_spec = DuckDBEngineSpec.get_column_spec("TINYINT")
     # TINYINT matches the pattern "^int" so it should be recognized
     assert col_spec is None, "TINYINT doesn't match any patterns"
+
+
+def test_bulk_insert() -> None:
+    """
+    Test that dataframes are inserted through an Arrow table, and that columns which
+    can't be converted to Arrow fall back to regular inserts.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    engine = create_engine("duckdb:///:memory:")
+    method = DuckDBEngineSpec.get_to_sql_method(engine.dialect)
+    assert method == DuckDBEngineSpec.bulk_insert
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", None, ""],
+            "dttm": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+        }
+    )
+    mixed = pd.DataFrame({"id": [4, 5], "name": ["b", 6], "dttm": [None, None]})
+    with engine.connect() as connection:
+        df.to_sql("t", connection, index=False, method=method)
+        mixed.to_sql("t", connection, index=False, method=method, if_exists="append")
+        mixed.iloc[:0].to_sql(
+            "t", connection, index=False, method=method, if_exists="append"
+        )
+        rows = connection.execute("SELECT * FROM t ORDER BY id").fetchall()
+
+    assert rows == [
+        (1, "a", datetime(2024, 1, 1)),
+        (2, None, None),
+        (3, "", datetime(2024, 1, 3)),
+        (4, "b", None),
+        (5, "6", None),
+    ]
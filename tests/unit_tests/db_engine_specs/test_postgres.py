@@ -18,6 +18,7 @@
 from datetime import datetime
 from typing import Any, Optional
 
+import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy import column, types
@@ -280,3 +281,93 @@ SELECT * \nFROM my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_bulk_insert(mocker: MockerFixture) -> None:
+    """
+    Test that rows are loaded with `COPY`, distinguishing nulls from empty strings.
+    """
+    from pandas.io.sql import SQLDatabase, SQLTable
+    from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+
+    copied: list[tuple[str, str]] = []
+    cursor = mocker.MagicMock()
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(
+        (sql, buffer.read())
+    )
+    connection = mocker.MagicMock()
+    connection.dialect = PGDialect_psycopg2()
+    connection.connection.cursor.return_value = cursor
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "name": ['a "quoted" value', ""],
+            "value": [1.5, None],
+            "payload": [{"a": 1}, None],
+        }
+    )
+    table = SQLTable(
+        "my table",
+        SQLDatabase(mocker.MagicMock()),
+        frame=df,
+        index=False,
+        schema="public",
+        dtype={"payload": JSON()},
+    )
+
+    assert spec.get_to_sql_method(connection.dialect) == spec.bulk_insert
+    count = spec.bulk_insert(
+        table,
+        connection,
+        ["id", "name", "value", "payload"],
+        [(1, 'a "quoted" value', 1.5, {"a": 1}), (2, "", None, None)],
+    )
+
+    assert count == 2
+    assert copied == [
+        (
+            'COPY public."my table" (id, name, value, payload) '
+            "FROM STDIN WITH (FORMAT csv)",
+            '1,"a ""quoted"" value",1.5,"{""a"": 1}"\r\n2,"",,\r\n',
+        )
+    ]
+    cursor.close.assert_called_once()
+
+
+def test_copy_rows_reader() -> None:
+    """
+    Test that rows are written as CSV as they're read, in chunks of the size read.
+    """
+    from superset.db_engine_specs.postgres import CopyRowsReader
+
+    reader = CopyRowsReader((i, f"name {i}", None) for i in range(1000))
+
+    chunks = [reader.read(100)]
+    # only the rows needed are written
+    assert len(chunks[0]) == 100
+    assert reader.count < 10
+
+    while chunk := reader.read(100):
+        assert len(chunk) <= 100
+        chunks.append(chunk)
+
+    assert reader.count == 1000
+    assert "".join(chunks) == "".join(f'{i},"name {i}",\r\n' for i in range(1000))
+    assert CopyRowsReader([]).read() == ""
+
+
+def test_bulk_insert_without_copy(mocker: MockerFixture) -> None:
+    """
+    Test that drivers without `copy_expert` fall back to a regular insert.
+    """
+    super_bulk_insert = mocker.patch(
+        "superset.db_engine_specs.base.BaseEngineSpec.bulk_insert",
+    )
+    connection = mocker.MagicMock()
+    connection.connection.cursor.return_value = mocker.MagicMock(spec=["close"])
+    table = mocker.MagicMock()
+
+    spec.bulk_insert(table, connection, ["id"], [(1,)])
+
+    super_bulk_insert.assert_called_once_with(table, connection, ["id"], [(1,)])
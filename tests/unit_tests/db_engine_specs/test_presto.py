@@ -18,6 +18,7 @@ from datetime import datetime
 from typing import Any, Optional
 from unittest import mock
 
+import pandas as pd
 import pytest
 import pytz
 from pyhive.sqlalchemy_presto import PrestoDialect
@@ -156,6 +157,33 @@ def test_where_latest_partition(
     )
 
 
+def test_latest_partition_cache(mocker: MockerFixture) -> None:
+    """
+    Test that latest partition lookups are cached per table.
+    """
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+    from superset.utils.partition_cache import PartitionCache
+
+    mocker.patch(
+        "superset.db_engine_specs.presto.partition_cache",
+        PartitionCache(max_size=10),
+    )
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    database.get_indexes.return_value = [{"column_names": ["ds"]}]
+    database.get_extra.return_value = {}
+    database.get_df.return_value = pd.DataFrame({"ds": ["2024-01-01"]})
+
+    for _ in range(2):
+        assert PrestoEngineSpec.latest_partition(database, Table("t", "s")) == (
+            ["ds"],
+            ("2024-01-01",),
+        )
+    database.get_df.assert_called_once()
+
+    PrestoEngineSpec.latest_partition(database, Table("other", "s"))
+    assert database.get_df.call_count == 2
+
+
 def test_adjust_engine_params_fully_qualified() -> None:
     """
     Test the ``adjust_engine_params`` method when the URL has catalog and schema.
@@ -129,3 +129,61 @@ def test_time_grain_expressions(dttm: str, grain: str, expected: str) -> None:
     sql = f"SELECT {expression} FROM t"  # noqa: S608
     result = connection.execute(sql).scalar()
     assert result == expected
+
+
+def test_bulk_insert() -> None:
+    """
+    Test that dataframes are inserted with the native bulk load path, storing values
+    the same way as through SQLAlchemy.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+
+    engine = create_engine("sqlite://")
+    method = SqliteEngineSpec.get_to_sql_method(engine.dialect)
+    assert method == SqliteEngineSpec.bulk_insert
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", None, ""],
+            "value": [1.5, float("nan"), 3.0],
+            "dttm": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+        }
+    )
+    df.to_sql("bulk", engine, index=False, method=method)
+    df.to_sql("multi", engine, index=False, method="multi")
+
+    with engine.connect() as connection:
+        bulk = connection.execute("SELECT * FROM bulk ORDER BY id").fetchall()
+        multi = connection.execute("SELECT * FROM multi ORDER BY id").fetchall()
+    assert bulk == multi
+    assert bulk == [
+        (1, "a", 1.5, "2024-01-01 00:00:00.000000"),
+        (2, None, None, None),
+        (3, "", 3.0, "2024-01-03 00:00:00.000000"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "engine_spec_path",
+    [
+        "superset.db_engine_specs.d1.CloudflareD1EngineSpec",
+        "superset.db_engine_specs.gsheets.GSheetsEngineSpec",
+        "superset.db_engine_specs.shillelagh.ShillelaghEngineSpec",
+    ],
+)
+def test_bulk_insert_not_inherited(engine_spec_path: str) -> None:
+    """
+    Test that engines built on SQLite with other DB-API drivers keep using
+    multi-values inserts, since the bulk load path relies on `sqlite3`.
+    """
+    from importlib import import_module
+
+    module_name, class_name = engine_spec_path.rsplit(".", 1)
+    engine_spec = getattr(import_module(module_name), class_name)
+
+    engine = create_engine("sqlite://")
+    assert not engine_spec.supports_bulk_insert
+    assert engine_spec.get_to_sql_method(engine.dialect) == "multi"
@@ -39,6 +39,7 @@ from superset.connectors.sqla.models import (
 )
 from superset.exceptions import SupersetTemplateException
 from superset.jinja_context import (
+    CachedSandboxedEnvironment,
     dataset_macro,
     ExtraCache,
     get_template_processor,
@@ -51,6 +52,7 @@ from superset.jinja_context import (
 from superset.models.core import Database
 from superset.models.slice import Slice
 from superset.utils import json
+from superset.utils.lru import LRUCache
 from tests.unit_tests.conftest import with_feature_flags
 
 
@@ -1560,7 +1562,7 @@ def test_jinja2_undefined_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
     # Mock the Environment.from_string to raise UndefinedError
     with patch.object(
@@ -1593,7 +1595,7 @@ def test_jinja2_security_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
     # Mock the Environment.from_string to raise SecurityError
     with patch.object(
@@ -1624,7 +1626,7 @@ def test_jinja2_server_error_handling(mocker: MockerFixture) -> None:
     from superset.jinja_context import BaseTemplateProcessor
 
     processor = BaseTemplateProcessor(database=database)
-    template = "SELECT * FROM table"
+    template = "SELECT * FROM {{ table }}"
 
     # Mock the Environment.from_string to raise MemoryError (server error)
     with patch.object(
@@ -1693,3 +1695,55 @@ def test_undefined_template_variable_not_function(mocker: MockerFixture) -> None
     template = "SELECT {{ undefined_variable.some_method() }}"
     with pytest.raises(UndefinedError):
         processor.process_template(template)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "",
+        "SELECT 1",
+        "SELECT 1\n",
+        "SELECT 1\n\n",
+        "SELECT 1\r\nFROM t\rWHERE a = '}}'\r\n",
+        "SELECT '{' AS a, '%' AS b, '#' AS c",
+    ],
+)
+def test_process_template_static(mocker: MockerFixture, sql: str) -> None:
+    """
+    Test that SQL without Jinja syntax is rendered as Jinja would, without compiling.
+    """
+    from superset.jinja_context import BaseTemplateProcessor
+
+    database = mocker.MagicMock()
+    processor = BaseTemplateProcessor(database=database)
+    from_string = mocker.spy(processor.env, "from_string")
+
+    expected = SandboxedEnvironment(undefined=DebugUndefined).from_string(sql).render()
+    assert processor.process_template(sql) == expected
+    from_string.assert_not_called()
+
+
+def test_compiled_template_cache(mocker: MockerFixture) -> None:
+    """
+    Test that compiled templates are shared between environments.
+    """
+    mocker.patch.object(CachedSandboxedEnvironment, "code_cache", LRUCache(10))
+    parse = mocker.spy(SandboxedEnvironment, "_parse")
+
+    first = CachedSandboxedEnvironment()
+    first.filters["label"] = lambda value: f"first {value}"
+    second = CachedSandboxedEnvironment()
+    second.filters["label"] = lambda value: f"second {value}"
+
+    # filters are not evaluated at compile time
+    source = "SELECT '{{ 'value' | label }}', {{ number }}"
+    assert first.from_string(source).render(number=1) == "SELECT 'first value', 1"
+    assert second.from_string(source).render(number=2) == "SELECT 'second value', 2"
+    assert parse.call_count == 1
+
+    # environments with other filters don't share templates
+    third = CachedSandboxedEnvironment()
+    third.filters["other"] = str
+    assert first.from_string("SELECT {{ number }}").render(number=3) == "SELECT 3"
+    assert third.from_string("SELECT {{ number }}").render(number=3) == "SELECT 3"
+    assert parse.call_count == 3
@@ -1340,3 +1340,112 @@ def test_database_execute_async_without_options(mocker: MockerFixture) -> None:
     mock_executor_class.assert_called_once_with(database)
     mock_executor.execute_async.assert_called_once_with("SELECT 1", None)
     assert result == mock_handle
+
+
+def test_get_sqla_engine_cached(mocker: MockerFixture) -> None:
+    """
+    Test that `_get_sqla_engine` reuses pooled engines when caching is enabled.
+    """
+    from superset.utils.engine_cache import EngineCache
+
+    engine_cache = mocker.patch(
+        "superset.models.core.engine_cache",
+        EngineCache(max_size=10),
+    )
+    mocker.patch.dict(
+        current_app.config,
+        {"DB_ENGINE_POOL_OPTIONS": {"pool_size": 2}},
+    )
+    create_engine = mocker.patch(
+        "superset.models.core.create_engine",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(),
+    )
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="trino://")
+    engine = database._get_sqla_engine()
+    assert database._get_sqla_engine() is engine
+    assert database._get_sqla_engine(schema="other") is not engine
+    assert create_engine.call_count == 2
+    assert create_engine.call_args.kwargs["pool_size"] == 2
+    assert "poolclass" not in create_engine.call_args.kwargs
+
+    engine_cache.invalidate(1)
+    assert database._get_sqla_engine() is not engine
+    assert create_engine.call_count == 3
+    engine_cache.clear()
+
+
+def test_get_sqla_engine_cached_key(mocker: MockerFixture) -> None:
+    """
+    Test that objects created for each engine in the params don't change its key.
+    """
+    import ssl
+
+    from superset.utils.engine_cache import EngineCache
+
+    mocker.patch("superset.models.core.engine_cache", EngineCache(max_size=10))
+    create_engine = mocker.patch(
+        "superset.models.core.create_engine",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(),
+    )
+    mocker.patch.object(
+        Database,
+        "update_params_from_encrypted_extra",
+        side_effect=lambda params: params["connect_args"].update(
+            ssl_context=ssl.create_default_context()
+        ),
+    )
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="trino://")
+    engine = database._get_sqla_engine()
+    assert database._get_sqla_engine() is engine
+    assert create_engine.call_count == 1
+
+
+def test_get_sqla_engine_cached_sqlite(mocker: MockerFixture) -> None:
+    """
+    Test that queue pool options are not passed to dialects using other pools.
+    """
+    from superset.utils.engine_cache import EngineCache
+
+    engine_cache = mocker.patch(
+        "superset.models.core.engine_cache",
+        EngineCache(max_size=10),
+    )
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    engine = database._get_sqla_engine()
+    with engine.connect() as connection:
+        assert connection.execute("SELECT 1").scalar() == 1
+    assert database._get_sqla_engine() is engine
+    engine_cache.clear()
+
+
+def test_get_sqla_engine_cached_per_user(mocker: MockerFixture) -> None:
+    """
+    Test that users share cached engines unless the engines are user-specific.
+    """
+    from superset.utils.engine_cache import EngineCache
+
+    engine_cache = mocker.patch(
+        "superset.models.core.engine_cache",
+        EngineCache(max_size=10),
+    )
+    mocker.patch(
+        "superset.models.core.create_engine",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(),
+    )
+    get_effective_user = mocker.patch.object(Database, "get_effective_user")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="trino://")
+    get_effective_user.return_value = "alice"
+    engine = database._get_sqla_engine()
+    get_effective_user.return_value = "bob"
+    assert database._get_sqla_engine() is engine
+
+    database.impersonate_user = True
+    get_effective_user.return_value = "alice"
+    alice_engine = database._get_sqla_engine()
+    get_effective_user.return_value = "bob"
+    assert database._get_sqla_engine() is not alice_engine
+    engine_cache.clear()
@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import event
+from sqlalchemy.orm.session import Session
+
+from superset.utils import json
+
+
+@pytest.fixture
+def session_with_data(session: Session) -> Iterator[Session]:
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    engine = session.get_bind()
+    Dashboard.metadata.create_all(engine)  # pylint: disable=no-member
+
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    slices = []
+    for i in range(5):
+        dataset = SqlaTable(
+            table_name=f"table_{i}",
+            database=database,
+            columns=[
+                TableColumn(column_name="a", type="INTEGER"),
+                TableColumn(column_name="b", type="TEXT"),
+            ],
+            metrics=[SqlMetric(metric_name="cnt", expression="COUNT(*)")],
+        )
+        session.add(dataset)
+        session.flush()
+        slices.append(
+            Slice(
+                datasource_id=dataset.id,
+                datasource_type="table",
+                slice_name=f"slice_{i}",
+                viz_type="table",
+                params=json.dumps({"groupby": ["a"], "metrics": ["cnt"]}),
+            )
+        )
+
+    session.add(Dashboard(id=1, dashboard_title="dashboard", slices=slices))
+    session.flush()
+
+    yield session
+    session.rollback()
+
+
+def test_datasets_trimmed_for_slices(session_with_data: Session) -> None:
+    """
+    Test that datasets are loaded in a constant number of queries.
+    """
+    from superset.models.dashboard import Dashboard
+
+    session_with_data.expire_all()
+    dashboard = session_with_data.query(Dashboard).one()
+    slices = dashboard.slices
+
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        statements.append(args[2])
+
+    engine = session_with_data.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    datasets = dashboard.datasets_trimmed_for_slices()
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(slices) == 5
+    assert [dataset["name"] for dataset in datasets] == [f"table_{i}" for i in range(5)]
+    assert [column["column_name"] for column in datasets[0]["columns"]] == ["a"]
+    assert [metric["metric_name"] for metric in datasets[0]["metrics"]] == ["cnt"]
+    # datasets with their database, and their columns, metrics and owners
+    assert len(statements) == 4
+
+
+def test_datasets_trimmed_for_slices_cache(
+    mocker: MockerFixture,
+    session_with_data: Session,
+) -> None:
+    """
+    Test that dataset payloads are cached until the dataset changes.
+    """
+    from cachelib import SimpleCache
+    from flask import current_app
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.extensions import cache_manager
+    from superset.models.dashboard import Dashboard
+
+    mocker.patch.dict(current_app.config, {"DASHBOARD_DATASETS_CACHE_TIMEOUT": 60})
+    mocker.patch.object(
+        type(cache_manager),
+        "cache",
+        new_callable=mocker.PropertyMock,
+        return_value=SimpleCache(),
+    )
+    fetch_datasources = mocker.spy(Dashboard, "_fetch_datasources")
+
+    dashboard = session_with_data.query(Dashboard).one()
+    datasets = dashboard.datasets_trimmed_for_slices()
+    assert fetch_datasources.call_count == 1
+
+    assert dashboard.datasets_trimmed_for_slices() == datasets
+    assert fetch_datasources.call_count == 1
+
+    # adding a column to a dataset invalidates its payload only
+    dataset = session_with_data.query(SqlaTable).filter_by(table_name="table_0").one()
+    dataset.columns.append(TableColumn(column_name="c", type="TEXT"))
+    session_with_data.flush()
+
+    datasets = dashboard.datasets_trimmed_for_slices()
+    assert fetch_datasources.call_count == 2
+    fetch_datasources.assert_called_with(SqlaTable, {dataset.id})
+    assert "c" in datasets[0]["column_names"]
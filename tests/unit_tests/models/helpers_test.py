@@ -1130,6 +1130,54 @@ def test_process_select_expression_end_to_end(database: Database) -> None:
         )
 
 
+def test_process_sql_expression_cache(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    """
+    Test that processed expressions are cached, unless they have sub-queries.
+
+    Sub-queries get the RLS predicates of the current user, so they're processed on
+    every call.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models import helpers
+    from superset.utils.lru import LRUCache
+
+    cache: LRUCache[tuple[str, str], str] = LRUCache(10)
+    mocker.patch.object(helpers, "query_plan_cache", cache)
+    mocker.patch.object(helpers, "is_feature_enabled", return_value=True)
+    apply_rls = mocker.patch.object(helpers, "apply_rls")
+    sanitize_clause = mocker.spy(helpers, "sanitize_clause")
+    table = SqlaTable(database=database, schema=None, table_name="t")
+
+    for _ in range(2):
+        assert (
+            table._process_select_expression(
+                expression="SUM(a) / COUNT(*)",
+                database_id=database.id,
+                engine="sqlite",
+                schema="",
+                template_processor=None,
+            )
+            == "SUM(a) / COUNT(*)"
+        )
+    assert sanitize_clause.call_count == 1
+    assert len(cache) == 1
+
+    for _ in range(2):
+        table._process_select_expression(
+            expression="(SELECT MAX(a) FROM t)",
+            database_id=database.id,
+            engine="sqlite",
+            schema="",
+            template_processor=None,
+        )
+    assert sanitize_clause.call_count == 3
+    assert apply_rls.call_count == 2
+    assert len(cache) == 1
+
+
 def test_reapply_query_filters_with_granularity(database: Database) -> None:
     """
     Test that _reapply_query_filters correctly applies filters with granularity.
@@ -1703,3 +1751,38 @@ def test_adhoc_column_with_spaces_in_full_query(database: Database) -> None:
     # Verify SELECT and FROM clauses are present
     assert "SELECT" in sql
     assert "FROM" in sql
+
+
+def test_query_in_thread_session(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that queries from worker threads use the datasource of their own session.
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    table = SqlaTable(
+        table_name="t",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    session.add(table)
+    session.commit()
+
+    query = mocker.patch.object(SqlaTable, "query", autospec=True)
+    thread_session = sessionmaker(bind=session.get_bind())()
+    mocker.patch("superset.db.session", thread_session)
+
+    table._query_in_thread_session({"metrics": []})
+
+    datasource, query_obj = query.call_args.args
+    assert datasource is not table
+    assert datasource.id == table.id
+    assert datasource in thread_session
+    assert query_obj == {"metrics": []}
+
+    # transient datasources are not attached to a session
+    transient = SqlaTable(table_name="u")
+    transient._query_in_thread_session({})
+    assert query.call_args.args[0] is transient
@@ -14,6 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import geohash as geohash_lib
+import pytest
+from geopy.point import Point
+from pandas import DataFrame
+
+from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing import (
     geodetic_parse,
     geohash_decode,
@@ -88,3 +94,94 @@ def test_geodetic_parse():
         lonlat_df["longitude"]
     )
     assert series_to_list(post_df["latitude"]), series_to_list(lonlat_df["latitude"])
+
+
+def test_geohash_decode_matches_geohash_lib():
+    geohashes = [
+        "dr5regw3pg6f",
+        "r3gx2u9qdevk",
+        "U4PRU",
+        "",
+        "0",
+        "zzzzzzzzzzzz",
+        # longer than 12 characters, decoded one by one
+        "u4pruydqqvj8u4pruy",
+    ]
+    df = DataFrame({"geohash": geohashes}, index=list("abcdefg"))
+    post_df = geohash_decode(
+        df=df, geohash="geohash", latitude="latitude", longitude="longitude"
+    )
+    assert post_df.index.tolist() == list("abcdefg")
+    assert list(zip(post_df["latitude"], post_df["longitude"], strict=True)) == [
+        geohash_lib.decode(geohash) for geohash in geohashes
+    ]
+
+    with pytest.raises(InvalidPostProcessingError, match="Invalid geohash string"):
+        geohash_decode(
+            df=DataFrame({"geohash": ["dr5regw3pg6f", "dr5ra"]}),
+            geohash="geohash",
+            latitude="latitude",
+            longitude="longitude",
+        )
+
+
+def test_geohash_encode_matches_geohash_lib():
+    size = 90 / 2**29
+    latitudes = [-90.0, 0.0, -0.0, 89.99999, size, size - 1e-12, 45.5]
+    longitudes = [-180.0, 180.0, 539.5, -200.0, -size, 2 * size, 1e5]
+    df = DataFrame({"lat": latitudes, "lon": longitudes})
+    post_df = geohash_encode(df=df, geohash="hash", latitude="lat", longitude="lon")
+    assert post_df.columns.tolist() == ["lat", "lon", "hash"]
+    assert post_df["hash"].tolist() == [
+        geohash_lib.encode(latitude, longitude)
+        for latitude, longitude in zip(latitudes, longitudes, strict=True)
+    ]
+
+    for latitude, longitude in [(90.0, 0.0), (None, 0.0), (0.0, float("inf"))]:
+        with pytest.raises(
+            InvalidPostProcessingError, match="Invalid longitude/latitude"
+        ):
+            geohash_encode(
+                df=DataFrame({"lat": [latitude], "lon": [longitude]}),
+                geohash="geohash",
+                latitude="lat",
+                longitude="lon",
+            )
+
+
+def test_geodetic_parse_matches_geopy():
+    points = [
+        "40.71277496, -74.00597306",
+        " -0 , 2 ",
+        "1.5,190.25",
+        "1, -540.5, 12m",
+        "1, 2, 5.5 km",
+        # other formats are parsed one by one
+        "41.5 N -81.0 W",
+        "23 26m 22s N 23 27m 30s E",
+        "41.5;-81.0, 3mi",
+        None,
+    ]
+    post_df = geodetic_parse(
+        df=DataFrame({"geodetic": points}),
+        geodetic="geodetic",
+        latitude="latitude",
+        longitude="longitude",
+        altitude="altitude",
+    )
+    assert list(
+        zip(
+            post_df["latitude"],
+            post_df["longitude"],
+            post_df["altitude"],
+            strict=True,
+        )
+    ) == [tuple(Point(point)) for point in points]
+
+    with pytest.raises(InvalidPostProcessingError, match="Invalid geodetic string"):
+        geodetic_parse(
+            df=DataFrame({"geodetic": ["1, 2", "91, 2"]}),
+            geodetic="geodetic",
+            latitude="latitude",
+            longitude="longitude",
+        )
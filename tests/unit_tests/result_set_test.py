@@ -21,6 +21,7 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pytest
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -185,3 +186,37 @@ def test_get_column_description_from_empty_data_using_cursor_description(
     )
     assert any(col.get("column_name") == "__time" for col in result_set.columns)
     logger.exception.assert_not_called()
+
+
+def test_mixed_and_nested_columns() -> None:
+    """
+    Test that only the columns that can't be converted to Arrow are stringified.
+    """
+    data = [
+        (1, "a", [1, 2], 1),
+        (2, None, [3], "b"),
+    ]
+    description = [
+        ("int", "int", None, None, None, None, None),
+        ("str", "varchar", None, None, None, None, None),
+        ("array", "array", None, None, None, None, None),
+        ("mixed", "varchar", None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.table.to_pydict() == {
+        "int": [1, 2],
+        "str": ["a", None],
+        "array": ["[1, 2]", "[3]"],
+        "mixed": ["1", "b"],
+    }
+
+
+def test_rows_not_matching_description() -> None:
+    """
+    Test that rows must have one value per column in the cursor description.
+    """
+    description = [("a", "int", None, None, None, None, None)]
+
+    with pytest.raises(ValueError, match="All rows must have 1 values"):
+        SupersetResultSet([(1, 2)], description, BaseEngineSpec)  # type: ignore
@@ -18,6 +18,7 @@
 # pylint: disable=invalid-name, unused-argument, redefined-outer-name
 
 import json  # noqa: TID251
+from typing import Any
 
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
@@ -30,6 +31,7 @@ from superset.extensions import appbuilder
 from superset.models.slice import Slice
 from superset.security.manager import (
     query_context_modified,
+    RLSFilterClause,
     SupersetSecurityManager,
 )
 from superset.sql.parse import Table
@@ -1186,3 +1188,171 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_request_cache(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that RLS filters are only looked up once per request.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(sm, "get_user_roles", return_value=[Role(id=2), Role(id=1)])
+    filters = [RLSFilterClause(id=1, group_key=None, clause="a = 1")]
+    get_rls_filters_from_db = mocker.patch.object(
+        sm,
+        "_get_rls_filters_from_db",
+        return_value=filters,
+    )
+    table = mocker.MagicMock()
+    table.data = {"id": 42}
+
+    with app.test_request_context(), override_user(User(id=1)):
+        assert sm.get_rls_filters(table) == filters
+        assert sm.get_rls_filters(table) == filters
+        get_rls_filters_from_db.assert_called_once_with([1, 2], 42)
+
+        sm.invalidate_rls_filters_cache()
+        assert sm.get_rls_filters(table) == filters
+        assert get_rls_filters_from_db.call_count == 2
+
+    # other tests may leave a request context pushed
+    mocker.patch("superset.security.manager.has_request_context", return_value=False)
+    with override_user(User(id=1)):
+        sm.get_rls_filters(table)
+        sm.get_rls_filters(table)
+        assert get_rls_filters_from_db.call_count == 4
+
+
+def test_get_rls_filters_shared_cache(mocker: MockerFixture) -> None:
+    """
+    Test that RLS filters can be cached across requests.
+    """
+    from cachelib import SimpleCache
+    from flask import current_app
+
+    from superset.extensions import cache_manager
+
+    mocker.patch.dict(current_app.config, {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    mocker.patch.object(
+        type(cache_manager),
+        "cache",
+        new_callable=mocker.PropertyMock,
+        return_value=SimpleCache(),
+    )
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(sm, "get_user_roles", return_value=[Role(id=1)])
+    filters = [RLSFilterClause(id=1, group_key="g", clause="a = 1")]
+    get_rls_filters_from_db = mocker.patch.object(
+        sm,
+        "_get_rls_filters_from_db",
+        return_value=filters,
+    )
+    table = mocker.MagicMock()
+    table.data = {"id": 42}
+
+    with override_user(User(id=1)):
+        assert sm.get_rls_filters(table) == filters
+        assert sm.get_rls_filters(table) == filters
+        get_rls_filters_from_db.assert_called_once()
+
+        sm.invalidate_rls_filters_cache()
+        assert sm.get_rls_filters(table) == filters
+        assert get_rls_filters_from_db.call_count == 2
+
+
+def test_user_view_menu_names_request_cache(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that the permissions of a user are only looked up once per request.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(
+        sm,
+        "get_user_roles",
+        return_value=[Role(id=2, name="Gamma"), Role(id=1, name="Custom")],
+    )
+    get_role_permissions_from_db = mocker.patch.object(
+        sm,
+        "_get_role_permissions_from_db",
+        return_value={
+            "database_access": {"[db1].(id:1)"},
+            "can_read": {"Chart", "Dashboard"},
+        },
+    )
+
+    with app.test_request_context(), override_user(User(id=1)):
+        assert sm.user_view_menu_names("database_access") == {"[db1].(id:1)"}
+        assert sm.user_view_menu_names("schema_access") == set()
+        assert sm.can_access("can_read", "Chart")
+        assert not sm.can_access("can_write", "Chart")
+        get_role_permissions_from_db.assert_called_once_with([2, 1])
+
+        sm.invalidate_permissions_cache()
+        assert sm.can_access("can_read", "Dashboard")
+        assert get_role_permissions_from_db.call_count == 2
+
+    # other tests may leave a request context pushed
+    mocker.patch("superset.security.manager.has_request_context", return_value=False)
+    with override_user(User(id=1)):
+        sm.user_view_menu_names("database_access")
+        sm.user_view_menu_names("database_access")
+        assert get_role_permissions_from_db.call_count == 4
+
+
+def test_user_view_menu_names_shared_cache(mocker: MockerFixture) -> None:
+    """
+    Test that the permissions of a user can be cached across requests.
+    """
+    from cachelib import SimpleCache
+    from flask import current_app
+
+    from superset.extensions import cache_manager
+
+    mocker.patch.dict(current_app.config, {"PERMISSIONS_CACHE_TIMEOUT": 60})
+    mocker.patch.object(
+        type(cache_manager),
+        "cache",
+        new_callable=mocker.PropertyMock,
+        return_value=SimpleCache(),
+    )
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(
+        sm,
+        "get_user_roles",
+        return_value=[Role(id=1, name="Custom")],
+    )
+    get_role_permissions_from_db = mocker.patch.object(
+        sm,
+        "_get_role_permissions_from_db",
+        return_value={"datasource_access": {"[db1].[t1](id:1)"}},
+    )
+
+    with override_user(User(id=1)):
+        assert sm.user_view_menu_names("datasource_access") == {"[db1].[t1](id:1)"}
+        assert sm.user_view_menu_names("datasource_access") == {"[db1].[t1](id:1)"}
+        get_role_permissions_from_db.assert_called_once()
+
+        sm.invalidate_permissions_cache()
+        assert sm.user_view_menu_names("datasource_access") == {"[db1].[t1](id:1)"}
+        assert get_role_permissions_from_db.call_count == 2
+
+
+def test_can_access_builtin_roles(mocker: MockerFixture, app: Any) -> None:
+    """
+    Test that users with builtin roles don't use the cached permissions.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(
+        SupersetSecurityManager,
+        "builtin_roles",
+        new_callable=mocker.PropertyMock,
+        return_value={"Readonly": [[".*", "can_read"]]},
+    )
+    mocker.patch.object(
+        sm,
+        "get_user_roles",
+        return_value=[Role(id=1, name="Readonly")],
+    )
+    get_role_permissions = mocker.patch.object(sm, "_get_role_permissions")
+
+    with app.test_request_context(), override_user(User(id=1)):
+        assert sm.can_access("can_read", "Chart")
+        get_role_permissions.assert_not_called()
@@ -451,7 +451,8 @@ def test_store_results_in_backend_success(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -478,7 +479,8 @@ def test_store_results_in_backend_with_size_check(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -528,7 +530,8 @@ def test_store_results_in_backend_default_cache_timeout(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -557,7 +560,8 @@ def test_store_results_in_backend_write_failure(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"compressed"
+        "superset.sql.execution.celery_task.compress_results",
+        return_value=b"compressed",
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
 
@@ -569,6 +573,55 @@ def test_store_results_in_backend_write_failure(
     assert exc_info.value.error.error_type == SupersetErrorType.RESULTS_BACKEND_ERROR
 
 
+def test_store_results_in_backend_chunked(
+    mocker: MockerFixture,
+    app_context: None,
+    mock_query: MagicMock,
+    mock_database: MagicMock,
+) -> None:
+    """Test storing Arrow results as chunks next to a manifest."""
+    import pyarrow as pa
+    from cachelib import SimpleCache
+
+    from superset.sql.execution.celery_task import _store_results_in_backend
+    from superset.sqllab.chunked_results import read_chunks
+    from superset.sqllab.utils import write_ipc_buffer
+    from superset.utils.compression import decompress
+
+    cache = SimpleCache()
+    mocker.patch("superset.sql.execution.celery_task.results_backend", cache)
+    mocker.patch("superset.results_backend_use_msgpack", True)
+    mocker.patch.dict(current_app.config, {"SQLLAB_RESULTS_CHUNK_ROWS": 10})
+    mocker.patch("superset.sql.execution.celery_task.db.session")
+
+    data = write_ipc_buffer(pa.table({"a": list(range(25))})).to_pybytes()
+    payload = {
+        "status": "success",
+        "statements": [
+            {"original_sql": "SELECT", "data": data, "row_count": 25},
+            {"original_sql": "UPDATE", "data": None, "row_count": 3},
+        ],
+        "query": {},
+    }
+    _store_results_in_backend(mock_query, payload, mock_database)
+
+    key = mock_query.results_key
+    stored = msgpack.loads(decompress(cache.get(key)))
+    manifest = stored["statements"][0]["data_chunks"]
+    assert stored["statements"][0]["data"] is None
+    assert manifest == {
+        "key": f"{key}:0",
+        "row_count": 25,
+        "chunk_rows": 10,
+        "num_chunks": 3,
+    }
+    assert "data_chunks" not in stored["statements"][1]
+    assert read_chunks(cache, manifest, 20)["a"].to_pylist() == [20, 21, 22, 23, 24]
+
+    # the returned payload keeps the data
+    assert payload["statements"][0]["data"] == data
+
+
 # =============================================================================
 # Data Serialization Tests
 # =============================================================================
@@ -912,7 +965,7 @@ def test_execute_sql_task_with_results_backend(
     )
     mocker.patch("superset.results_backend_use_msgpack", False)
     mocker.patch(
-        "superset.sql.execution.celery_task.zlib_compress", return_value=b"data"
+        "superset.sql.execution.celery_task.compress_results", return_value=b"data"
     )
     mocker.patch("superset.sql.execution.celery_task.db.session")
     mocker.patch("superset.dataframe.df_to_records", return_value=[])
@@ -30,6 +30,7 @@ from superset.sql.parse import (
     KQLTokenType,
     KustoKQLStatement,
     LimitMethod,
+    ParseCache,
     process_jinja_sql,
     remove_quotes,
     RLSMethod,
@@ -3084,3 +3085,42 @@ def test_backtick_invalid_sql_still_fails() -> None:
     sql = "SELECT * FROM `table` WHERE"
     with pytest.raises(SupersetParseError):
         SQLScript(sql, "base")
+
+
+def test_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test that parsed scripts are cached, and that cached ASTs are not modified.
+    """
+    cache = ParseCache(max_size=10)
+    mocker.patch("superset.sql.parse.parse_cache", cache)
+    parse = mocker.spy(SQLStatement, "_parse_script")
+
+    first = SQLStatement("SELECT * FROM some_table", "postgresql")
+    first.set_limit_value(10)
+    second = SQLStatement("SELECT * FROM some_table", "postgresql")
+
+    assert parse.call_count == 1
+    assert first.format() == "SELECT\n  *\nFROM some_table\nLIMIT 10"
+    assert second.format() == "SELECT\n  *\nFROM some_table"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # the engine is part of the key
+    SQLStatement("SELECT * FROM some_table", "mysql")
+    assert parse.call_count == 2
+
+
+def test_parse_cache_eviction() -> None:
+    """
+    Test that the least recently used scripts are evicted.
+    """
+    cache = ParseCache(max_size=2)
+    for sql in ("SELECT 1", "SELECT 2", "SELECT 3"):
+        cache.set(sql, "base", [parse_one(sql)])
+
+    assert len(cache) == 2
+    assert cache.get("SELECT 1", "base") is None
+    assert cache.get("SELECT 3", "base") == [parse_one("SELECT 3")]
+
+    cache.configure(max_size=0)
+    assert len(cache) == 0
+    assert cache.get("SELECT 3", "base") is None
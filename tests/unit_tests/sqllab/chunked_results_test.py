@@ -0,0 +1,182 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pyarrow as pa
+import pytest
+from cachelib import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SerializationError
+from superset.sqllab.chunked_results import (
+    get_chunk_key,
+    read_chunks,
+    split_ipc_buffer,
+    write_chunks,
+)
+from superset.sqllab.utils import write_ipc_buffer
+from superset.utils.compression import MAGIC
+
+
+def get_ipc_buffer(num_rows: int) -> bytes:
+    table = pa.table(
+        {
+            "id": pa.array(range(num_rows), type=pa.int64()),
+            "name": pa.array([f"row {i}" for i in range(num_rows)]),
+        }
+    )
+    return write_ipc_buffer(table).to_pybytes()
+
+
+def test_split_ipc_buffer() -> None:
+    """
+    Test splitting an Arrow stream into chunks.
+    """
+    row_count, chunks = split_ipc_buffer(get_ipc_buffer(25), 10)
+    assert row_count == 25
+
+    tables = [pa.ipc.open_stream(pa.BufferReader(chunk)).read_all() for chunk in chunks]
+    assert [table.num_rows for table in tables] == [10, 10, 5]
+    assert pa.concat_tables(tables)["id"].to_pylist() == list(range(25))
+
+
+def test_split_ipc_buffer_empty() -> None:
+    """
+    Test that empty results keep their schema.
+    """
+    row_count, chunks = split_ipc_buffer(get_ipc_buffer(0), 10)
+    assert row_count == 0
+    assert len(chunks) == 1
+
+    table = pa.ipc.open_stream(pa.BufferReader(chunks[0])).read_all()
+    assert table.column_names == ["id", "name"]
+
+
+@pytest.mark.parametrize(
+    "offset, limit, expected",
+    [
+        (0, None, list(range(25))),
+        (0, 5, list(range(5))),
+        (8, 4, [8, 9, 10, 11]),
+        (20, 100, list(range(20, 25))),
+        (25, 10, []),
+        (100, None, []),
+    ],
+)
+def test_read_chunks(offset: int, limit: int | None, expected: list[int]) -> None:
+    """
+    Test reading a range of rows from chunked results.
+    """
+    cache = SimpleCache()
+    manifest = write_chunks(cache, "key", get_ipc_buffer(25), 10, 60)
+    assert manifest == {
+        "key": "key",
+        "row_count": 25,
+        "chunk_rows": 10,
+        "num_chunks": 3,
+    }
+
+    table = read_chunks(cache, manifest, offset, limit)
+    assert table.column_names == ["id", "name"]
+    assert table["id"].to_pylist() == expected
+
+
+def test_read_chunks_only_needed(mocker: MockerFixture) -> None:
+    """
+    Test that only the chunks covering the requested rows are read.
+    """
+    cache = SimpleCache()
+    manifest = write_chunks(cache, "key", get_ipc_buffer(25), 10, 60)
+    get = mocker.spy(cache, "get")
+
+    read_chunks(cache, manifest, 12, 5)
+    get.assert_called_once_with(get_chunk_key("key", 1))
+
+
+def test_write_chunks_failure(mocker: MockerFixture) -> None:
+    """
+    Test that no manifest is returned when a chunk can't be stored.
+    """
+    cache = mocker.MagicMock()
+    cache.set.side_effect = [True, False]
+
+    assert write_chunks(cache, "key", get_ipc_buffer(25), 10, 60) is None
+    assert cache.set.call_count == 2
+
+
+def test_read_chunks_missing() -> None:
+    """
+    Test reading chunks that expired.
+    """
+    cache = SimpleCache()
+    manifest = write_chunks(cache, "key", get_ipc_buffer(25), 10, 60)
+    cache.delete(get_chunk_key("key", 2))
+
+    assert read_chunks(cache, manifest, 0, 10).num_rows == 10
+    with pytest.raises(SerializationError, match="Chunk 2 of results key is missing"):
+        read_chunks(cache, manifest, 15, 10)
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [
+        b"corrupted",
+        MAGIC + bytes([2]) + b"corrupted",
+        MAGIC + bytes([42]) + b"corrupted",
+    ],
+)
+def test_read_chunks_corrupted(blob: bytes) -> None:
+    """
+    Test reading chunks that can't be decompressed.
+    """
+    cache = SimpleCache()
+    manifest = write_chunks(cache, "key", get_ipc_buffer(25), 10, 60)
+    cache.set(get_chunk_key("key", 1), blob)
+
+    with pytest.raises(SerializationError, match="Unable to deserialize chunk 1"):
+        read_chunks(cache, manifest, 0, 20)
+
+
+def test_deserialize_results_payload_chunked(mocker: MockerFixture) -> None:
+    """
+    Test deserializing a range of rows from a chunked SQL Lab payload.
+    """
+    import msgpack
+
+    from superset.views.utils import _deserialize_results_payload
+
+    cache = SimpleCache()
+    mocker.patch(
+        "superset.views.utils.results_backend_manager._results_backend",
+        cache,
+    )
+    manifest = write_chunks(cache, "key", get_ipc_buffer(25), 10, 60)
+    payload = msgpack.dumps(
+        {
+            "data": None,
+            "data_chunks": manifest,
+            "selected_columns": [{"name": "id"}, {"name": "name"}],
+        }
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec.expand_data.side_effect = lambda columns, data: (
+        columns,
+        data,
+        [],
+    )
+
+    result = _deserialize_results_payload(payload, query, True, offset=9, limit=2)
+    assert result["data"] == [{"id": 9, "name": "row 9"}, {"id": 10, "name": "row 10"}]
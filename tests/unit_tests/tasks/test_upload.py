@@ -0,0 +1,117 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import os
+import time
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+
+from superset.commands.database.exceptions import DatabaseUploadFailed
+
+
+@mock.patch("superset.tasks.upload.security_manager", new_callable=mock.MagicMock)
+@mock.patch("superset.tasks.upload.async_query_manager", new_callable=mock.MagicMock)
+@mock.patch("superset.tasks.upload.UploadCommand")
+def test_upload_file(
+    mock_command_cls, mock_async_query_manager, mock_security_manager, tmp_path
+):
+    """Test that the file is uploaded, progress is reported, and it's removed"""
+    from superset.commands.database.uploaders.csv_reader import CSVReader
+    from superset.tasks.upload import upload_file
+
+    file_path = tmp_path / "upload.csv"
+    file_path.write_text("a,b\n1,2\n")
+    job_metadata = {"user_id": 1}
+    options = {"type": "csv", "table_name": "table1", "schema": "public"}
+
+    def run() -> None:
+        on_progress = mock_command_cls.call_args.kwargs["on_progress"]
+        on_progress(1)
+
+    mock_async_query_manager.STATUS_RUNNING = "running"
+    mock_async_query_manager.STATUS_DONE = "done"
+    mock_command_cls.return_value.run.side_effect = run
+
+    upload_file(job_metadata, 1, str(file_path), "data.csv", options)
+
+    args = mock_command_cls.call_args.args
+    assert args[:2] == (1, "table1")
+    assert args[2].filename == "data.csv"
+    assert args[3] == "public"
+    assert isinstance(args[4], CSVReader)
+    assert mock_async_query_manager.update_job.call_args_list == [
+        mock.call(job_metadata, "running", rows_uploaded=1),
+        mock.call(job_metadata, "done"),
+    ]
+    assert not file_path.exists()
+
+
+@mock.patch("superset.tasks.upload.security_manager", new_callable=mock.MagicMock)
+@mock.patch("superset.tasks.upload.async_query_manager", new_callable=mock.MagicMock)
+@mock.patch("superset.tasks.upload.UploadCommand")
+def test_upload_file_with_error(
+    mock_command_cls, mock_async_query_manager, mock_security_manager, tmp_path
+):
+    """Test that the job is marked failed in event of error"""
+    from superset.tasks.upload import upload_file
+
+    file_path = tmp_path / "upload.csv"
+    file_path.write_text("a,b\n1,x\n")
+    job_metadata = {"user_id": 1}
+    options = {"type": "csv", "table_name": "table1"}
+
+    mock_async_query_manager.STATUS_ERROR = "error"
+    mock_command_cls.return_value.run.side_effect = DatabaseUploadFailed(
+        "Parsing error"
+    )
+
+    with pytest.raises(DatabaseUploadFailed):
+        upload_file(job_metadata, 1, str(file_path), "data.csv", options)
+
+    mock_async_query_manager.update_job.assert_called_once_with(
+        job_metadata, "error", errors=[{"message": "Parsing error"}]
+    )
+    assert not file_path.exists()
+
+
+def test_prune_uploads(tmp_path, app_context):
+    """Test that only stale files are removed from the staging folder"""
+    from flask import current_app
+
+    from superset.tasks.upload import prune_uploads
+
+    stale = tmp_path / "stale.csv"
+    stale.write_text("a,b\n")
+    os.utime(stale, (time.time() - 2 * 86400,) * 2)
+    recent = tmp_path / "recent.csv"
+    recent.write_text("a,b\n")
+
+    with mock.patch.dict(
+        current_app.config,
+        {
+            "UPLOAD_STAGING_FOLDER": str(tmp_path),
+            "UPLOAD_STAGING_MAX_AGE": timedelta(days=1),
+        },
+    ):
+        prune_uploads.run()
+        assert not stale.exists()
+        assert recent.exists()
+
+        # nothing was ever uploaded
+        current_app.config["UPLOAD_STAGING_FOLDER"] = str(tmp_path / "missing")
+        prune_uploads.run()
@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import zlib
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SupersetException
+from superset.utils.compression import (
+    CODECS,
+    compress,
+    compress_results,
+    decompress,
+    MAGIC,
+)
+
+DATA = b'{"data": [1, 2, 3], "columns": ["a", "b", "c"]}' * 100
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [name for name, codec in CODECS.items() if codec.is_available()],
+)
+def test_round_trip(codec: str) -> None:
+    """
+    Test compressing and decompressing with every available codec.
+    """
+    blob = compress(DATA, codec)
+    # zlib values are stored without header, so older versions can read them
+    assert blob.startswith(MAGIC) == (codec != "zlib")
+    assert decompress(blob) == DATA
+    assert decompress(compress(DATA.decode(), codec), decode=True) == DATA.decode()
+
+
+def test_zlib_without_header() -> None:
+    """
+    Test that zlib values are compatible with values written before codecs.
+    """
+    assert compress(DATA, "zlib") == zlib.compress(DATA)
+    assert decompress(zlib.compress(DATA)) == DATA
+    assert decompress(zlib.compress(DATA), decode=True) == DATA.decode()
+
+
+def test_decompress_with_other_codec() -> None:
+    """
+    Test that the codec is read from the header rather than from the config.
+    """
+    blob = compress(DATA, "zstd")
+    assert blob != compress(DATA, "zlib")
+    assert decompress(blob) == DATA
+
+
+def test_unknown_codec() -> None:
+    """
+    Test that unknown codecs are rejected.
+    """
+    with pytest.raises(SupersetException, match="Unknown compression codec: brotli"):
+        compress(DATA, "brotli")
+
+    with pytest.raises(SupersetException, match="Unknown compression codec ID: 42"):
+        decompress(MAGIC + bytes([42]) + DATA)
+
+
+def test_missing_codec_package(mocker: MockerFixture) -> None:
+    """
+    Test the error raised when the package of a codec is not installed.
+    """
+    mocker.patch("superset.utils.compression.lz4_installed", False)
+
+    with pytest.raises(SupersetException, match="requires the lz4 package"):
+        compress(DATA, "lz4")
+
+
+def test_compress_results(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that results backend payloads use the configured codec.
+    """
+    from flask import current_app
+
+    mocker.patch.dict(current_app.config, {"RESULTS_BACKEND_COMPRESSION": "none"})
+    assert compress_results(DATA) == MAGIC + bytes([0]) + DATA
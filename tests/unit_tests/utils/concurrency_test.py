@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+
+import pytest
+from flask import g
+from flask_appbuilder.security.sqla.models import Role, User
+from pytest_mock import MockerFixture
+
+from superset.extensions import security_manager
+from superset.security.guest_token import GuestUser
+from superset.utils.concurrency import get_semaphore, run_in_app_context
+
+
+def test_run_in_app_context_order() -> None:
+    """
+    Test that results are returned in order, regardless of completion order.
+    """
+
+    def make(value: int):
+        def func() -> tuple[int, str]:
+            time.sleep(0.01 * (3 - value))
+            return value, threading.current_thread().name
+
+        return func
+
+    results = run_in_app_context([make(i) for i in range(3)], max_workers=3)
+
+    assert [value for value, _ in results] == [0, 1, 2]
+    assert all(name != threading.current_thread().name for _, name in results)
+
+
+def test_run_in_app_context_sequential() -> None:
+    """
+    Test that callables run in the current thread with a single worker.
+    """
+    results = run_in_app_context(
+        [lambda: threading.current_thread().name] * 2,
+        max_workers=1,
+    )
+
+    assert results == [threading.current_thread().name] * 2
+
+
+def test_run_in_app_context_copies_g() -> None:
+    """
+    Test that the request data of ``flask.g`` is available in the worker threads.
+    """
+    g.form_data = {"viz_type": "table"}
+    g.permissions_cache = {}
+
+    assert (
+        run_in_app_context(
+            [lambda: (g.form_data, hasattr(g, "permissions_cache"))] * 2,
+            max_workers=2,
+        )
+        == [({"viz_type": "table"}, False)] * 2
+    )
+
+
+def test_run_in_app_context_user(mocker: MockerFixture) -> None:
+    """
+    Test that the current user is loaded again in the session of each worker thread.
+    """
+    get_user_by_id = mocker.patch.object(
+        security_manager,
+        "get_user_by_id",
+        side_effect=lambda user_id: User(id=user_id, username="alice"),
+    )
+    g.user = User(id=1, username="alice")
+
+    users = run_in_app_context([lambda: g.user] * 2, max_workers=2)
+    assert [user.id for user in users] == [1, 1]
+    assert all(user is not g.user for user in users)
+    assert get_user_by_id.call_count == 2
+
+
+def test_run_in_app_context_guest_user(mocker: MockerFixture) -> None:
+    """
+    Test that guest users are built again from their token in each worker thread.
+    """
+    role = Role(name="Gamma")
+    token = {"user": {"username": "guest"}, "resources": [], "rls_rules": []}
+    mocker.patch.object(security_manager, "find_role", return_value=role)
+    g.user = GuestUser(token=token, roles=[Role(name="Gamma")])
+
+    users = run_in_app_context([lambda: g.user] * 2, max_workers=2)
+    assert all(user is not g.user for user in users)
+    assert [user.username for user in users] == ["guest", "guest"]
+    assert [user.roles for user in users] == [[role], [role]]
+
+
+def test_run_in_app_context_exception() -> None:
+    """
+    Test that the exception of the first failing callable is raised.
+    """
+
+    def fail(message: str):
+        def func() -> None:
+            raise ValueError(message)
+
+        return func
+
+    with pytest.raises(ValueError, match="first"):
+        run_in_app_context(
+            [lambda: 1, fail("first"), fail("second")],
+            max_workers=3,
+        )
+
+
+def test_get_semaphore() -> None:
+    """
+    Test that the same semaphore is returned for a given key.
+    """
+    semaphore = get_semaphore(("test", 1), 2)
+
+    assert get_semaphore(("test", 1), 5) is semaphore
+    assert get_semaphore(("test", 2), 2) is not semaphore
@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import ssl
+from typing import Any
+
+from pytest_mock import MockerFixture
+from sqlalchemy.pool import QueuePool
+
+from superset.utils.engine_cache import EngineCache, freeze_engine_params
+
+
+def test_get_or_create(mocker: MockerFixture) -> None:
+    """
+    Test that engines are created once per key.
+    """
+    cache = EngineCache(max_size=10)
+    factory = mocker.MagicMock(side_effect=lambda: mocker.MagicMock())
+
+    engine = cache.get_or_create((1, "a"), factory)
+    assert cache.get_or_create((1, "a"), factory) is engine
+    assert cache.get_or_create((1, "b"), factory) is not engine
+    assert factory.call_count == 2
+    assert len(cache) == 2
+
+
+def test_lru_eviction(mocker: MockerFixture) -> None:
+    """
+    Test that the least recently used engine is evicted and disposed.
+    """
+    cache = EngineCache(max_size=2)
+
+    first = cache.get_or_create((1, "a"), mocker.MagicMock)
+    second = cache.get_or_create((1, "b"), mocker.MagicMock)
+    cache.get_or_create((1, "a"), mocker.MagicMock)
+    cache.get_or_create((1, "c"), mocker.MagicMock)
+
+    assert (1, "a") in cache
+    assert (1, "b") not in cache
+    second.dispose.assert_called_once_with()
+    first.dispose.assert_not_called()
+
+
+def test_invalidate(mocker: MockerFixture) -> None:
+    """
+    Test that invalidating a database only disposes of its engines.
+    """
+    cache = EngineCache(max_size=10)
+
+    first = cache.get_or_create((1, "a"), mocker.MagicMock)
+    second = cache.get_or_create((2, "a"), mocker.MagicMock)
+    cache.invalidate(1)
+
+    assert (1, "a") not in cache
+    assert (2, "a") in cache
+    first.dispose.assert_called_once_with()
+    second.dispose.assert_not_called()
+
+
+def test_fork(mocker: MockerFixture) -> None:
+    """
+    Test that engines inherited from a parent process are discarded.
+    """
+    getpid = mocker.patch("superset.utils.engine_cache.os.getpid", return_value=1)
+    cache = EngineCache(max_size=10)
+    engine = cache.get_or_create((1, "a"), mocker.MagicMock)
+
+    getpid.return_value = 2
+    assert cache.get_or_create((1, "a"), mocker.MagicMock) is not engine
+    engine.dispose.assert_called_once_with(close=False)
+
+
+def test_freeze_engine_params() -> None:
+    """
+    Test that equivalent engine params have the same frozen form.
+    """
+
+    def make_params() -> dict[str, Any]:
+        return {
+            "poolclass": QueuePool,
+            "pool_size": 5,
+            "connect_args": {
+                "ssl_context": ssl.create_default_context(),
+                "options": ["-c", "timezone=UTC"],
+            },
+        }
+
+    frozen = freeze_engine_params(make_params())
+    assert frozen == freeze_engine_params(make_params())
+    assert hash(frozen) == hash(freeze_engine_params(make_params()))
+    assert "0x" not in repr(frozen)
+    assert frozen != freeze_engine_params({**make_params(), "pool_size": 10})
@@ -21,7 +21,12 @@ import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
 from superset.utils.core import GenericDataType
-from superset.utils.excel import apply_column_types, df_to_excel
+from superset.utils.excel import (
+    apply_column_types,
+    df_to_excel,
+    format_excel_values,
+    quote_formulas,
+)
 
 
 def test_timezone_conversion() -> None:
@@ -129,3 +134,46 @@ def test_column_data_types_with_large_numeric_values():
         "1100108628127863",
         "18014398509481984",
     ]
+
+
+def test_quote_formulas_mixed_types() -> None:
+    """
+    Test that only strings are quoted in columns with mixed types.
+    """
+    df = pd.DataFrame({"mixed": ["-1", -1, None, b"=x", "@user", "ok"]})
+    assert quote_formulas(df)["mixed"].tolist() == [
+        "'-1",
+        -1,
+        None,
+        b"=x",
+        "'@user",
+        "ok",
+    ]
+
+
+def test_format_excel_values() -> None:
+    """
+    Test that values are prepared to be written cell by cell.
+    """
+    df = pd.DataFrame(
+        {
+            "formula": ["=1+1", None],
+            "number": [10**16, None],
+            "flag": [True, False],
+        }
+    )
+    assert format_excel_values(df).to_dict(orient="list") == {
+        "formula": ["'=1+1", None],
+        "number": ["1e+16", None],
+        "flag": [True, False],
+    }
+
+
+def test_format_excel_values_nullable() -> None:
+    """
+    Test that missing values of nullable dtypes are written as blank cells.
+    """
+    df = pd.DataFrame({"number": pd.array([1, None, 10**16], dtype="Int64")})
+    assert format_excel_values(df).to_dict(orient="list") == {
+        "number": [1, None, "10000000000000000"],
+    }
@@ -17,8 +17,10 @@
 import copy
 import math
 import uuid
+from collections.abc import Iterator
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from typing import Any
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -270,3 +272,117 @@ def test_format_timedelta():
         json.format_timedelta(timedelta(0) - timedelta(days=16, hours=4, minutes=3))
         == "-16 days, 4:03:00"
     )
+
+
+@pytest.fixture
+def orjson_engine() -> Iterator[None]:
+    pytest.importorskip("orjson")
+    json.set_engine("orjson")
+    yield
+    json.set_engine("simplejson")
+
+
+def test_set_engine() -> None:
+    assert json.get_engine() == "simplejson"
+    with pytest.raises(ValueError, match="Unknown JSON engine: ujson"):
+        json.set_engine("ujson")
+    assert json.get_engine() == "simplejson"
+
+
+@pytest.mark.parametrize(
+    "default",
+    [
+        json.json_iso_dttm_ser,
+        json.pessimistic_json_iso_dttm_ser,
+        json.json_int_dttm_ser,
+    ],
+)
+def test_orjson_dumps(orjson_engine: None, default: Any) -> None:
+    data = {
+        "datetime": datetime(2021, 1, 1, 1, 2, 3, 456),
+        "date": date(2021, 1, 1),
+        "timestamp": pd.Timestamp("2021-01-01 01:02:03"),
+        "time": time(1, 2),
+        "uuid": uuid.UUID("d2d74219-7233-4d89-9428-3ae85602b774"),
+        "decimal": Decimal("1.5"),
+        "int64": np.int64(1),
+        "bool": np.bool_(True),
+        "array": np.array([1.0, np.nan]),
+        "nan": float("nan"),
+        "set": {1},
+        "bytes": b"Hello World",
+        1: "int key",
+    }
+
+    json_str = json.dumps(data, default=default)
+    json.set_engine("simplejson")
+    expected = json.dumps(data, default=default)
+
+    assert json_str.startswith('{"datetime":')
+    assert json.loads(json_str) == json.loads(expected)
+
+
+@pytest.mark.parametrize(
+    "default",
+    [
+        json.json_iso_dttm_ser,
+        json.pessimistic_json_iso_dttm_ser,
+        json.json_int_dttm_ser,
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.array(["2020-01-01"], dtype="datetime64[ns]"),
+        np.array(["2020-01-01"], dtype="datetime64[D]"),
+        np.array([1], dtype="timedelta64[s]"),
+        np.datetime64("2020-01-01T00:00:00", "ns"),
+        np.float64(1.5),
+        np.float32(1.5),
+        np.int32(3),
+        np.array([1.1], dtype=np.float32),
+        np.array([[1, 2], [3, 4]]),
+        np.array([1, "a"], dtype=object),
+    ],
+)
+def test_orjson_dumps_numpy(orjson_engine: None, default: Any, value: Any) -> None:
+    """
+    Test that NumPy values are serialized the same way by both engines.
+    """
+    data = {"value": value}
+
+    json.set_engine("simplejson")
+    try:
+        expected = json.loads(json.dumps(data, default=default))
+    except TypeError:
+        json.set_engine("orjson")
+        with pytest.raises(TypeError):
+            json.dumps(data, default=default)
+        return
+
+    json.set_engine("orjson")
+    assert json.loads(json.dumps(data, default=default)) == expected
+
+
+def test_orjson_dumps_options(orjson_engine: None) -> None:
+    data = {"b": 1, "a": [1, 2]}
+    assert json.dumps(data, sort_keys=True) == '{"a":[1,2],"b":1}'
+    assert json.dumps(data, indent=2) == '{\n  "b": 1,\n  "a": [\n    1,\n    2\n  ]\n}'
+
+    # options orjson doesn't support are handled by simplejson
+    assert json.dumps(data, separators=(", ", ": ")) == '{"b": 1, "a": [1, 2]}'
+    assert json.dumps({"nan": float("nan")}, ignore_nan=False, allow_nan=True) == (
+        '{"nan": NaN}'
+    )
+
+
+def test_orjson_fallback(orjson_engine: None) -> None:
+    assert json.dumps({"big": 2**70}) == '{"big": 1180591620717411303424}'
+    assert json.loads('{"big": 1180591620717411303424}') == {"big": 2**70}
+
+    with pytest.raises(TypeError):
+        json.dumps({"dttm": datetime(2021, 1, 1)}, default=None)
+    with pytest.raises(TypeError, match="Unserializable object"):
+        json.dumps({"object": object()})
+    with pytest.raises(json.JSONDecodeError, match="Expecting value"):
+        json.loads('{"float": NaN}')
@@ -16,7 +16,13 @@
 # under the License.
 
 
-from superset.utils.log import get_logger_from_status
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.exc import SQLAlchemyError
+
+from superset.utils.log import AsyncDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +41,56 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+@pytest.fixture
+def engine(mocker: MockerFixture) -> MagicMock:
+    engine = MagicMock()
+    mocker.patch("superset.db").engine = engine
+    # don't start the background thread, events are written by `flush`
+    mocker.patch.object(AsyncDBEventLogger, "_run")
+    return engine
+
+
+def test_async_db_event_logger(engine: MagicMock) -> None:
+    event_logger = AsyncDBEventLogger(batch_size=2)
+    event_logger.log(
+        user_id=1,
+        action="test",
+        dashboard_id=None,
+        duration_ms=10,
+        slice_id=None,
+        referrer=None,
+        records=[{"slice_id": 1}, {"slice_id": 2}, {"slice_id": 3}],
+    )
+    engine.begin.assert_not_called()
+
+    event_logger.flush()
+    execute = engine.begin.return_value.__enter__.return_value.execute
+    assert [len(call.args[1]) for call in execute.call_args_list] == [2, 1]
+    rows = execute.call_args_list[0].args[1]
+    assert rows[0]["action"] == "test"
+    assert rows[0]["slice_id"] == 1
+    assert rows[0]["json"] == '{"slice_id": 1}'
+    assert rows[0]["dttm"] is not None
+    assert event_logger.dropped == 0
+
+
+def test_async_db_event_logger_overflow(engine: MagicMock) -> None:
+    event_logger = AsyncDBEventLogger(max_queue_size=2)
+    event_logger.log(1, "test", None, None, None, None, records=[{}, {}, {}])
+    assert event_logger.dropped == 1
+
+    engine.begin.side_effect = SQLAlchemyError()
+    event_logger.flush()
+    assert event_logger.dropped == 3
+
+
+def test_async_db_event_logger_get_batch() -> None:
+    event_logger = AsyncDBEventLogger(flush_interval=0.01, batch_size=2)
+    assert event_logger._get_batch() == []
+
+    for i in range(3):
+        event_logger._queue.put({"id": i})
+    assert event_logger._get_batch() == [{"id": 0}, {"id": 1}]
+    assert event_logger._get_batch() == [{"id": 2}]
@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from superset.utils.lru import LRUCache
+
+
+def test_get_set() -> None:
+    """
+    Test getting and setting values.
+    """
+    cache: LRUCache[tuple[str, str], str] = LRUCache(10)
+
+    assert cache.get(("sqlite", "SELECT a")) is None
+    cache.set(("sqlite", "SELECT a"), "SELECT a")
+    assert cache.get(("sqlite", "SELECT a")) == "SELECT a"
+    assert cache.get(("postgresql", "SELECT a")) is None
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.get(("sqlite", "SELECT a")) is None
+
+
+def test_lru_eviction() -> None:
+    """
+    Test that the least recently used value is evicted.
+    """
+    cache: LRUCache[str, str] = LRUCache(2)
+
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_on_evict() -> None:
+    """
+    Test that evicted values are passed to `on_evict`, but not removed ones.
+    """
+    evicted: list[str] = []
+    cache: LRUCache[str, str] = LRUCache(2, on_evict=evicted.append)
+
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    assert evicted == ["A"]
+    assert cache.items() == [("b", "B"), ("c", "C")]
+
+    assert cache.pop("b") == "B"
+    assert cache.pop("b") is None
+    assert "b" not in cache
+
+    cache.configure(0)
+    assert evicted == ["A", "C"]
+
+
+def test_configure() -> None:
+    """
+    Test that caches are disabled until configured with a size.
+    """
+    cache: LRUCache[str, str] = LRUCache()
+    assert not cache.is_enabled()
+    cache.set("a", "A")
+    assert cache.get("a") is None
+
+    cache.configure(2)
+    assert cache.is_enabled()
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    assert len(cache) == 2
+
+    # values that don't fit anymore are evicted
+    cache.configure(1)
+    assert len(cache) == 1
+    assert cache.get("c") == "C"
+
+    cache.configure(0)
+    assert len(cache) == 0
+
+
+def test_caches_configured(app_context: None) -> None:
+    """
+    Test that the process-wide caches are sized when the app is initialized.
+    """
+    from flask import current_app
+
+    from superset.jinja_context import CachedSandboxedEnvironment
+    from superset.sql.parse import parse_cache
+    from superset.utils.engine_cache import engine_cache
+    from superset.utils.partition_cache import partition_cache
+    from superset.utils.query_plan_cache import query_plan_cache
+
+    config = current_app.config
+    assert parse_cache.max_size == config["SQL_PARSE_CACHE_SIZE"]
+    assert query_plan_cache.max_size == config["QUERY_PLAN_CACHE_SIZE"]
+    assert (
+        CachedSandboxedEnvironment.code_cache.max_size
+        == config["JINJA_TEMPLATE_CACHE_SIZE"]
+    )
+    assert partition_cache._entries.max_size == config["LATEST_PARTITION_CACHE_SIZE"]
+    assert engine_cache._engines.max_size == config["DB_ENGINE_CACHE_SIZE"]
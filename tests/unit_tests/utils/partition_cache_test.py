@@ -0,0 +1,185 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from unittest import mock
+
+import pytest
+from flask import current_app, g
+from pytest_mock import MockerFixture
+
+from superset.sql.parse import Table
+from superset.utils.partition_cache import PartitionCache
+
+
+def make_database(id_: int | None = 1, impersonate_user: bool = False) -> mock.Mock:
+    return mock.Mock(id=id_, impersonate_user=impersonate_user)
+
+
+def test_get_or_load(mocker: MockerFixture) -> None:
+    """
+    Test that lookups are cached until they expire.
+    """
+    mocker.patch.dict(current_app.config, {"LATEST_PARTITION_CACHE_TIMEOUT": 60})
+    monotonic = mocker.patch("superset.utils.partition_cache.time.monotonic")
+    monotonic.return_value = 1000
+    cache = PartitionCache(max_size=10)
+    database = make_database()
+    key = cache.get_key(database, Table("t", "s"), "latest_partition", True)
+    load = mock.Mock(side_effect=["2024-01-01", "2024-01-02"])
+
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    monotonic.return_value = 1059
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    load.assert_called_once_with(database)
+
+    monotonic.return_value = 1060
+    assert cache.get_or_load(key, database, load) == "2024-01-02"
+    assert load.call_count == 2
+
+
+def test_get_or_load_errors(mocker: MockerFixture) -> None:
+    """
+    Test that failed lookups are not cached.
+    """
+    mocker.patch.dict(current_app.config, {"LATEST_PARTITION_CACHE_TIMEOUT": 60})
+    cache = PartitionCache(max_size=10)
+    database = make_database()
+    key = cache.get_key(database, Table("t"), "latest_partition", True)
+    load = mock.Mock(side_effect=[Exception("not partitioned"), "2024-01-01"])
+
+    with pytest.raises(Exception, match="not partitioned"):
+        cache.get_or_load(key, database, load)
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    assert len(cache) == 1
+
+
+def test_get_key(mocker: MockerFixture) -> None:
+    """
+    Test that lookups are cached per user when impersonating them, and that lookups
+    against unsaved databases are not cached.
+    """
+    mocker.patch("superset.utils.partition_cache.get_username", return_value="alice")
+    table = Table("t", "s", "c")
+
+    assert PartitionCache.get_key(make_database(), table, "latest_partition") == (
+        1,
+        None,
+        table,
+        "latest_partition",
+    )
+    assert PartitionCache.get_key(
+        make_database(impersonate_user=True),
+        table,
+        "latest_sub_partition",
+        ("ds", "2024-01-01"),
+    ) == (1, "alice", table, "latest_sub_partition", ("ds", "2024-01-01"))
+    assert (
+        PartitionCache.get_key(make_database(None), table, "latest_partition") is None
+    )
+
+
+def test_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that the cache can be disabled.
+    """
+    mocker.patch.dict(current_app.config, {"LATEST_PARTITION_CACHE_TIMEOUT": 0})
+    cache = PartitionCache(max_size=10)
+    database = make_database()
+    key = cache.get_key(database, Table("t"), "latest_partition")
+    load = mock.Mock(return_value="2024-01-01")
+
+    cache.get_or_load(key, database, load)
+    cache.get_or_load(key, database, load)
+    assert load.call_count == 2
+    assert len(cache) == 0
+
+
+def test_coalesced(mocker: MockerFixture) -> None:
+    """
+    Test that concurrent lookups for the same table only query the database once.
+    """
+    mocker.patch.dict(current_app.config, {"LATEST_PARTITION_CACHE_TIMEOUT": 60})
+    app = current_app._get_current_object()
+    cache = PartitionCache(max_size=10)
+    database = make_database()
+    key = cache.get_key(database, Table("t"), "latest_partition")
+    started, release = threading.Event(), threading.Event()
+
+    def load(database: mock.Mock) -> str:
+        started.set()
+        release.wait(5)
+        return "2024-01-01"
+
+    results: list[str] = []
+
+    def lookup() -> None:
+        with app.app_context():
+            results.append(cache.get_or_load(key, database, spy))
+
+    spy = mock.Mock(side_effect=load)
+    first = threading.Thread(target=lookup)
+    first.start()
+    started.wait(5)
+    second = threading.Thread(target=lookup)
+    second.start()
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert results == ["2024-01-01", "2024-01-01"]
+    spy.assert_called_once()
+
+
+def test_refresh(mocker: MockerFixture) -> None:
+    """
+    Test that entries older than half the timeout are refreshed in the background.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "LATEST_PARTITION_CACHE_TIMEOUT": 60,
+            "LATEST_PARTITION_CACHE_REFRESH": True,
+        },
+    )
+    monotonic = mocker.patch("superset.utils.partition_cache.time.monotonic")
+    monotonic.return_value = 1000
+    session = mocker.patch("superset.utils.partition_cache.db.session")
+    refreshed = make_database()
+    session.get.return_value = refreshed
+    thread = mocker.patch("superset.utils.partition_cache.threading.Thread")
+    g.user = mock.Mock(username="alice")
+
+    cache = PartitionCache(max_size=10)
+    database = make_database()
+    key = cache.get_key(database, Table("t"), "latest_partition")
+    load = mock.Mock(side_effect=["2024-01-01", "2024-01-02"])
+
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    monotonic.return_value = 1029
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    thread.assert_not_called()
+
+    # the stale value is returned while it's refreshed
+    monotonic.return_value = 1030
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    assert cache.get_or_load(key, database, load) == "2024-01-01"
+    thread.assert_called_once()
+
+    thread.call_args.kwargs["target"]()
+    session.get.assert_called_once_with(type(database), 1)
+    load.assert_called_with(refreshed)
+    assert cache.get_or_load(key, database, load) == "2024-01-02"
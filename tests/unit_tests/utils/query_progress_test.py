@@ -0,0 +1,149 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from itertools import islice
+from typing import Any
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.common.db_query_status import QueryStatus
+from superset.constants import QUERY_EARLY_CANCEL_KEY
+from superset.utils.query_progress import get_poll_intervals, QueryProgressTracker
+
+
+@pytest.mark.parametrize(
+    "initial,expected",
+    [
+        (1, [1, 2, 4, 5, 5]),
+        (0.5, [0.5, 1, 2, 4, 5]),
+        (10, [10, 10, 10, 10, 10]),
+        (0, [0, 0, 0, 0, 0]),
+    ],
+)
+def test_get_poll_intervals(
+    mocker: MockerFixture,
+    initial: float,
+    expected: list[float],
+) -> None:
+    """
+    Test that the poll interval doubles up to the maximum.
+    """
+    mocker.patch.dict(current_app.config, {"QUERY_PROGRESS_MAX_POLL_INTERVAL": 5})
+    assert list(islice(get_poll_intervals(initial), 5)) == expected
+
+
+@pytest.fixture
+def query(session: Session, mocker: MockerFixture) -> Any:
+    from superset import db
+    from superset.models.core import Database
+    from superset.models.sql_lab import Query
+
+    engine = db.session.get_bind()
+    Query.metadata.create_all(engine)  # pylint: disable=no-member
+    mocker.patch("superset.utils.query_progress.db", mocker.MagicMock(engine=engine))
+
+    query = Query(
+        client_id="foo",
+        database=Database(database_name="my_database", sqlalchemy_uri="sqlite://"),
+        sql="select * from bar",
+        status=QueryStatus.RUNNING,
+        progress=0,
+    )
+    db.session.add(query)
+    db.session.commit()
+    return query
+
+
+def execute(sql: str, **params: Any) -> Any:
+    """
+    Run SQL outside of the session, like another process would.
+    """
+    from superset import db
+
+    with db.session.get_bind().begin() as connection:
+        result = connection.execute(sql, params)
+        return result.all() if result.returns_rows else None
+
+
+def get_row(query: Any) -> tuple[Any, ...]:
+    return tuple(
+        execute("SELECT status, progress FROM query WHERE id = :id", id=query.id)[0]
+    )
+
+
+def test_progress_tracker(mocker: MockerFixture, query: Any) -> None:
+    """
+    Test that progress is written and status read at most once per sync interval.
+    """
+    mocker.patch.dict(current_app.config, {"QUERY_PROGRESS_SYNC_INTERVAL": 1})
+    monotonic = mocker.patch("superset.utils.query_progress.time.monotonic")
+    monotonic.return_value = 1000
+    tracker = QueryProgressTracker()
+
+    with tracker.track(query):
+        tracker.update(query, 10)
+        assert not tracker.is_stopped(query)
+        assert get_row(query) == (QueryStatus.RUNNING, 10)
+
+        # the query is stopped from another process
+        tracker.update(query, 20)
+        execute("UPDATE query SET status = 'stopped'")
+        monotonic.return_value = 1000.5
+        assert not tracker.is_stopped(query)
+        assert get_row(query) == (QueryStatus.STOPPED, 10)
+
+        monotonic.return_value = 1001
+        assert tracker.is_stopped(query)
+        assert get_row(query) == (QueryStatus.STOPPED, 20)
+
+        # pending progress is written when the query stops being tracked
+        tracker.update(query, 30)
+
+    assert get_row(query) == (QueryStatus.STOPPED, 30)
+    assert query.progress == 30
+
+    # progress never decreases, eg, once the query completed
+    execute("UPDATE query SET progress = 100")
+    with tracker.track(query):
+        tracker.update(query, 40)
+    assert get_row(query) == (QueryStatus.STOPPED, 100)
+
+
+def test_progress_tracker_early_cancel(mocker: MockerFixture, query: Any) -> None:
+    """
+    Test that queries canceled before they started are detected.
+    """
+    from superset import db
+
+    tracker = QueryProgressTracker()
+    with tracker.track(query):
+        assert not tracker.is_stopped(query)
+        query.set_extra_json_key(QUERY_EARLY_CANCEL_KEY, True)
+        assert tracker.is_stopped(query)
+
+    # canceled from another process
+    db.session.rollback()
+    db.session.refresh(query)
+    execute(
+        "UPDATE query SET extra_json = :extra_json",
+        extra_json=f'{{"{QUERY_EARLY_CANCEL_KEY}": true}}',
+    )
+    mocker.patch("superset.utils.query_progress.time.monotonic", return_value=1e9)
+    with tracker.track(query):
+        assert tracker.is_stopped(query)